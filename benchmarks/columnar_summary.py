@@ -0,0 +1,83 @@
+"""Summary queries over a bulk run: ``ResultStore`` against loops over Results.
+
+Fills a store and a plain list with the same ``-n`` results (500 sites, one
+target per 500 rows) and times the questions a post-scan report asks —
+status totals, handles found on 20+ sites, error rate per module — once as
+the Python loops a list of ``Result`` objects needs and once through the
+store's column passes.
+
+    python benchmarks/columnar_summary.py            # 1,000,000 rows
+    python benchmarks/columnar_summary.py -n 5000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from user_scanner.core.columnar import ResultStore  # noqa: E402
+from user_scanner.core.result import Result, Status  # noqa: E402
+
+STATUSES = (Status.TAKEN, Status.AVAILABLE, Status.AVAILABLE, Status.AVAILABLE, Status.ERROR)
+
+
+def build(count: int):
+    rng = random.Random(0)
+    sites = [f"Site{i}" for i in range(500)]
+    results = []
+    for i in range(count):
+        result = Result(rng.choice(STATUSES)).update(
+            site_name=sites[i % 500], username=f"user{i // 500}", category="Social"
+        )
+        result.elapsed = rng.random()
+        results.append(result)
+    return results, ResultStore.from_results(results)
+
+
+def loop_status_counts(results):
+    return Counter(r.status for r in results)
+
+
+def loop_targets_found_on(results, min_sites=20):
+    found = Counter(r.username for r in results if r.status == Status.TAKEN)
+    return [(t, n) for t, n in found.most_common() if n >= min_sites]
+
+
+def loop_error_rate(results):
+    ran, errors = Counter(), Counter()
+    for r in results:
+        if r.status != Status.SKIPPED:
+            ran[r.site_name] += 1
+            if r.status == Status.ERROR:
+                errors[r.site_name] += 1
+    return {site: errors[site] / n for site, n in ran.items()}
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000, help="Rows (default: 1,000,000)")
+    args = parser.parse_args()
+
+    results, store = build(args.rows)
+    print(f"{args.rows:,} rows\n")
+    print(f"  {'query':<20} {'Result loop':>12} {'ResultStore':>12}")
+    for name, loop, column in (
+        ("status totals", lambda: loop_status_counts(results), store.status_counts),
+        ("found on 20+ sites", lambda: loop_targets_found_on(results), lambda: store.targets_found_on(20)),
+        ("error rate per site", lambda: loop_error_rate(results), store.error_rate),
+    ):
+        print(f"  {name:<20} {timed(loop):>10.1f}ms {timed(column):>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
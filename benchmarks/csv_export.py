@@ -0,0 +1,116 @@
+"""CSV export throughput: rows/sec of ``formatter.write_csv`` against the old path.
+
+The old path built a ``StringIO`` and ``csv.DictWriter`` for every row inside
+``Result.to_csv`` and joined the rows into one string before anything reached
+the file; it is reproduced here verbatim so the comparison survives changes to
+``Result``. Both paths write the same rows to a temporary file.
+
+Results are drawn in a cycle from a pool of distinct ones, mixing bare
+verdicts with rows carrying extra/media metadata and errors, so building the
+input does not dominate the run or its memory.
+
+    python benchmarks/csv_export.py                # 1,000,000 rows
+    python benchmarks/csv_export.py -n 200000 -r 5
+"""
+
+import argparse
+import csv
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from user_scanner.core import formatter  # noqa: E402
+from user_scanner.core.result import CSV_FIELDS, Result, _neutralize_csv_cell  # noqa: E402
+
+
+def legacy_to_csv(result: Result) -> str:
+    def flatten_dict(d):
+        out = ""
+        for key, value in d.items():
+            out += f"{key}: {value}; "
+        return out.rstrip("; ")
+
+    data = result.as_dict()
+    data["extra"] = flatten_dict(data["extra"]) if data.get("extra") else ""
+    data["media"] = flatten_dict(data["media"]) if data.get("media") else ""
+    del data["is_email"]
+    data = {k: _neutralize_csv_cell(v) for k, v in data.items()}
+
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, lineterminator="")
+    writer.writerow(data)
+    return output.getvalue()
+
+
+def legacy_export(results, path: str) -> None:
+    content = formatter.CSV_HEADER + "\n" + "\n".join(legacy_to_csv(r) for r in results)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(content)
+
+
+def streaming_export(results, path: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        formatter.write_csv(results, f)
+
+
+def make_pool(size: int = 1000) -> List[Result]:
+    pool = []
+    for i in range(size):
+        common = {"username": f"user{i}", "site_name": f"Site{i % 150}", "category": "Social"}
+        kind = i % 10
+        if kind < 6:
+            pool.append(Result.available(**common))
+        elif kind < 9:
+            pool.append(
+                Result.taken(
+                    url=f"https://site{i % 150}.example/user{i}",
+                    extra={"name": f"User {i}", "followers": i, "bio": "line one\nline two"},
+                    media={"avatar": f"https://cdn.example/{i}.png"},
+                    **common,
+                )
+            )
+        else:
+            pool.append(Result.error(ConnectionError("Connection timed out"), **common))
+    return pool
+
+
+def measure(export: Callable, rows: int, pool: List[Result], runs: int) -> float:
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.csv")
+        for _ in range(runs):
+            if os.path.exists(path):
+                os.remove(path)
+            started = time.perf_counter()
+            export(islice(cycle(pool), rows), path)
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000, help="Rows to export (default: 1,000,000)")
+    parser.add_argument("-r", "--runs", type=int, default=3, help="Runs per path; the median is reported")
+    args = parser.parse_args()
+
+    pool = make_pool()
+    print(f"Exporting {args.rows:,} rows, median of {args.runs} runs\n")
+    baseline = None
+    for name, export in (("to_csv per row", legacy_export), ("write_csv", streaming_export)):
+        elapsed = measure(export, args.rows, pool, args.runs)
+        rate = args.rows / elapsed
+        speedup = "" if baseline is None else f"  ({baseline / elapsed:.2f}x)"
+        baseline = baseline or elapsed
+        print(f"  {name:<16} {elapsed:8.2f}s  {rate:>12,.0f} rows/s{speedup}")
+
+
+if __name__ == "__main__":
+    main()
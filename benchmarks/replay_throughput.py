@@ -0,0 +1,132 @@
+"""Scan throughput against recorded HTTP fixtures instead of live sites.
+
+``record`` runs the real username and email scans once with every exchange
+saved to a fixture directory (``core.replay.RecordingTransport``). ``run``
+then replays that directory through the full ``run_user_full`` and
+``run_email_full_batch`` pipelines — every module, the orchestrators,
+concurrency control, the response hooks — once per ``-C`` value, and reports
+modules/sec, p50/p99 check time and peak traced memory.
+
+Latency comes from ``--latency`` (see ``replay.Latency``): the recorded
+timings by default, or a synthetic distribution so runs on different machines
+compare. Requests the fixtures do not cover fail with a connection error, or
+get ``--fallback-status`` — which also lets ``run`` work with no fixtures at
+all, every request answered 404.
+
+    python benchmarks/replay_throughput.py record -u someuser -e someone@example.com
+    python benchmarks/replay_throughput.py run -C 10,25,50,100
+    python benchmarks/replay_throughput.py run --latency lognormal:0.3,0.6 --fallback-status 404
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from user_scanner.core import email_orchestrator, orchestrator, replay  # noqa: E402
+from user_scanner.core.helpers import ScanConfig  # noqa: E402
+from user_scanner.core.sinks import add_sink, remove_sink  # noqa: E402
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent / "fixtures" / "replay"
+
+
+class Timings:
+    """Sink keeping each result's check time."""
+
+    def __init__(self):
+        self.elapsed: List[float] = []
+
+    def write(self, result) -> None:
+        if result.elapsed is not None:
+            self.elapsed.append(result.elapsed)
+
+    def quantile(self, q: float) -> float:
+        if not self.elapsed:
+            return 0.0
+        ordered = sorted(self.elapsed)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def scans(args) -> List[tuple]:
+    configs = ScanConfig(allow_loud=args.allow_loud, no_nsfw=args.no_nsfw)
+    chosen = []
+    if args.username:
+        chosen.append(("user", orchestrator, lambda: orchestrator.run_user_full(args.username, configs)))
+    if args.email:
+        chosen.append(("email", email_orchestrator, lambda: email_orchestrator.run_email_full_batch(args.email, configs)))
+    return chosen
+
+
+def quietly(scan: Callable[[], list]) -> list:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scan()
+
+
+def record(args) -> None:
+    with replay.recording(args.fixtures) as recorder:
+        for name, _, scan in scans(args):
+            started = time.perf_counter()
+            results = quietly(scan)
+            print(f"{name:<6} {len(results)} checks recorded in {time.perf_counter() - started:.1f}s")
+    print(f"{recorder.recorded} exchanges saved under {args.fixtures}")
+
+
+def run(args) -> None:
+    print(f"{'scan':<6} {'-C':>5} {'checks':>7} {'wall':>8} {'mod/s':>8} {'p50':>7} {'p99':>7} {'peak MB':>8}")
+    with replay.replaying(args.fixtures, args.latency, args.fallback_status) as transport:
+        for name, module, scan in scans(args):
+            for concurrency in args.concurrency:
+                module.set_concurrency(concurrency)
+                if args.fixed:
+                    module.set_adaptive(False)
+                timings = Timings()
+                add_sink(timings)
+                tracemalloc.start()
+                started = time.perf_counter()
+                try:
+                    results = quietly(scan)
+                finally:
+                    wall = time.perf_counter() - started
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    remove_sink(timings)
+                print(
+                    f"{name:<6} {concurrency:>5} {len(results):>7} {wall:>7.2f}s {len(results) / wall:>8.1f} "
+                    f"{timings.quantile(0.5):>6.3f}s {timings.quantile(0.99):>6.3f}s {peak / 2**20:>8.1f}"
+                )
+    print(f"fixtures: {transport.hits} hits, {transport.misses} misses")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=("record", "run"))
+    parser.add_argument("-u", "--username", default="johndoe")
+    parser.add_argument("-e", "--email", default="johndoe@gmail.com")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument(
+        "-C", "--concurrency", default="10,25,50",
+        type=lambda value: [int(v) for v in value.split(",")],
+        help="comma-separated concurrency ceilings to run at",
+    )
+    parser.add_argument("--latency", default="recorded", help="replay latency spec (default: recorded)")
+    parser.add_argument("--fallback-status", type=int, help="status for requests with no fixture")
+    parser.add_argument("--fixed", action="store_true", help="hold concurrency at -C (no adaptive control)")
+    parser.add_argument("--allow-loud", action="store_true")
+    parser.add_argument("--no-nsfw", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        replay.Latency(args.latency)
+    except ValueError as e:
+        parser.error(str(e))
+    (record if args.mode == "record" else run)(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Memory and construction cost of holding a bulk run's Results.
+
+Builds ``-n`` results the way the orchestrators do — a module returns a bare
+verdict and ``_run_module`` stamps site, target and category onto it with
+``update()`` — and reports bytes per result (tracemalloc, after the objects
+are built and kept alive) and construction rate. One result in ``--found``
+carries extra/media metadata, as found accounts do.
+
+``LegacyResult`` is the pre-``__slots__`` class, reduced to its constructor
+and ``update()``, which is all the measurement touches.
+
+    python benchmarks/result_memory.py              # 1,000,000 results
+    python benchmarks/result_memory.py -n 5000000 --found 10
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from user_scanner.core.result import Result, Status  # noqa: E402
+
+
+class LegacyResult:
+    def __init__(self, status, reason=None, **kwargs):
+        self.status = status
+        self.reason = reason
+        self.username = None
+        self.site_name = None
+        self.category = None
+        self.url = ""
+        self.extra = {}
+        self.media = {}
+        self.is_email = False
+        self.elapsed = None
+        self.from_cache = False
+        self.update(**kwargs)
+
+    def update(self, **kwargs):
+        for field in ("username", "site_name", "category", "is_email", "url"):
+            if field in kwargs and kwargs[field] is not None:
+                setattr(self, field, kwargs[field])
+
+        if "extra" in kwargs and isinstance(kwargs["extra"], dict):
+            for key, value in kwargs["extra"].items():
+                if value is None or (isinstance(value, str) and not value.strip()):
+                    continue
+                clean_key = key.strip().rstrip(":").strip().replace(" ", "_").lower()
+                if not clean_key:
+                    continue
+                if not isinstance(value, (bool, int)):
+                    value = str(value)
+                self.extra[clean_key] = value
+
+        if "media" in kwargs and isinstance(kwargs["media"], dict):
+            for key, value in kwargs["media"].items():
+                if value is None or not str(value).strip():
+                    continue
+                self.media[key.strip().lower()] = str(value).strip()
+
+        return self
+
+
+SITES = [f"site{i}" for i in range(500)]
+CATEGORIES = ["Social", "Dev", "Gaming", "Creator", "Community"]
+
+
+def build(cls, count: int, found_every: int) -> list:
+    results = []
+    append = results.append
+    for i in range(count):
+        site = SITES[i % len(SITES)]
+        target = f"user{i // len(SITES)}"
+        if found_every and i % found_every == 0:
+            result = cls(
+                Status.TAKEN,
+                url=f"https://{site}.example/{target}",
+                extra={"Name:": "Some One", "Followers": 42},
+                media={"Avatar": f"https://cdn.example/{i}.png"},
+            )
+        else:
+            result = cls(Status.AVAILABLE)
+        # The orchestrator capitalises the module's name for every result.
+        append(result.update(site_name=site.capitalize(), username=target, category=CATEGORIES[i % 5]))
+    return results
+
+
+def measure(cls, count: int, found_every: int):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    results = build(cls, count, found_every)
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / count, count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--count", type=int, default=1_000_000, help="Results to build (default: 1,000,000)")
+    parser.add_argument(
+        "--found", type=int, default=20, metavar="N", help="One result in N is found, with metadata (default: 20)"
+    )
+    args = parser.parse_args()
+
+    print(f"Holding {args.count:,} results, 1 in {args.found} found (time measured under tracemalloc)\n")
+    baseline = None
+    for name, cls in (("legacy", LegacyResult), ("Result", Result)):
+        per_result, rate = measure(cls, args.count, args.found)
+        total = per_result * args.count / 2**20
+        ratio = "" if baseline is None else f"  ({per_result / baseline:.0%} of legacy)"
+        baseline = baseline or per_result
+        print(f"  {name:<8} {per_result:7.0f} B/result  {total:9.1f} MiB  {rate:>10,.0f} results/s{ratio}")
+
+
+if __name__ == "__main__":
+    main()
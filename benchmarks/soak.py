@@ -0,0 +1,118 @@
+"""Soak test: full batch scans against the local stand-in server.
+
+``run`` starts a ``core.standin.StandinServer`` (or uses ``--server``), points
+every request at it with ``standin.redirecting`` and runs ``run_user_batch``
+over ``-n`` generated usernames with every username module — concurrency
+control, rate limiting, proxy rotation (``--proxies``) and the response hooks
+all in the loop. It reports checks/sec, the server's request rate and
+statuses, and what the checks ended in.
+
+The server shares a process with the scanner by default; for the highest
+rates run it alone with ``serve`` and pass its URL to ``run --server``.
+
+    python benchmarks/soak.py run -n 200 -C 200
+    python benchmarks/soak.py run --mix profile=50,ratelimit=30,reset=20 --proxies 8
+    python benchmarks/soak.py serve --port 8765 &
+    python benchmarks/soak.py run --server http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from user_scanner.core import orchestrator, standin  # noqa: E402
+from user_scanner.core.breaker import get_breakers  # noqa: E402
+from user_scanner.core.helpers import ScanConfig, set_proxy_manager  # noqa: E402
+from user_scanner.core.result import Status  # noqa: E402
+
+
+def server_options(args) -> dict:
+    return {
+        "mix": args.mix,
+        "rate_limit": args.rate_limit,
+        "slow_seconds": args.slow_seconds,
+        "taken_ratio": args.taken_ratio,
+    }
+
+
+def serve(args) -> None:
+    async def main() -> None:
+        async with standin.StandinServer(port=args.port, **server_options(args)) as server:
+            print(f"Serving on {server.url}", flush=True)
+            served = 0
+            while True:
+                await asyncio.sleep(5)
+                print(f"{(server.served - served) / 5:8.0f} req/s  {dict(server.statuses)}", flush=True)
+                served = server.served
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def scan(args, url: str, server=None) -> None:
+    if args.proxies:
+        # Never dialled: the rewrite skips the hop, but rotation still runs.
+        set_proxy_manager(proxies=[f"http://10.0.0.{i}:3128" for i in range(1, args.proxies + 1)])
+    orchestrator.set_concurrency(args.concurrency)
+    if args.fixed:
+        orchestrator.set_adaptive(False)
+    modules = orchestrator.all_modules()
+    names = [f"soak{i:05d}" for i in range(args.targets)]
+
+    served = server.served if server else 0
+    started = time.perf_counter()
+    with standin.redirecting(url, max_connections=args.concurrency * 2):
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = orchestrator.run_user_batch(names, ScanConfig(allow_loud=True), modules=modules)
+    wall = time.perf_counter() - started
+
+    statuses = Counter(r.status for r in results)
+    print(f"{len(modules)} modules x {len(names)} targets at -C {args.concurrency}")
+    print(f"  {len(results)} checks in {wall:.2f}s: {len(results) / wall:.0f} checks/s")
+    if server:
+        print(f"  server: {(server.served - served) / wall:.0f} req/s  {dict(server.statuses)}")
+    print("  results: " + ", ".join(f"{s.name.lower()} {statuses[s]}" for s in Status if statuses[s]))
+    errors = Counter(str(r.reason or "unknown").split(":")[0][:60] for r in results if r.status == Status.ERROR)
+    for reason, n in errors.most_common(5):
+        print(f"    {n:>6}  {reason}")
+    breakers = get_breakers()
+    if breakers is not None and breakers.tripped():
+        print(f"  breakers: {breakers.summary()}")
+
+
+def run(args) -> None:
+    if args.server:
+        scan(args, args.server)
+        return
+    with standin.serving(**server_options(args)) as server:
+        scan(args, server.url, server)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=("run", "serve"))
+    parser.add_argument("-n", "--targets", type=int, default=50, help="usernames to scan (default: 50)")
+    parser.add_argument("-C", "--concurrency", type=int, default=100)
+    parser.add_argument("--server", help="use a stand-in server already running at this URL")
+    parser.add_argument("--port", type=int, default=8765, help="port for serve (default: 8765)")
+    parser.add_argument("--mix", type=standin.parse_mix, help="behaviour weights, e.g. profile=60,json=25,reset=15")
+    parser.add_argument("--rate-limit", type=int, default=50, help="requests/s per host before 429 (default: 50)")
+    parser.add_argument("--slow-seconds", type=float, default=2.0)
+    parser.add_argument("--taken-ratio", type=float, default=0.5)
+    parser.add_argument("--fixed", action="store_true", help="hold concurrency at -C (no adaptive control)")
+    parser.add_argument("--proxies", type=int, default=0, help="rotate over this many fake proxies")
+    args = parser.parse_args()
+    (serve if args.mode == "serve" else run)(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Cold-start benchmark for the ``user-scanner`` entry point.
+
+Every scenario runs the CLI in a fresh interpreter under ``-X importtime`` and
+records two things: how long it took to reach its first outbound request (or
+to exit, for commands that make none), and where the import time went,
+aggregated per package instead of per module.
+
+The first request is detected with an audit hook on ``socket.getaddrinfo`` and
+``socket.connect``, so nothing has to be imported to install it. The child
+exits there, before any traffic leaves the machine, which also makes the
+numbers independent of the network. Requests curl_cffi makes from C are not
+seen by the hook; the scenarios below all reach an httpx request first.
+
+    python benchmarks/startup.py                  # every scenario, 5 runs each
+    python benchmarks/startup.py version -n 20    # one scenario
+    python benchmarks/startup.py --check          # fail if --version/-lu load the network stack
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS: Dict[str, List[str]] = {
+    "version": ["--version"],
+    "list-user": ["-lu"],
+    "module": ["-u", "x", "-m", "github"],
+    "full": ["-u", "x"],
+}
+
+# Commands that never send a request must not pay for these either.
+NETWORK_STACK = ("httpx", "httpcore", "h2", "curl_cffi", "socksio", "user_scanner.core.orchestrator")
+OFFLINE = ("version", "list-user")
+
+MARKER = "user-scanner-bench:first-request"
+
+PROBE = f"""
+import os, sys, time
+t0 = float(os.environ["USER_SCANNER_BENCH_T0"])
+
+def _first_request(event, args):
+    if event in ("socket.getaddrinfo", "socket.connect"):
+        sys.stderr.write(f"{MARKER} {{time.time() - t0:.6f}}\\n")
+        sys.stderr.flush()
+        os._exit(0)
+
+sys.addaudithook(_first_request)
+sys.argv = ["user-scanner", *sys.argv[1:]]
+from user_scanner.__main__ import main
+main()
+"""
+
+
+class Run(NamedTuple):
+    seconds: float
+    reached_request: bool
+    imports: Dict[str, Tuple[int, int]]  # module -> (self us, cumulative us)
+
+
+def run_once(argv: List[str]) -> Run:
+    env = dict(os.environ, USER_SCANNER_BENCH_T0=repr(time.time()))
+    env.setdefault("PYTHONPATH", str(ROOT))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, *argv],
+        cwd=ROOT,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=120,
+    )
+    elapsed = time.perf_counter() - start
+
+    imports: Dict[str, Tuple[int, int]] = {}
+    reached = False
+    for line in proc.stderr.splitlines():
+        if line.startswith(MARKER):
+            elapsed = float(line.split()[-1])
+            reached = True
+        elif line.startswith("import time:"):
+            head, cumulative_us, name = line.split("|", 2)
+            self_us = head.split(":", 1)[1].strip()
+            if self_us.isdigit():  # skips the column header
+                imports[name.strip()] = (int(self_us), int(cumulative_us))
+    return Run(elapsed, reached, imports)
+
+
+def package_of(module: str, depth: int) -> str:
+    return ".".join(module.split(".")[:depth])
+
+
+def aggregate(imports: Dict[str, Tuple[int, int]], depth: int) -> Dict[str, int]:
+    """Self time summed per package, so many small modules add up visibly."""
+    totals: Dict[str, int] = defaultdict(int)
+    for module, (self_us, _) in imports.items():
+        totals[package_of(module, depth)] += self_us
+    return totals
+
+
+def loaded_network_stack(imports: Dict[str, Tuple[int, int]]) -> List[str]:
+    return sorted(
+        name for name in imports
+        if any(name == pkg or name.startswith(pkg + ".") for pkg in NETWORK_STACK)
+    )
+
+
+def report(name: str, runs: List[Run], top: int, depth: int) -> None:
+    times = [r.seconds * 1000 for r in runs]
+    label = "to first request" if all(r.reached_request for r in runs) else "to exit"
+    spread = f" ±{statistics.stdev(times):.0f}" if len(times) > 1 else ""
+    print(f"\n{name}: user-scanner {' '.join(SCENARIOS[name])}")
+    print(f"  {statistics.median(times):.0f} ms{spread} {label} (median of {len(runs)})")
+
+    per_run = [aggregate(r.imports, depth) for r in runs]
+    packages = {pkg for totals in per_run for pkg in totals}
+    medians = {pkg: statistics.median(t.get(pkg, 0) for t in per_run) for pkg in packages}
+    total = sum(medians.values())
+    print(f"  imports: {total / 1000:.0f} ms self time across {len(packages)} packages")
+    for pkg, us in sorted(medians.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"    {us / 1000:7.1f} ms  {us / total:5.1%}  {pkg}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run: {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="Cold starts per scenario (default: 5)")
+    parser.add_argument("--top", type=int, default=12, help="Packages to list per scenario (default: 12)")
+    parser.add_argument("--depth", type=int, default=1, help="Package depth to aggregate at, e.g. 3 for user_scanner.core.x (default: 1)")
+    parser.add_argument("--check", action="store_true", help="Only verify that offline commands do not import the network stack")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    if args.check:
+        failed = False
+        for name in OFFLINE:
+            leaked = loaded_network_stack(run_once(SCENARIOS[name]).imports)
+            status = "ok" if not leaked else "imports " + ", ".join(leaked[:5])
+            failed = failed or bool(leaked)
+            print(f"{name}: {status}")
+        return 1 if failed else 0
+
+    for name in args.scenarios or SCENARIOS:
+        runs = [run_once(SCENARIOS[name]) for _ in range(max(1, args.runs))]
+        report(name, runs, args.top, args.depth)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
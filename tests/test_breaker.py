@@ -0,0 +1,115 @@
+import types
+
+import httpx
+import pytest
+
+from user_scanner.core import breaker, orchestrator
+from user_scanner.core.breaker import CLOSED, HALF_OPEN, OPEN, Breakers, CircuitBreaker
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result, Status
+
+
+def down():
+    return Result.error(httpx.ConnectError("Connection refused"))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fresh_breakers():
+    board = Breakers(threshold=3, cooldown=60.0)
+    breaker.set_breakers(board)
+    yield board
+    breaker.set_breakers(Breakers())
+
+
+def test_opens_after_consecutive_errors_and_probes_after_cooldown():
+    clock = FakeClock()
+    circuit = CircuitBreaker(threshold=2, cooldown=10.0, clock=clock)
+
+    circuit.record(down())
+    circuit.record(Result.taken())
+    circuit.record(down())
+    assert circuit.state == CLOSED  # The success reset the run.
+    circuit.record(down())
+    assert circuit.state == OPEN
+    assert not circuit.allow()
+
+    clock.now = 10.0
+    assert circuit.allow() and circuit.state == HALF_OPEN
+    assert not circuit.allow()  # Only one probe at a time.
+    circuit.record(Result.error("[503] Status didn't match. Report this on Github."))
+    assert circuit.state == OPEN and circuit.trips == 2
+
+    clock.now = 20.0
+    assert circuit.allow()
+    circuit.record(Result.available())
+    assert circuit.state == CLOSED and circuit.allow()
+
+
+def test_skips_do_not_count_and_lost_probes_expire():
+    clock = FakeClock()
+    circuit = CircuitBreaker(threshold=1, cooldown=5.0, clock=clock)
+    circuit.record(Result.skipped())
+    assert circuit.state == CLOSED
+
+    circuit.record(down())
+    clock.now = 5.0
+    assert circuit.allow()
+    clock.now = 9.0
+    assert not circuit.allow()
+    clock.now = 10.0
+    assert circuit.allow()
+
+
+def test_only_site_failures_count():
+    circuit = CircuitBreaker(threshold=2)
+    for _ in range(5):
+        circuit.record(Result.error("Length must be 3-20 characters"))
+    assert circuit.state == CLOSED and circuit.failures == 0
+
+    circuit.record(Result.error("429 Too Many Requests"))
+    circuit.record(Result.error("Invalid characters"))  # Resets the run.
+    circuit.record(Result.error("[502] Status didn't match. Report this on Github."))
+    assert circuit.state == CLOSED
+    circuit.record(down())
+    assert circuit.state == OPEN
+
+
+def test_batch_short_circuits_a_failing_module(fresh_breakers, capsys):
+    calls = []
+
+    def validate(username):
+        calls.append(username)
+        return Result.error(httpx.ReadTimeout("blocked"))
+
+    module = types.ModuleType("fake.blocking")
+    module.__file__ = "<in-memory>/fake/blocking.py"
+    module.validate_blocking = validate
+
+    orchestrator.set_concurrency(1)
+    try:
+        results = orchestrator.run_user_batch([f"u{i}" for i in range(10)], ScanConfig(), modules=[module])
+    finally:
+        orchestrator.set_concurrency(60)
+
+    assert len(calls) == 3
+    assert all(r.status == Status.ERROR for r in results)
+    assert str(results[-1].reason).startswith("Circuit open")
+    assert results[-1].site_name == "Blocking"
+    assert "1 module(s) tripped (blocking); 7 check(s) short-circuited, 1 still open" == fresh_breakers.summary()
+
+
+def test_configure_breakers():
+    breaker.configure_breakers(0)
+    assert breaker.get_breaker(types.ModuleType("fake.x")) is None
+    breaker.configure_breakers(cooldown=5.0)
+    assert breaker.get_breakers().threshold == breaker.DEFAULT_THRESHOLD
+    assert breaker.get_breakers().cooldown == 5.0
+    breaker.set_breakers(Breakers())
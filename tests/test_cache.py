@@ -0,0 +1,116 @@
+import asyncio
+import subprocess
+import sys
+import types
+
+import pytest
+
+from user_scanner.core import cache as cache_mod
+from user_scanner.core import orchestrator
+from user_scanner.core.cache import ResultCache, parse_duration, parse_ttls
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result, Status
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultCache(tmp_path / "results.sqlite3")
+    yield store
+    store.close()
+
+
+def test_round_trip_keeps_metadata(store):
+    original = Result.taken(url="https://x.com/a", extra={"name": "Alice"}, media={"avatar": "https://i/a.png"})
+    store.put("user/social/x", "alice", original)
+
+    cached = store.get("user/social/x", "alice")
+
+    assert cached.status == Status.TAKEN
+    assert cached.url == "https://x.com/a"
+    assert cached.extra == {"name": "Alice"}
+    assert cached.media == {"avatar": "https://i/a.png"}
+    assert cached.from_cache
+    assert cached.to_dict()["cached"] is True
+
+
+def test_expired_entries_miss(store, monkeypatch):
+    store.put("user/dev/github", "bob", Result.error("boom"))
+    now = cache_mod.time.time()
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now + 10 * 60)
+
+    assert store.get("user/dev/github", "bob") is None
+    assert store.misses == 1
+
+
+def test_skips_are_never_stored(store):
+    store.put("email/social/x", "a@b.com", Result.skipped())
+    assert store.get("email/social/x", "a@b.com") is None
+
+
+def test_parse_ttls():
+    ttls = parse_ttls("found=30d,error=0")
+    assert ttls[Status.TAKEN] == 30 * 24 * 3600
+    assert ttls[Status.ERROR] == 0
+    assert ttls[Status.AVAILABLE] == cache_mod.DEFAULT_TTLS[Status.AVAILABLE]
+
+    both = parse_ttls("12h")
+    assert both[Status.TAKEN] == both[Status.AVAILABLE] == 12 * 3600
+
+    with pytest.raises(ValueError):
+        parse_ttls("bogus=1")
+
+
+def test_parse_duration_units():
+    assert parse_duration("90") == 90
+    assert parse_duration("15m") == 900
+
+
+def test_cache_hit_skips_the_module(store, monkeypatch):
+    calls = []
+    module = types.ModuleType("fake.cachesite")
+    module.__file__ = "<in-memory>/fake/cachesite.py"
+
+    def validate_cachesite(username):
+        calls.append(username)
+        return Result.taken()
+
+    module.validate_cachesite = validate_cachesite
+    monkeypatch.setattr(cache_mod, "_cache", store)
+
+    async def scan():
+        return [r async for r in orchestrator.stream_user_batch(["eve"], ScanConfig(), [module])]
+
+    first = asyncio.run(scan())
+    assert calls == ["eve"]
+    calls.clear()
+
+    second = asyncio.run(scan())
+    assert calls == []
+    assert all(r.from_cache and r.username == "eve" for r in second)
+    assert {r.status for r in first} == {Status.TAKEN}
+
+
+def test_interrupted_scan_keeps_pending_writes(tmp_path):
+    path = tmp_path / "results.sqlite3"
+    probe = (
+        "import sys\n"
+        "from user_scanner import __main__ as cli\n"
+        "from user_scanner.core import cache, orchestrator\n"
+        "from user_scanner.core.result import Result\n"
+        "def interrupted(module, target, config, **kwargs):\n"
+        "    cache.get_cache().put('dev/github', target, Result.taken())\n"
+        "    raise KeyboardInterrupt\n"
+        "orchestrator.run_user_module = interrupted\n"
+        "cli.check_for_updates = lambda: None\n"
+        f"sys.argv = ['user-scanner', '-u', 'eve', '-m', 'github', '--cache', {str(path)!r}]\n"
+        "cli.main()\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, timeout=60)
+    assert proc.returncode != 0 and "KeyboardInterrupt" in proc.stderr
+
+    # Fewer than COMMIT_EVERY writes: only closing the cache commits them.
+    store = ResultCache(path)
+    try:
+        assert store.get("dev/github", "eve").status == Status.TAKEN
+    finally:
+        store.close()
@@ -0,0 +1,76 @@
+import asyncio
+import types
+
+import pytest
+
+from user_scanner.core import orchestrator
+from user_scanner.core.checkpoint import Journal, journal_path, set_journal
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result
+
+
+def _module(name, seen):
+    module = types.ModuleType(f"fake.{name}")
+    module.__file__ = f"<in-memory>/fake/{name}.py"
+
+    async def validate(username):
+        seen.append((username, name))
+        return Result.taken()
+
+    setattr(module, f"validate_{name}", validate)
+    return module
+
+
+def test_journal_records_verdicts_only(tmp_path):
+    path = journal_path(str(tmp_path / "out.json"))
+    assert path.name == "out.json.checkpoint"
+
+    with_site = {"site_name": "Github", "username": "alice"}
+    journal = Journal(path, "username")
+    journal.write(Result.taken(**with_site))
+    journal.write(Result.error("proxy died", site_name="Gitlab", username="alice"))
+    journal.write(Result.skipped(site_name="Loud", username="alice"))
+    journal.close()
+    assert journal.failed == 1
+
+    # A crash can leave the last line half written.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("bob")
+
+    reopened = Journal(path, "username")
+    assert reopened.completed == {("alice", "Github")}
+    assert reopened.resumed == 1
+    reopened.close()
+
+    with pytest.raises(ValueError):
+        Journal(path, "email")
+
+
+def test_resumed_batch_skips_finished_pairs(tmp_path, capsys):
+    seen = []
+    modules = [_module("one", seen), _module("two", seen)]
+
+    journal = Journal(tmp_path / "scan.checkpoint", "username")
+    journal.write(Result.available(site_name="One", username="a"))
+    journal.write(Result.taken(site_name="Two", username="a"))
+    journal.write(Result.taken(site_name="One", username="b"))
+    set_journal(journal)
+    try:
+        results = orchestrator.run_user_batch(["a", "b", "c"], ScanConfig(), modules=modules)
+    finally:
+        set_journal(None)
+
+    assert sorted(seen) == [("b", "two"), ("c", "one"), ("c", "two")]
+    assert len(results) == 3
+
+
+def test_stream_pairs_never_starts_skipped_pairs():
+    async def run_pair(module, target):
+        return Result.available(username=target, site_name=module)
+
+    async def collect():
+        skip = lambda target, module: target == "skip-me"  # noqa: E731
+        pairs = orchestrator.stream_pairs(["a", "skip-me"], ["x", "y"], run_pair, 4, skip)
+        return [(r.username, r.site_name) async for r in pairs]
+
+    assert sorted(asyncio.run(collect())) == [("a", "x"), ("a", "y")]
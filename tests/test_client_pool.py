@@ -0,0 +1,129 @@
+import asyncio
+
+import httpx
+
+from user_scanner.core import client_pool
+import user_scanner.core.email_orchestrator  # noqa: F401  (installs the AsyncClient patch)
+
+
+async def _keepalive_server():
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+
+    async def guarded(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(guarded, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/", connections
+
+
+def test_clients_in_one_loop_share_connections():
+    async def scan():
+        server, url, connections = await _keepalive_server()
+        async with server:
+            for _ in range(3):
+                async with httpx.AsyncClient(timeout=5, trust_env=False) as client:
+                    assert (await client.get(url)).text == "ok"
+            return len(connections)
+
+    assert client_pool.run(scan()) == 1
+
+
+def test_pool_is_keyed_by_transport_options():
+    async def scan():
+        pool = client_pool.get_client_pool()
+        a = httpx.AsyncClient(timeout=5)
+        b = httpx.AsyncClient(timeout=20, follow_redirects=True)
+        c = httpx.AsyncClient(http2=True)
+        assert a._transport is b._transport
+        assert a._transport is not c._transport
+        assert pool.size() == 2
+        await a.aclose()
+        # Closing one client leaves the shared transport to the others.
+        assert pool.size() == 2
+
+    client_pool.run(scan())
+
+
+def test_explicit_transport_is_left_alone():
+    async def scan():
+        own = httpx.MockTransport(lambda request: httpx.Response(204))
+        client = httpx.AsyncClient(transport=own)
+        assert client._transport is own
+        assert client_pool.get_client_pool().size() == 0
+
+    client_pool.run(scan())
+
+
+def test_no_pooling_outside_a_loop():
+    kwargs = {"timeout": 5}
+    client_pool.adopt(kwargs)
+    assert "transport" not in kwargs
+
+
+def test_run_closes_the_loops_transports(monkeypatch):
+    closed = []
+
+    async def record_close(self):
+        closed.append(self)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "aclose", record_close)
+
+    async def scan():
+        async with client_pool.pooled_client() as client:
+            return client._transport.transport
+
+    transport = client_pool.run(scan())
+    assert closed == [transport]
+
+
+def test_pooled_clients_keep_environment_proxies(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://127.0.0.1:9050")
+    monkeypatch.setenv("NO_PROXY", "internal.example")
+
+    async def scan():
+        pool = client_pool.get_client_pool()
+        plain = httpx.AsyncClient()
+        again = httpx.AsyncClient(timeout=5)
+        ignoring = httpx.AsyncClient(trust_env=False)
+        mounts = {pattern.pattern: transport for pattern, transport in plain._mounts.items()}
+        assert set(mounts) == {"https://", "all://*internal.example"}
+        # The proxy is a pooled transport too, shared like the direct one.
+        assert isinstance(mounts["https://"], client_pool._SharedTransport)
+        assert mounts["https://"] is pool.transport(proxy="http://127.0.0.1:9050")
+        assert mounts["all://*internal.example"] is None
+        assert again._mounts == plain._mounts
+        assert not ignoring._mounts
+
+    client_pool.run(scan())
+
+
+def test_environment_proxies_follow_httpx_mount_patterns(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "127.0.0.1:9050")
+    monkeypatch.setenv("NO_PROXY", "internal.example, .corp.example,::1,localhost,10.0.0.0/8,http://direct.example")
+
+    assert client_pool._environment_proxies() == {
+        "https://": "http://127.0.0.1:9050",
+        "all://*internal.example": None,
+        "all://*.corp.example": None,
+        "all://[::1]": None,
+        "all://localhost": None,
+        "all://10.0.0.0/8": None,
+        "http://direct.example": None,
+    }
+
+    monkeypatch.setenv("NO_PROXY", "*")
+    assert client_pool._environment_proxies() == {}
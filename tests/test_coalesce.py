@@ -0,0 +1,140 @@
+import json
+import types
+
+import httpx
+import pytest
+
+from user_scanner.core import client_pool, coalesce, orchestrator, registry
+from user_scanner.core.coalesce import Coalescing
+from user_scanner.core.helpers import ScanConfig, find_module
+from user_scanner.core.result import Result, Status
+
+
+@pytest.fixture
+def fresh_coalescing():
+    coalescing = Coalescing(max_size=50, interval=0.05)
+    coalesce.set_coalescing(coalescing)
+    yield coalescing
+    coalesce.set_coalescing(Coalescing())
+
+
+def bulk_module(name, answer, batch_size=None):
+    calls, batches = [], []
+
+    def validate(username):
+        calls.append(username)
+        return Result.taken()
+
+    def validate_batch(usernames):
+        batches.append(list(usernames))
+        return answer(usernames)
+
+    module = types.ModuleType(f"fake.{name}")
+    module.__file__ = f"<in-memory>/fake/{name}.py"
+    setattr(module, f"validate_{name}", validate)
+    setattr(module, f"validate_{name}_batch", validate_batch)
+    if batch_size is not None:
+        module.BATCH_SIZE = batch_size
+    return module, calls, batches
+
+
+def test_batches_fill_to_size_even_in_a_small_window(fresh_coalescing):
+    module, calls, batches = bulk_module("bulk", lambda names: {n: Result.available() for n in names}, batch_size=10)
+    plain = types.ModuleType("fake.plain")
+    plain.__file__ = "<in-memory>/fake/plain.py"
+    plain.validate_plain = lambda username: Result.taken()
+
+    orchestrator.set_concurrency(4)
+    try:
+        results = orchestrator.run_user_batch([f"u{i}" for i in range(45)], ScanConfig(), modules=[module, plain])
+    finally:
+        orchestrator.set_concurrency(60)
+
+    assert len(results) == 90 and not calls
+    # Four full batches, and the rest sent once the interval ran out.
+    assert [len(batch) for batch in batches] == [10, 10, 10, 10, 5]
+    bulk = [r for r in results if r.site_name == "Bulk"]
+    assert all(r.status == Status.AVAILABLE and r.elapsed is not None for r in bulk)
+    assert sorted(r.username for r in bulk) == sorted(f"u{i}" for i in range(45))
+    assert fresh_coalescing.summary() == "45 check(s) answered by 5 batch request(s) (bulk 45/5)"
+
+
+def test_unanswered_and_failed_batches_fall_back_to_single_checks(fresh_coalescing):
+    module, calls, _ = bulk_module("partial", lambda names: {n: Result.available() for n in names if n != "b"})
+    results = orchestrator.run_user_batch(["a", "b", "c", "a"], ScanConfig(), modules=[module])
+    assert calls == ["b"]
+    assert sorted((r.username, r.status) for r in results) == [
+        ("a", Status.AVAILABLE), ("a", Status.AVAILABLE), ("b", Status.TAKEN), ("c", Status.AVAILABLE)
+    ]
+    # The same username twice gets two Results, not one shared object.
+    assert len({id(r) for r in results}) == 4
+
+    def broken(names):
+        raise RuntimeError("endpoint down")
+
+    module, calls, batches = bulk_module("broken", broken)
+    results = orchestrator.run_user_batch(["a", "b"], ScanConfig(), modules=[module])
+    assert len(batches) == 1 and sorted(calls) == ["a", "b"]
+    assert all(r.status == Status.TAKEN for r in results)
+
+
+def test_batching_off():
+    module, calls, batches = bulk_module("nobatch", lambda names: {}, batch_size=0)
+    orchestrator.run_user_batch(["a", "b"], ScanConfig(), modules=[module])
+    assert not batches and sorted(calls) == ["a", "b"]
+
+    coalesce.configure_coalescing(0)
+    try:
+        assert coalesce.get_coalescing() is None
+        module, calls, batches = bulk_module("off", lambda names: {})
+        orchestrator.run_user_batch(["a", "b"], ScanConfig(), modules=[module])
+        assert not batches and sorted(calls) == ["a", "b"]
+    finally:
+        coalesce.set_coalescing(Coalescing())
+
+    coalesce.configure_coalescing(interval=1.0)
+    assert coalesce.get_coalescing().max_size == coalesce.DEFAULT_MAX_SIZE
+    coalesce.set_coalescing(Coalescing())
+
+
+def test_site_batch_functions_parse_their_endpoints():
+    def handler(request):
+        if request.url.host == "api.minecraftservices.com":
+            assert json.loads(request.content) == ["Notch", "free_name"]
+            return httpx.Response(200, json=[{"id": "069a79f444e94726a5befca90e38aaf5", "name": "Notch"}])
+        if request.url.host == "gitlab.com":
+            assert json.loads(request.content)["variables"] == {"usernames": ["Root", "nobody"]}
+            node = {"id": "gid://gitlab/User/1", "username": "root", "name": "Administrator", "state": "active"}
+            return httpx.Response(200, json={"data": {"users": {"nodes": [node]}}})
+        if request.url.host == "public.api.bsky.app":
+            assert request.url.params.get_list("actors") == ["jay.bsky.social", "gone.bsky.social"]
+            return httpx.Response(200, json={"profiles": [{"handle": "jay.bsky.social", "postsCount": 3}]})
+        return httpx.Response(500)
+
+    client_pool.set_transport_override(httpx.MockTransport(handler))
+    try:
+        # Private copies, so the shared lazy modules stay unloaded.
+        def load(name):
+            entry = registry.entry_for(find_module(name)[0])
+            return registry.LazyModule(entry["stem"], str(registry.PACKAGE_ROOT / entry["path"]))
+
+        minecraft = load("minecraft").validate_minecraft_batch(["Notch", "free_name", "bad name!"])
+        assert set(minecraft) == {"Notch", "free_name"}  # The invalid name is left to validate_minecraft.
+        assert minecraft["Notch"].is_found() and minecraft["Notch"].extra["uuid"].startswith("069a")
+        assert minecraft["free_name"].status == Status.AVAILABLE
+        assert minecraft["free_name"].url == "https://namemc.com/profile/free_name"
+
+        gitlab = load("gitlab").validate_gitlab_batch(["Root", "nobody"])
+        assert gitlab["Root"].is_found() and gitlab["Root"].extra["uid"] == "1"
+        assert gitlab["nobody"].status == Status.AVAILABLE
+
+        bluesky = load("bluesky").validate_bluesky_batch(["jay", "gone"])
+        # An actor getProfiles drops may be suspended rather than free: not answered.
+        assert list(bluesky) == ["jay"] and bluesky["jay"].extra["posts"] == 3
+    finally:
+        client_pool.set_transport_override(None)
+
+
+def test_batch_functions_keep_single_validators_deferrable():
+    for name in ("gitlab", "minecraft", "bluesky"):
+        assert registry.entry_for(find_module(name)[0])["deferrable"]
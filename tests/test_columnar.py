@@ -0,0 +1,108 @@
+import math
+import types
+
+import pytest
+
+from user_scanner.core import orchestrator
+from user_scanner.core.columnar import ResultStore
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result, Status
+
+
+def _result(status, site, target, elapsed=None, category="Dev"):
+    result = Result(status).update(site_name=site, username=target, category=category)
+    result.elapsed = elapsed
+    return result
+
+
+@pytest.fixture
+def store():
+    return ResultStore.from_results(
+        [
+            _result(Status.TAKEN, "One", "alice", 0.1),
+            _result(Status.TAKEN, "Two", "alice", 0.3),
+            _result(Status.ERROR, "Two", "bob", 2.0),
+            _result(Status.AVAILABLE, "One", "bob", 0.2),
+            _result(Status.SKIPPED, "Three", "bob", category="Social"),
+            _result(Status.TAKEN, "Three", "carol", category="Social"),
+        ]
+    )
+
+
+def test_summaries(store):
+    assert len(store) == 6
+    assert store.status_counts()[Status.TAKEN] == 3
+    assert store.count_by("site") == {"One": 2, "Two": 2, "Three": 2}
+    assert store.count_by("category", Status.TAKEN) == {"Dev": 2, "Social": 1}
+    assert store.targets_found_on(2) == [("alice", 2)]
+    # The skipped check never ran, so it does not dilute Three's rate.
+    assert store.error_rate() == {"Two": 0.5, "One": 0.0, "Three": 0.0}
+    assert store.latency_quantiles(quantiles=(0.5,)) == {
+        "One": (pytest.approx(0.2),),
+        "Two": (pytest.approx(2.0),),
+    }
+    assert store.rows(Status.ERROR) == [2]
+
+    with pytest.raises(ValueError):
+        store.count_by("status")
+
+
+def test_save_and_load_round_trip(store, tmp_path):
+    path = tmp_path / "scan.ucol"
+    store.save(path)
+    loaded = ResultStore.load(path)
+
+    assert loaded.to_columns()["status"] == ["taken", "taken", "error", "available", "skipped", "taken"]
+    assert loaded.to_columns()["target"] == store.to_columns()["target"]
+    assert math.isnan(loaded.latency[4])
+    assert loaded.error_rate() == store.error_rate()
+
+    (tmp_path / "other").write_bytes(b"not a store\n")
+    with pytest.raises(ValueError):
+        ResultStore.load(tmp_path / "other")
+
+
+def test_store_fills_from_the_result_stream(capsys):
+    async def validate(username):
+        return Result.taken()
+
+    module = types.ModuleType("fake.somesite")
+    module.__file__ = "<in-memory>/fake/somesite.py"
+    module.validate_somesite = validate
+
+    store = ResultStore()
+    with store.collecting():
+        orchestrator.run_user_batch(["a", "b"], ScanConfig(), modules=[module], collect=False)
+    orchestrator.run_user_batch(["c"], ScanConfig(), modules=[module], collect=False)
+
+    assert store.count_by("target", Status.TAKEN) == {"a": 1, "b": 1}
+
+
+def test_cli_store_flag_saves_every_result(tmp_path, monkeypatch, capsys):
+    from user_scanner import __main__ as cli
+
+    async def validate(username):
+        return Result.taken() if username == "alice" else Result.available()
+
+    module = types.ModuleType("fake.somesite")
+    module.__file__ = "<in-memory>/fake/somesite.py"
+    module.validate_somesite = validate
+
+    real_batch = orchestrator.run_user_batch
+    monkeypatch.setattr(
+        orchestrator, "run_user_batch",
+        lambda targets, config, modules=None, **kwargs: real_batch(targets, config, [module], **kwargs),
+    )
+    for name in ("check_for_updates", "update_self", "print_banner"):
+        monkeypatch.setattr(cli, name, lambda: None)
+    usernames = tmp_path / "usernames.txt"
+    usernames.write_text("alice\nbob")
+    path = tmp_path / "scan.ucol"
+    monkeypatch.setattr("sys.argv", ["user-scanner", "-uf", str(usernames), "-m", "github", "--store", str(path)])
+
+    cli.main()
+
+    assert "2 results stored in" in capsys.readouterr().out
+    loaded = ResultStore.load(path)
+    assert loaded.count_by("target", Status.TAKEN) == {"alice": 1}
+    assert loaded.count_by("target", Status.AVAILABLE) == {"bob": 1}
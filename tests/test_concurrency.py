@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+
+from user_scanner.core.concurrency import AdaptiveSemaphore, AIMDController, is_congestion
+from user_scanner.core.result import Result
+
+
+def run_epoch(controller, latency=0.1, failed=False):
+    for _ in range(max(8, controller.limit)):
+        controller.observe(latency, failed=failed)
+
+
+def test_slow_start_doubles_while_latency_is_flat():
+    controller = AIMDController(ceiling=64, start=4)
+
+    run_epoch(controller)
+    assert controller.limit == 8
+    run_epoch(controller)
+    assert controller.limit == 16
+
+
+def test_window_never_exceeds_the_ceiling():
+    controller = AIMDController(ceiling=10, start=8)
+
+    for _ in range(5):
+        run_epoch(controller)
+
+    assert controller.limit == 10
+    assert controller.peak == 10
+
+
+def test_congestion_halves_the_window_once_per_round_trip():
+    controller = AIMDController(ceiling=64, start=32)
+
+    controller.observe(1.0, congested=True)
+    controller.observe(1.0, congested=True)
+
+    assert controller.limit == 16
+    assert controller.backoffs == 1
+
+
+def test_growth_is_additive_after_a_back_off():
+    controller = AIMDController(ceiling=64, start=32)
+    controller.observe(1.0, congested=True)
+    assert controller.limit == 16
+
+    run_epoch(controller)
+    assert controller.limit == 17
+    run_epoch(controller)
+    assert controller.limit == 18
+
+
+def test_rising_latency_trims_the_window():
+    controller = AIMDController(ceiling=64, start=16)
+    run_epoch(controller, latency=0.1)
+    before = controller.limit
+
+    run_epoch(controller, latency=1.0)
+    assert controller.limit < before
+
+
+def test_fixed_mode_pins_the_ceiling():
+    controller = AIMDController(ceiling=30, adaptive=False)
+
+    controller.observe(1.0, congested=True)
+    assert controller.limit == 30
+
+
+def test_congestion_detection():
+    assert is_congestion(Result.error(httpx.ReadTimeout("slow")))
+    assert is_congestion(Result.error("Rate limited (429)"))
+    assert is_congestion(Result.error("Module execution timed out after 25.0s"))
+    assert not is_congestion(Result.error("Unexpected status: 500"))
+    assert not is_congestion(Result.taken())
+
+
+def test_semaphore_admits_only_the_current_window():
+    controller = AIMDController(ceiling=10, start=2)
+    gate = AdaptiveSemaphore(controller)
+    in_flight = peak = 0
+
+    async def worker():
+        nonlocal in_flight, peak
+        async with gate:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def main():
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_cancelled_waiter_passes_its_wake_up_on():
+    gate = AdaptiveSemaphore(AIMDController(ceiling=1, adaptive=False))
+
+    async def main():
+        await gate.acquire()
+        first = asyncio.ensure_future(gate.acquire())
+        second = asyncio.ensure_future(gate.acquire())
+        await asyncio.sleep(0)
+        gate.release()  # Wakes the first waiter...
+        first.cancel()  # ...which is cancelled before it takes the slot.
+        await asyncio.wait_for(second, timeout=1)
+        return first.cancelled()
+
+    assert asyncio.run(main())
@@ -191,3 +191,59 @@ def test_a_module_restriction_resolves_against_email_scan():
 
 def test_emails_none_loads_no_module_at_all():
     assert _email_scope(CrossScanConfig(emails="none"), ScanConfig()) == []
+
+
+def test_a_hit_is_followed_while_its_round_is_still_running():
+    """A hop-2 check starts while a hop-1 sweep is still waiting on its site."""
+    import threading
+
+    import httpx
+
+    from user_scanner.core import client_pool
+    from user_scanner.core.cross_scan import run_cross_scan
+
+    bob_asked = threading.Event()
+    waits = []
+
+    def handler(request):
+        url = str(request.url)
+        if request.url.host == "public.api.bsky.app":
+            if request.url.params["actor"] == "alice.bsky.social":
+                return httpx.Response(200, json={"description": "code at https://github.com/bob"})
+            return httpx.Response(400, json={"message": "Profile not found"})
+        if url == "https://api.github.com/users/bob":
+            bob_asked.set()
+            return httpx.Response(200, json={"login": "bob"})
+        if url == "https://api.github.com/users/alice":
+            # The sweep of alice (on a worker thread) only answers once bob,
+            # found through alice's Bluesky profile, has been asked for: a
+            # round-by-round scan would still be waiting on this sweep.
+            waits.append(bob_asked.wait(5))
+            return httpx.Response(404)
+        if url.endswith("/social_accounts"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(404)
+
+    first_pass = [
+        Result.taken(extra={"links": "https://bsky.app/profile/alice.bsky.social"}).update(
+            site_name="Gravatar", username="alice@example.com", is_email=True
+        )
+    ]
+    client_pool.set_transport_override(httpx.MockTransport(handler))
+    try:
+        found = run_cross_scan(
+            first_pass,
+            ScanConfig(),
+            CrossScanConfig(modules=("bluesky", "github"), depth=2),
+        )
+    finally:
+        client_pool.set_transport_override(None)
+
+    assert waits == [True]
+    assert sorted((r.site_name, r.username, r.is_found()) for r in found) == [
+        ("Bluesky", "alice", True),
+        ("Bluesky", "bob", False),
+        ("Github", "alice", False),
+        ("Github", "bob", True),
+    ]
+    assert next(r for r in found if r.username == "bob" and r.is_found()).extra["confidence"] == "confirmed"
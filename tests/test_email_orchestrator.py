@@ -8,3 +8,22 @@ def test_set_concurrency():
     
     # restore
     set_concurrency(original_max)
+
+
+def test_run_email_batch_scans_every_email():
+    import types
+    from user_scanner.core.email_orchestrator import run_email_batch
+    from user_scanner.core.helpers import ScanConfig
+    from user_scanner.core.result import Result
+
+    module = types.ModuleType("fake.mailsite")
+    module.__file__ = "<in-memory>/fake/mailsite.py"
+
+    async def validate_mailsite(email):
+        return Result.taken()
+
+    setattr(module, "validate_mailsite", validate_mailsite)
+
+    results = run_email_batch(["a@x.com", "b@x.com"], ScanConfig(), modules=[module])
+    assert sorted(r.username for r in results) == ["a@x.com", "b@x.com"]
+    assert all(r.is_email for r in results)
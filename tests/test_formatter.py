@@ -1,5 +1,17 @@
-from user_scanner.core.formatter import into_csv, into_json
-from user_scanner.core.result import Result
+import csv
+import io
+import json
+import os
+
+from user_scanner.core.formatter import (
+    CSV_HEADER,
+    CsvWriter,
+    JsonlWriter,
+    into_csv,
+    into_json,
+    write_csv,
+)
+from user_scanner.core.result import CSV_FIELDS, Result
 
 
 def test_get_result_output_formats():
@@ -17,3 +29,57 @@ def test_get_result_output_formats():
     out_csv = into_csv([res])
     assert "alice" in out_csv
     assert "ExampleSite" in out_csv
+
+
+def test_jsonl_writer_appends_one_line_per_result(tmp_path, monkeypatch):
+    path = tmp_path / "scan.jsonl"
+    synced = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+    now = [0.0]
+
+    with JsonlWriter(path, fsync_interval=1.0, clock=lambda: now[0]) as writer:
+        writer.write(Result.taken(username="alice", site_name="One"))
+        assert len(synced) == 0
+        now[0] = 1.5
+        writer.write(Result.available(username="alice", site_name="Two"))
+        assert len(synced) == 1
+    assert len(synced) == 2
+
+    with JsonlWriter(path) as writer:
+        writer.write(Result.error("boom", username="bob", site_name="Three"))
+
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [row["site_name"] for row in rows] == ["One", "Two", "Three"]
+    assert rows[2]["reason"] == "boom"
+
+
+def test_write_csv_matches_per_result_rows():
+    results = [
+        Result.taken(username="alice", site_name="One", category="Dev", extra={"Name": "Al"}),
+        Result.error("=1+1", username="bob", site_name="Two", category="Social"),
+        Result.available(username="carol", site_name="Three", media={"avatar": "https://a/b.png"}),
+    ]
+    buffer = io.StringIO()
+    assert write_csv(results, buffer) == 3
+    assert buffer.getvalue() == CSV_HEADER + "\n" + "".join(r.to_csv() + "\n" for r in results)
+    assert into_csv(results) == buffer.getvalue()[:-1]
+
+
+def test_csv_writer_appends_under_a_single_header(tmp_path):
+    path = tmp_path / "scan.csv"
+    # Exports before streaming left no trailing newline.
+    path.write_text(CSV_HEADER + "\nold,Dev,Site,Found,,,,", encoding="utf-8")
+
+    with CsvWriter(path) as writer:
+        writer.write(Result.taken(username="alice", site_name="One", extra={"bio": "two\nlines"}))
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == CSV_FIELDS
+    assert [row[0] for row in rows[1:]] == ["old", "alice"]
+    assert rows[2][5] == "bio: two\nlines"
+
+    fresh = tmp_path / "fresh.csv"
+    with CsvWriter(fresh) as writer:
+        writer.write(Result.available(username="bob"))
+    assert fresh.read_text(encoding="utf-8").splitlines()[0] == CSV_HEADER
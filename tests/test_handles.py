@@ -0,0 +1,116 @@
+import types
+
+import httpx
+import pytest
+
+from user_scanner.core import client_pool, handles, impersonate, orchestrator, registry
+from user_scanner.core.handles import HandleRule, Pruner
+from user_scanner.core.helpers import ScanConfig, find_module
+from user_scanner.core.result import Result
+
+
+@pytest.fixture
+def fresh_pruner():
+    pruner = Pruner()
+    handles.set_pruner(pruner)
+    yield pruner
+    handles.set_pruner(Pruner())
+
+
+def test_rule_checks_length_charset_and_ends():
+    rule = HandleRule({"length": [3, 6], "chars": "a-z0-9_", "first": "a-z", "last": "a-z0-9"})
+
+    assert rule.admits("abc") and rule.admits("a_b9")
+    assert not rule.admits("ab")  # too short
+    assert not rule.admits("abcdefg")  # too long
+    assert not rule.admits("Abc") and not rule.admits("ab-c")
+    assert not rule.admits("9abc") and not rule.admits("abc_")
+    assert not rule.admits("abc\n")
+
+    single = HandleRule({"first": "a", "last": "a-c"})
+    assert single.admits("a") and single.admits("axc") and not single.admits("b")
+    assert HandleRule({"chars": "^A-Z"}).admits("a.b-c") and not HandleRule({"chars": "^A-Z"}).admits("aB")
+
+
+def test_read_spec_rejects_bad_declarations():
+    assert handles.read_spec({"length": (2, None)}) == {"length": [2, None]}
+    for bad in ({"min": 2}, {"length": (0, 3)}, {"length": (5, 3)}, ["a-z"]):
+        with pytest.raises(ValueError):
+            handles.read_spec(bad)
+
+
+def test_registry_carries_declarations():
+    npm = find_module("npmjs")[0]
+    assert registry.entry_for(npm)["handle"] == {"chars": "^A-Z"}
+    assert registry.entry_for(find_module("github")[0])["handle"] is None
+    # Read from the registry, so checking a handle does not import the module.
+    assert handles.rule_for(npm) is not None and not npm.is_loaded
+
+
+def test_batch_skips_pairs_the_site_cannot_hold(fresh_pruner):
+    calls = []
+
+    def validate(username):
+        calls.append(username)
+        return Result.available()
+
+    strict = types.ModuleType("fake.strict")
+    strict.__file__ = "<in-memory>/fake/strict.py"
+    strict.validate_strict = validate
+    strict.HANDLE = {"length": (3, 5), "chars": "a-z"}
+    lenient = types.ModuleType("fake.lenient")
+    lenient.__file__ = "<in-memory>/fake/lenient.py"
+    lenient.validate_lenient = validate
+
+    targets = ["ab", "abc", "ABC", "abcdef", "xyz"]
+    assert orchestrator.count_pairs(targets, [strict, lenient]) == 7
+    results = orchestrator.run_user_batch(targets, ScanConfig(), modules=[strict, lenient])
+
+    assert len(results) == len(calls) == 7
+    assert sorted(r.username for r in results if r.site_name == "Strict") == ["abc", "xyz"]
+    assert fresh_pruner.total == 3
+    assert fresh_pruner.summary() == "3 check(s) not sent, the username being invalid on the site (strict 3)"
+
+
+def test_no_pruner_sends_everything():
+    handles.set_pruner(None)
+    try:
+        module = types.ModuleType("fake.strict2")
+        module.__file__ = "<in-memory>/fake/strict2.py"
+        module.validate_strict2 = lambda username: Result.available()
+        module.HANDLE = {"chars": "a-z"}
+        assert len(orchestrator.run_user_batch(["ok", "NO"], ScanConfig(), modules=[module])) == 2
+    finally:
+        handles.set_pruner(Pruner())
+
+
+def test_declarations_are_no_stricter_than_the_modules():
+    """Whatever a HANDLE rejects, its module rejects too, before any request."""
+    requests = []
+
+    def refuse(*args, **kwargs):
+        requests.append(args)
+        raise httpx.ConnectError("no network in this test")
+
+    client_pool.set_transport_override(httpx.MockTransport(refuse))
+    impersonate.set_request_override(refuse)
+    probes = ["a", "ab", "x" * 60, "bad name", "Upper", "dot.", ".dot", "-dash", "under_", "ünï"]
+    try:
+        declared = [
+            entry for category in registry.load_registry()["user"].values() for entry in category if entry.get("handle")
+        ]
+        assert len(declared) >= 10
+        for entry in declared:
+            # A private copy, so the shared lazy modules stay unloaded.
+            module = registry.LazyModule(entry["stem"], str(registry.PACKAGE_ROOT / entry["path"]))
+            rule = handles.rule_for(module)
+            validate = getattr(module, entry["validate"])
+            for probe in probes:
+                if rule.admits(probe):
+                    continue
+                result = validate(probe)
+                assert not requests, f"{entry['stem']} sent a request for {probe!r}"
+                assert not result.is_found(), f"{entry['stem']} found {probe!r}"
+    finally:
+        client_pool.set_transport_override(None)
+        impersonate.set_request_override(None)
@@ -1,8 +1,10 @@
+import subprocess
 import sys
 import threading
 import json
-from types import SimpleNamespace
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock, patch
+import httpx
 import pytest
 
 from user_scanner.__main__ import main
@@ -30,18 +32,34 @@ def run_main(monkeypatch):
         monkeypatch.setattr("user_scanner.__main__.print_banner", lambda: None)
         # Added **kwargs to handle show_url argument
         monkeypatch.setattr(
-            "user_scanner.__main__.run_email_module_batch",
+            "user_scanner.core.email_orchestrator.run_email_module_batch",
             lambda m, t, config, **kwargs: [
                 Result.taken(username=t, site_name=m, is_email=True)
             ],
         )
         # Added **kwargs to handle show_url argument
         monkeypatch.setattr(
-            "user_scanner.__main__.run_user_module",
+            "user_scanner.core.orchestrator.run_user_module",
             lambda module, target, config, **kwargs: [
                 Result.taken(username=target, site_name=module, is_email=False)
             ],
         )
+        monkeypatch.setattr(
+            "user_scanner.core.email_orchestrator.run_email_batch",
+            lambda targets, config, modules=None, **kwargs: [
+                Result.taken(username=t, site_name=m, is_email=True)
+                for t in targets
+                for m in modules
+            ],
+        )
+        monkeypatch.setattr(
+            "user_scanner.core.orchestrator.run_user_batch",
+            lambda targets, config, modules=None, **kwargs: [
+                Result.taken(username=t, site_name=m, is_email=False)
+                for t in targets
+                for m in modules
+            ],
+        )
         try:
             main()
             return 0
@@ -195,6 +213,35 @@ def test_username_file_unreadable(tmp_path, run_main):
     assert code == 1
 
 
+def test_username_file_bad_line_mid_scan(tmp_path, capsys, monkeypatch):
+    from user_scanner.core import orchestrator
+
+    async def validate(username):
+        return Result.available()
+
+    module = ModuleType("fake.somesite")
+    module.__file__ = "<in-memory>/fake/somesite.py"
+    module.validate_somesite = validate
+
+    username_file = tmp_path / "test_usernames.txt"
+    username_file.write_bytes(b"user1\n" * 5000 + b"\xff\xfe\n")
+    real_batch = orchestrator.run_user_batch
+
+    def batch(targets, config, modules=None, **kwargs):
+        # Scanned for real, so the bad line is read inside the scheduler.
+        return real_batch(targets, config, [module], **kwargs)
+
+    monkeypatch.setattr(orchestrator, "run_user_batch", batch)
+    monkeypatch.setattr("user_scanner.__main__.check_for_updates", lambda: None)
+    monkeypatch.setattr("user_scanner.__main__.print_banner", lambda: None)
+    monkeypatch.setattr(sys, "argv", ["user-scanner", "-uf", str(username_file), "-m", "github"])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 1
+    assert "Error reading username file" in capsys.readouterr().out
+
+
 @patch("httpx.AsyncClient")
 def test_validate_proxy_all_invalid(mock_client):
     instance = MagicMock()
@@ -240,7 +287,7 @@ def test_validate_proxy_empty_list():
 def test_validate_proxy_timeout(mock_client):
     instance = MagicMock()
     mock_client.return_value.__aenter__.return_value = instance
-    instance.get = AsyncMock(side_effect=helpers.httpx.TimeoutException("timeout"))
+    instance.get = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
     proxies = ["http://proxy1.example.com:8080"]
 
     result = helpers.validate_proxies(proxies, timeout=1)
@@ -433,3 +480,92 @@ def test_global_timeout():
     assert get_global_timeout() == 10.5
     set_global_timeout(None)
     assert get_global_timeout() is None
+
+
+def test_iter_target_file_filters_lazily(tmp_path):
+    target_file = tmp_path / "targets.txt"
+    target_file.write_text("a@x.com\n  # note\n\nbad-address\n  b@x.com  \n")
+    invalid = []
+
+    targets = helpers.iter_target_file(target_file, is_email=True, on_invalid=invalid.append)
+
+    assert next(targets) == "a@x.com"
+    assert invalid == []  # nothing past the first hit has been read yet
+    assert list(targets) == ["b@x.com"]
+    assert invalid == ["bad-address"]
+
+
+def test_bulk_usernames_expand_patterns_per_line(tmp_path, run_main, capsys):
+    username_file = tmp_path / "test_usernames.txt"
+    username_file.write_text("john[0-1]\nsolo")
+
+    exit_code = run_main(["-uf", str(username_file), "-m", "github"])
+    out = capsys.readouterr().out
+
+    assert "Scanning 2 permutations" in out
+    assert "Loaded 2 usernames" in out
+    assert exit_code == 0
+
+
+def test_end_of_run_reports_keep_no_checkpoint(tmp_path, run_main, capsys, monkeypatch):
+    from user_scanner.core import checkpoint
+
+    username_file = tmp_path / "test_usernames.txt"
+    username_file.write_text("alice\nbob")
+    opened = []
+    monkeypatch.setattr(checkpoint, "Journal", lambda *args: opened.append(args))
+    monkeypatch.setattr("user_scanner.core.formatter.get_json_data", lambda results: [])
+
+    # A JSON report is written once the scan is over: there is nothing to resume into.
+    assert run_main(["-uf", str(username_file), "-m", "github", "-o", str(tmp_path / "out.json")]) == 0
+    assert opened == []
+
+    journal = tmp_path / "out.json.checkpoint"
+    journal.write_text("# user-scanner checkpoint: username\n")
+    args = ["-uf", str(username_file), "-m", "github", "-o", str(tmp_path / "out.json"), "--resume", str(journal)]
+    assert run_main(args) == 1
+    assert "-f jsonl or csv" in capsys.readouterr().out
+
+
+def test_sharded_pattern_scans_its_share(run_main, capsys, monkeypatch):
+    from user_scanner import __main__ as cli
+
+    scanned = []
+    expand = cli._expand_targets
+
+    def recording(*args):
+        for target in expand(*args):
+            scanned.append(target)
+            yield target
+
+    monkeypatch.setattr(cli, "_expand_targets", recording)
+    for shard in ("1/2", "2/2"):
+        assert run_main(["-u", "john[0-9]", "-m", "github", "--shard", shard]) == 0
+
+    assert "Scanning 5 of 10 permutations (shard 2/2)" in capsys.readouterr().out
+    first, second = set(scanned[:5]), set(scanned[5:])
+    assert len(scanned) == 10 and not first & second
+    assert first | second == {f"john{i}" for i in range(10)}
+
+    assert run_main(["-u", "john[0-9]", "--shard", "3/2"]) == 1
+
+
+@pytest.mark.parametrize("flag", ["--version", "-lu"])
+def test_offline_commands_skip_network_stack(flag):
+    probe = (
+        "import sys\n"
+        f"sys.argv = ['user-scanner', {flag!r}]\n"
+        "from user_scanner.__main__ import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [m for m in ('httpx', 'curl_cffi', 'user_scanner.core.orchestrator') if m in sys.modules]\n"
+        "sys.stderr.write(repr(loaded))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stderr.strip().endswith("[]")
+
@@ -1,7 +1,8 @@
+import asyncio
 import types
 from types import SimpleNamespace
 
-from user_scanner.core import orchestrator
+from user_scanner.core import client_pool, orchestrator, session
 from user_scanner.core.helpers import ScanConfig
 from user_scanner.core.result import Result
 
@@ -58,7 +59,191 @@ def test_set_concurrency():
     original_max = orchestrator.MAX_CONCURRENT_REQUESTS
     set_concurrency(10)
     assert orchestrator.MAX_CONCURRENT_REQUESTS == 10
-    assert orchestrator._shared_executor._max_workers == max(10 * 2, 250)
+    assert session.get_session().workers == max(10 * 2, 250)
+    set_concurrency(200)
+    assert session.get_session().workers == 400
     
     # restore
     set_concurrency(original_max)
+
+
+def _async_module(name, delays):
+    module = types.ModuleType(f"fake.{name}")
+    module.__file__ = f"<in-memory>/fake/{name}.py"
+
+    async def validate(username):
+        await asyncio.sleep(delays.get(username, 0))
+        return Result.taken(username=username)
+
+    setattr(module, f"validate_{name}", validate)
+    return module
+
+
+def test_stream_user_batch_keeps_the_window_full_across_targets():
+
+    slow = _async_module("slowsite", {"alice": 0.3})
+    fast = _async_module("fastsite", {})
+
+    async def collect():
+        return [
+            (r.username, r.site_name)
+            async for r in orchestrator.stream_user_batch(
+                ["alice", "bob"], ScanConfig(), modules=[slow, fast]
+            )
+        ]
+
+    order = asyncio.run(collect())
+
+    assert len(order) == 4
+    # bob's checks start while alice's slow site is still pending, so they
+    # finish first instead of waiting for alice's whole target to drain.
+    assert order[-1] == ("alice", "Slowsite")
+    assert ("bob", "Slowsite") in order[:3]
+
+
+def test_stream_pairs_never_exceeds_the_window():
+
+    in_flight = 0
+    peak = 0
+
+    async def run_pair(module, target):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Result.available(username=target)
+
+    async def collect():
+        targets = (f"user{i}" for i in range(20))
+        return [r async for r in orchestrator.stream_pairs(targets, [None, None], run_pair, 5)]
+
+    results = asyncio.run(collect())
+    assert len(results) == 40
+    assert peak == 5
+
+
+def test_run_user_batch_returns_every_pair(capsys):
+    module = _async_module("testsite", {})
+    results = orchestrator.run_user_batch(["a", "b", "c"], ScanConfig(), modules=[module])
+
+    assert sorted(r.username for r in results) == ["a", "b", "c"]
+
+
+def test_run_user_batch_feeds_sinks_without_collecting(capsys):
+    from user_scanner.core import sinks
+
+    module = _async_module("testsite", {})
+    tally = sinks.Tally()
+    sinks.add_sink(tally)
+    try:
+        results = orchestrator.run_user_batch(
+            ["a", "b", "c"], ScanConfig(), modules=[module], collect=False
+        )
+    finally:
+        sinks.remove_sink(tally)
+
+    assert results == []
+    assert (tally.total, tally.found) == (3, 3)
+
+
+def test_failing_sink_is_dropped_with_its_dependents(capsys):
+    from user_scanner.core import sinks
+
+    class DiskFull:
+        path = "out.jsonl"
+        written = 0
+
+        def write(self, result):
+            if self.written == 1:
+                raise OSError(28, "No space left on device")
+            self.written += 1
+
+    module = _async_module("testsite", {})
+    output, journal, tally = DiskFull(), sinks.Tally(), sinks.Tally()
+    sinks.add_sink(output)
+    sinks.add_sink(journal, requires=(output,))
+    sinks.add_sink(tally)
+    try:
+        orchestrator.run_user_batch(["a", "b", "c"], ScanConfig(), modules=[module], collect=False)
+        assert sinks.has_failed(output) and sinks.has_failed(journal)
+    finally:
+        for sink in (output, journal, tally):
+            sinks.remove_sink(sink)
+
+    # The journal holds only what the output file kept; the rest still got every result.
+    assert (output.written, journal.total, tally.total) == (1, 1, 3)
+    assert capsys.readouterr().err.count("Stopped writing results to out.jsonl") == 1
+
+
+def test_status_validate_async_uses_async_client(monkeypatch):
+    import httpx
+
+    async def scan():
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404)), proxy=None
+        )
+        monkeypatch.setattr(orchestrator, "get_async_client", lambda *args: client)
+        return await orchestrator.status_validate_async(
+            "http://example.com/bob", available=404, taken=200, show_url="http://example.com"
+        )
+
+    res = asyncio.run(scan())
+    assert res.to_number() == 1  # AVAILABLE
+    assert res.url == "http://example.com"
+
+
+def test_async_client_keeps_environment_proxies(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://127.0.0.1:9050")
+
+    async def scan():
+        direct = orchestrator.get_async_client(False, None)
+        proxied = orchestrator.get_async_client(False, "http://10.0.0.1:8080")
+        # The routes httpx itself would give a client without a transport.
+        assert {p.pattern for p in direct._mounts} == {"https://"}
+        assert not proxied._mounts
+
+    client_pool.run(scan())
+
+
+def test_deferrable_module_runs_without_a_worker_thread(monkeypatch):
+    import threading
+
+    module = types.ModuleType("fake.simplesite")
+    threads = []
+
+    def validate_simplesite(username):
+        threads.append(threading.current_thread())
+        if username == "x":
+            return Result.error("too short")
+        return orchestrator.status_validate(f"http://example.com/{username}", 404, 200)
+
+    module.validate_simplesite = validate_simplesite
+
+    async def fake_request(url, **kwargs):
+        return SimpleNamespace(status_code=200)
+
+    def no_sync_request(url, **kwargs):
+        raise AssertionError("deferred module made a blocking request")
+
+    monkeypatch.setattr(orchestrator, "is_deferrable", lambda m: True)
+    monkeypatch.setattr(orchestrator, "make_request_async", fake_request)
+    monkeypatch.setattr(orchestrator, "make_request", no_sync_request)
+
+    results = orchestrator.run_user_module(module, "bob", ScanConfig(show_all=True))
+    assert results[0].to_number() == 0  # TAKEN
+    assert threads == [threading.main_thread()]
+
+    # A validator returning before its request needs nothing deferred.
+    results = orchestrator.run_user_module(module, "x", ScanConfig(show_all=True))
+    assert results[0].to_number() == 2  # ERROR
+
+
+def test_registry_marks_simple_modules_deferrable():
+    from user_scanner.core.helpers import find_module
+
+    assert orchestrator.is_deferrable(find_module("gitlab")[0])
+    # GitHub makes extra requests of its own inside its validator.
+    assert not orchestrator.is_deferrable(find_module("github")[0])
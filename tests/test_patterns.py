@@ -1,6 +1,14 @@
 import pytest
 from itertools import islice
-from user_scanner.core.patterns import expand_patterns, expand_patterns_random, count_patterns
+from user_scanner.core.patterns import (
+    IndexPermutation,
+    PatternSpace,
+    count_patterns,
+    expand_patterns,
+    expand_patterns_random,
+    parse_shard,
+    shard_size,
+)
 
 
 # ── expand_patterns: plain text (no pattern syntax) ──────────────────────
@@ -295,3 +303,78 @@ def test_count_matches_expansion():
     """count_patterns must match the actual number of expansions."""
     pattern = "pre[ab]{1-2}mid[xy]post"
     assert count_patterns(pattern) == len(list(expand_patterns(pattern)))
+
+
+# ── PatternSpace / IndexPermutation ──────────────────────────────────────
+
+@pytest.mark.parametrize("pattern", [
+    "john",
+    "[a-c][1-3]",
+    "pre[ab]{1-2}mid[xy]post",
+    "x[a-z]{0-3}",
+    "[ab]{0;2;5}[0-9]{3}q",
+    "pre[z-a]post",
+    "{literal}[ab]",
+])
+def test_space_index_matches_expansion_order(pattern):
+    space = PatternSpace(pattern)
+    expected = list(expand_patterns(pattern))
+    assert space.size == count_patterns(pattern) == len(expected)
+    assert [space[i] for i in range(space.size)] == expected
+    assert list(space.take(range(space.size))) == expected
+
+
+def test_space_indexes_huge_patterns_directly():
+    space = PatternSpace("[a-z]{20}[0-9]{10}")
+    assert space.size == 26**20 * 10**10
+    assert space[0] == "a" * 20 + "0" * 10
+    assert space[-1] == "z" * 20 + "9" * 10
+    assert space[10**10 + 7] == "a" * 19 + "b" + "0" * 9 + "7"
+    with pytest.raises(IndexError):
+        space[space.size]
+
+
+def test_permutation_is_a_seeded_bijection():
+    for size in (0, 1, 2, 3, 1000, 4097):
+        order = IndexPermutation(size, seed=5)
+        shuffled = list(order.map(range(size)))
+        assert sorted(shuffled) == list(range(size))
+        assert shuffled[: size // 2] == [order(i) for i in range(size // 2)]
+
+    assert list(IndexPermutation(1000, 1).map(range(20))) != list(IndexPermutation(1000, 2).map(range(20)))
+    assert list(IndexPermutation(1000, 1).map(range(1000))) != list(range(1000))
+
+
+def test_random_seed_fixes_the_order():
+    pattern = "[a-z]{2}"
+    assert list(expand_patterns_random(pattern, seed=7)) == list(expand_patterns_random(pattern, seed=7))
+
+
+def test_random_first_candidates_cover_the_space():
+    """Unlike a reservoir, the first picks are spread over the whole space."""
+    first = list(islice(expand_patterns_random("[a-z]{4}", seed=3), 200))
+    assert len(set(first)) == 200
+    assert len({name[0] for name in first}) > 20
+
+
+def test_shards_split_the_space_and_resume():
+    pattern = "u[a-c]{0-3}"
+    everything = list(expand_patterns(pattern))
+    shards = [list(expand_patterns_random(pattern, seed=1, shard=(i, 3))) for i in range(3)]
+
+    assert sorted(name for shard in shards for name in shard) == sorted(everything)
+    assert [len(shard) for shard in shards] == [shard_size(len(everything), (i, 3)) for i in range(3)]
+    assert list(expand_patterns_random(pattern, seed=1, shard=(1, 3), start=4)) == shards[1][4:]
+    assert list(expand_patterns_random(pattern, seed=1, start=len(everything))) == []
+
+
+def test_parse_shard():
+    assert parse_shard("1/4") == (0, 4)
+    assert parse_shard("4/4") == (3, 4)
+    for bad in ("0/4", "5/4", "1", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_long_literal_parses_in_linear_time():
+    assert list(expand_patterns("x" * 100_000 + "[ab]"))[1].endswith("xb")
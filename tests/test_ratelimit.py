@@ -0,0 +1,83 @@
+import asyncio
+import types
+
+import httpx
+
+from user_scanner.core import ratelimit
+from user_scanner.core.ratelimit import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    # Reservations queue: the next caller waits behind the previous one.
+    assert bucket.reserve() == 1.0
+
+
+def test_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    clock.now = 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_parent_domain_entry_covers_subdomains():
+    limiter = HostRateLimiter(limits={"github.com": (1.0, 1)})
+
+    assert limiter.bucket("api.github.com") is limiter.bucket("github.com")
+    assert limiter.bucket("gitlab.com") is None
+
+
+def test_default_limit_gives_each_host_its_own_bucket():
+    limiter = HostRateLimiter(limits={}, default=(1.0, 1))
+
+    assert limiter.bucket("a.com") is not None
+    assert limiter.bucket("a.com") is not limiter.bucket("b.com")
+
+
+def test_module_override_is_applied(monkeypatch):
+    limiter = HostRateLimiter(limits={})
+    monkeypatch.setattr(ratelimit, "_limiter", limiter)
+    module = types.ModuleType("fake.site")
+    module.RATE_LIMITS = {"example.com": (0.5, 2)}
+
+    ratelimit.configure_module(module)
+
+    assert limiter.bucket("example.com").rate == 0.5
+
+
+def test_zero_rate_disables_pacing(monkeypatch):
+    limiter = HostRateLimiter(limits={"github.com": (1.0, 1)})
+    monkeypatch.setattr(ratelimit, "_limiter", limiter)
+
+    ratelimit.set_host_rate(0)
+
+    assert limiter.delay("https://api.github.com/users/x") == 0.0
+    assert limiter.delay("https://api.github.com/users/x") == 0.0
+
+
+def test_async_hook_paces_requests(monkeypatch):
+    limiter = HostRateLimiter(limits={"example.com": (1000.0, 1)})
+    monkeypatch.setattr(ratelimit, "_limiter", limiter)
+    request = httpx.Request("GET", "https://example.com/")
+
+    async def fire():
+        await ratelimit.async_request_hook(request)
+        await ratelimit.async_request_hook(request)
+
+    asyncio.run(fire())
+    assert limiter.bucket("example.com")._tokens < 0
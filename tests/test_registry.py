@@ -0,0 +1,138 @@
+import ast
+import json
+
+import pytest
+
+from user_scanner.core import registry
+from user_scanner.core.helpers import find_category, find_module, load_categories, load_modules
+
+
+def test_shipped_registry_matches_tree():
+    shipped = json.loads(registry.REGISTRY_PATH.read_text(encoding="utf-8"))
+    assert shipped == registry.build_registry()
+
+
+def test_load_modules_does_not_execute_sources():
+    path = load_categories()["dev"]
+    modules = load_modules(path)
+
+    assert modules
+    assert all(isinstance(m, registry.LazyModule) for m in modules)
+    assert sum(m.is_loaded for m in modules) <= 1
+
+
+def test_find_module_returns_shared_lazy_module():
+    first = find_module("github")
+    second = find_module("github")
+
+    assert len(first) == 1
+    assert first[0] is second[0]
+    assert find_category(first[0]) == "Dev"
+
+
+def test_attribute_access_loads_module(tmp_path):
+    source = tmp_path / "demo.py"
+    source.write_text("def validate_demo(user):\n    return user.upper()\n")
+    module = registry.LazyModule("demo", str(source))
+
+    assert not module.is_loaded
+    assert module.validate_demo("x") == "X"
+    assert module.is_loaded
+
+
+def test_describe_reads_validate_function():
+    path = load_categories()["dev"] / "github.py"
+    entry = registry.describe(path, "user")
+
+    assert entry["stem"] == "github"
+    assert entry["validate"] == "validate_github"
+    assert entry["path"] == "user_scan/dev/github.py"
+
+
+@pytest.fixture
+def scratch_tree(tmp_path, monkeypatch):
+    (tmp_path / "user_scan" / "dev").mkdir(parents=True)
+    (tmp_path / "email_scan").mkdir()
+    monkeypatch.setattr(registry, "PACKAGE_ROOT", tmp_path)
+    monkeypatch.setattr(registry, "REGISTRY_PATH", tmp_path / "registry.json")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    registry.load_registry.cache_clear()
+    yield tmp_path / "user_scan" / "dev"
+    registry.load_registry.cache_clear()
+
+
+def test_edited_module_is_described_again(scratch_tree):
+    source = scratch_tree / "demo.py"
+    source.write_text(
+        "from user_scanner.core.orchestrator import status_validate\n\n"
+        "def validate_demo(user):\n"
+        "    return status_validate(f'https://old.example/u/{user}', 404, 200)\n"
+    )
+    (scratch_tree / "other.py").write_text("def validate_other(user):\n    return None\n")
+    registry.write_registry()
+    shipped = registry.REGISTRY_PATH.read_text(encoding="utf-8")
+
+    # Same stems, same size: only the contents tell the entry is stale.
+    source.write_text(source.read_text().replace("old", "new"))
+    registry.load_registry.cache_clear()
+    entry = registry.load_registry()["user"]["dev"][0]
+
+    assert entry["rule"]["url"] == "https://new.example/u/{user}"
+    assert registry.load_registry()["user"]["dev"][1]["validate"] == "validate_other"
+    # Written back, so the next start does not describe it again.
+    assert registry.REGISTRY_PATH.read_text(encoding="utf-8") != shipped
+    assert json.loads(registry.REGISTRY_PATH.read_text(encoding="utf-8")) == registry.build_registry()
+
+
+def test_unchanged_tree_is_not_hashed_again(scratch_tree, monkeypatch):
+    (scratch_tree / "demo.py").write_text("def validate_demo(user):\n    return None\n")
+    registry.write_registry()
+    first = registry.load_registry()
+    assert registry._stamp_path().exists()
+
+    def hashed(path):
+        raise AssertionError(f"{path} hashed again")
+
+    monkeypatch.setattr(registry, "_digest", hashed)
+    registry.load_registry.cache_clear()
+    assert registry.load_registry() == first
+
+
+def test_read_only_install_works_from_memory(scratch_tree, monkeypatch):
+    source = scratch_tree / "demo.py"
+    source.write_text("def validate_demo(user):\n    return None\n")
+    registry.write_registry()
+    source.write_text("def validate_demo(user):\n    return None\n\ndef validate_demo_batch(users):\n    return None\n")
+
+    def read_only(path, text):
+        raise PermissionError(13, "Read-only file system")
+
+    monkeypatch.setattr(registry, "_write_atomic", read_only)
+    registry.load_registry.cache_clear()
+
+    assert registry.load_registry()["user"]["dev"][0]["digest"] == registry._digest(source)
+    # Nothing vouches for the stale file, so the next start checks again.
+    assert not registry._stamp_path().exists()
+
+
+@pytest.mark.parametrize(
+    "extra, expected",
+    [
+        ("def validate_demo_batch(users):\n    return make_request('https://example.com')\n", True),
+        ("def _fetch(user):\n    return make_request(user)\n\nLOOKUP = _fetch\n", True),
+        ("def _helper(user):\n    return make_request(user)\n", False),
+    ],
+    ids=["batch-only", "unused-helper", "called-helper"],
+)
+def test_deferrable_counts_only_what_the_validator_reaches(extra, expected):
+    source = (
+        "from user_scanner.core.orchestrator import make_request, status_validate\n\n"
+        + extra
+        + "\n\ndef validate_demo(user):\n"
+        + ("    _helper(user)\n" if "_helper" in extra else "")
+        + "    return status_validate(f'https://example.com/{user}', 404, 200)\n"
+    )
+    tree = ast.parse(source)
+    func = next(node for node in tree.body if getattr(node, "name", None) == "validate_demo")
+
+    assert registry.deferrable(tree, func) is expected
@@ -0,0 +1,99 @@
+import random
+import types
+
+import httpx
+import pytest
+
+from user_scanner.core import impersonate, orchestrator, replay, retry
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result, Status
+
+
+def _module(name, validate):
+    module = types.ModuleType(f"fake.{name}")
+    module.__file__ = f"<in-memory>/fake/{name}.py"
+    setattr(module, f"validate_{name}", validate)
+    return module
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    store = replay.FixtureStore(tmp_path)
+    store.put("GET", "https://sync.test/alice", b"", 200, [("content-type", "text/html")], b"profile", 0.0)
+    store.put("GET", "https://sync.test/bob", b"", 404, [], b"", 0.0)
+    store.put("POST", "https://async.test/check", b'{"email":"a@b.c"}', 200, [], b'{"taken": true}', 0.0)
+    return tmp_path
+
+
+def test_latency_specs():
+    rng = random.Random(0)
+    assert replay.Latency("0").sample(3.0) == 0.0
+    assert replay.Latency("recorded").sample(0.25) == 0.25
+    assert replay.Latency("0.1").sample() == replay.Latency("fixed:0.1").sample() == 0.1
+    assert 0.2 <= replay.Latency("uniform:0.2,0.4", rng).sample() <= 0.4
+    assert replay.Latency("lognormal:0.1,0.5", rng).sample() > 0
+
+    for bad in ("uniform:1", "gamma:1,2", "fast"):
+        with pytest.raises(ValueError):
+            replay.Latency(bad)
+
+
+def test_scan_pipeline_replays_fixtures(fixtures, capsys, monkeypatch):
+    # The miss below would otherwise be retried.
+    monkeypatch.setattr(retry, "_policy", retry.NO_RETRY)
+
+    def sync_check(username):
+        return orchestrator.status_validate(f"https://sync.test/{username}", 404, 200)
+
+    async def async_check(username):
+        async with httpx.AsyncClient() as client:
+            response = await client.post("https://async.test/check", json={"email": "a@b.c"})
+        return Result.taken() if response.json()["taken"] else Result.available()
+
+    modules = [_module("sync", sync_check), _module("async", async_check)]
+    with replay.replaying(fixtures, latency="0") as transport:
+        results = orchestrator.run_user_batch(["alice", "bob", "carol"], ScanConfig(), modules=modules)
+
+    statuses = {(r.site_name, r.username): r.status for r in results}
+    assert statuses[("Sync", "alice")] == Status.TAKEN
+    assert statuses[("Sync", "bob")] == Status.AVAILABLE
+    # No fixture for carol: a connection error, as offline.
+    assert statuses[("Sync", "carol")] == Status.ERROR
+    assert statuses[("Async", "carol")] == Status.TAKEN
+    assert transport.misses == 1
+
+    # Uninstalled: clients are built for the network again.
+    assert orchestrator.get_client(False, None).__class__ is httpx.Client
+    assert orchestrator.get_client(False, None)._transport is not transport
+
+
+def test_impersonate_requests_are_replayed(fixtures):
+    with replay.replaying(fixtures, latency="0", fallback_status=404):
+        response = impersonate.impersonate_request("https://sync.test/alice")
+        missing = impersonate.impersonate_request("https://sync.test/nobody", method="POST", data={"a": 1})
+
+    assert (response.status_code, response.text) == (200, "profile")
+    assert missing.status_code == 404
+
+
+def test_recording_round_trip(tmp_path):
+    recorder = replay.RecordingTransport(tmp_path)
+    recorder._sync = httpx.MockTransport(
+        lambda request: httpx.Response(
+            201, headers={"content-encoding": "identity", "x-id": "7"}, content=b"\xff\x00 binary"
+        )
+    )
+    replay.install(recorder)
+    try:
+        recorded = orchestrator.make_request("https://rec.test/item", params={"q": "x"})
+    finally:
+        replay.install(None)
+
+    assert recorder.recorded == 1
+    with replay.replaying(tmp_path, latency="0"):
+        replayed = orchestrator.make_request("https://rec.test/item", params={"q": "x"})
+
+    assert replayed.status_code == recorded.status_code == 201
+    assert replayed.content == b"\xff\x00 binary"
+    assert replayed.headers["x-id"] == "7"
+    assert "content-encoding" not in replayed.headers
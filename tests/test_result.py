@@ -111,6 +111,25 @@ def test_result_media():
     assert "none" not in result.media
 
 
+def test_results_are_slotted_with_lazy_metadata():
+    res = Result.available().update(site_name="".join(["Git", "hub"]), category="Dev")
+    assert not hasattr(res, "__dict__")
+    assert res._extra is None and res._media is None
+
+    # Exports and console output never allocate the dicts.
+    res.to_dict()
+    res.to_csv()
+    res.get_console_output()
+    assert res._extra is None
+
+    # Every result for a site shares one copy of its name.
+    other = Result.taken().update(site_name="Githu" + "b")
+    assert res.site_name is other.site_name
+
+    res.extra["note"] = "kept"
+    assert res.as_dict()["extra"] == {"note": "kept"}
+
+
 def test_update_and_fields():
     res = Result.available()
     assert res.username is None
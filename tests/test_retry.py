@@ -0,0 +1,129 @@
+import types
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from user_scanner.core import client_pool, orchestrator, retry
+from user_scanner.core.helpers import ScanConfig
+
+FAST = retry.RetryPolicy(backoff=0.0)
+
+
+@pytest.fixture(autouse=True)
+def fresh_budget(monkeypatch):
+    monkeypatch.setattr(retry, "_budget", retry.RetryBudget())
+    monkeypatch.setattr(retry, "_policy", FAST)
+
+
+@pytest.fixture
+def server():
+    """Answers each request with the next of ``replies`` (a status or an exception)."""
+    calls = []
+    replies = []
+
+    def handler(request):
+        calls.append(request.method)
+        reply = replies.pop(0) if replies else 200
+        if isinstance(reply, Exception):
+            raise reply
+        status, headers = reply if isinstance(reply, tuple) else (reply, {})
+        return httpx.Response(status, headers=headers)
+
+    client_pool.set_transport_override(httpx.MockTransport(handler))
+    yield calls, replies
+    client_pool.set_transport_override(None)
+
+
+def test_retry_after_and_backoff():
+    assert retry.parse_retry_after("3") == 3.0
+    soon = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < retry.parse_retry_after(soon) <= 30
+    assert retry.parse_retry_after("soon") is None
+
+    policy = retry.RetryPolicy(backoff=1.0, max_backoff=3.0)
+    assert all(0 <= policy.delay(1) <= 1.0 for _ in range(50))
+    assert all(0 <= policy.delay(5) <= 3.0 for _ in range(50))
+    assert policy.delay(1, retry_after=2.0) == 2.0
+    assert policy.delay(1, retry_after=60.0) is None
+
+
+def test_idempotent_requests_retry_on_5xx_and_429(server):
+    calls, replies = server
+    replies.extend([503, (429, {"Retry-After": "0"})])
+
+    assert orchestrator.make_request("https://flaky.test/a").status_code == 200
+    assert len(calls) == 3
+
+
+def test_post_retries_only_what_never_reached_the_server(server):
+    calls, replies = server
+    replies.append(502)
+    assert orchestrator.make_request("https://flaky.test/a", method="POST").status_code == 502
+
+    replies.append(httpx.ConnectError("refused"))
+    assert orchestrator.make_request("https://flaky.test/a", method="POST").status_code == 200
+    assert calls == ["POST", "POST", "POST"]
+
+
+def test_attempts_and_long_retry_after_stop_retrying(server):
+    calls, replies = server
+    replies.extend([500, 500, 500, 500])
+    assert orchestrator.make_request("https://flaky.test/a").status_code == 500
+    assert len(calls) == FAST.attempts
+
+    calls.clear()
+    replies[:] = [(429, {"Retry-After": "3600"})]
+    assert orchestrator.make_request("https://flaky.test/a").status_code == 429
+    assert len(calls) == 1
+
+
+def test_budget_caps_retries_per_host(server, monkeypatch):
+    monkeypatch.setattr(retry, "_budget", retry.RetryBudget(ratio=0.0, host_reserve=1.0))
+    calls, replies = server
+    replies.extend([500] * 10)
+
+    orchestrator.make_request("https://failing.test/a")
+    orchestrator.make_request("https://failing.test/b")
+    # One retry in the host's budget, spent by the first request.
+    assert len(calls) == 3
+
+    replies[:] = [503]
+    assert orchestrator.make_request("https://healthy.test/").status_code == 200
+
+
+def test_async_clients_retry_without_blocking(server):
+    calls, replies = server
+    replies.extend([httpx.ReadTimeout("slow"), 504])
+
+    async def main():
+        async with httpx.AsyncClient(transport=client_pool.get_client_pool().transport(), proxy=None) as client:
+            return await client.get("https://flaky.test/a")
+
+    assert client_pool.run(main()).status_code == 200
+    assert len(calls) == 3
+
+
+def test_module_policy_applies_to_its_own_checks(server, capsys):
+    calls, replies = server
+    replies.extend([503, 503])
+
+    def check(username):
+        return orchestrator.status_validate(f"https://flaky.test/{username}", 404, 200)
+
+    module = types.ModuleType("fake.flaky")
+    module.__file__ = "<in-memory>/fake/flaky.py"
+    module.validate_flaky = check
+    module.RETRY = retry.NO_RETRY
+
+    results = orchestrator.run_user_batch(["a"], ScanConfig(), modules=[module])
+    assert results[0].status.name == "ERROR"
+    assert len(calls) == 1
+    assert retry.get_policy() is FAST
+
+
+def test_backoff_spends_the_budget(monkeypatch):
+    monkeypatch.setattr(retry, "_budget", retry.RetryBudget(ratio=0.0, host_reserve=1.0))
+    assert retry.backoff("https://site.test/", 1)
+    assert not retry.backoff("https://site.test/", 2)
@@ -0,0 +1,186 @@
+import ast
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from user_scanner.core import orchestrator, registry, rules
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Status
+
+SPEC = {
+    "url": "https://example.com/api/{user}",
+    "show_url": "https://example.com/{user}",
+    "headers": {"User-Agent": "{user_agent}", "X-Literal": "{{kept}}"},
+    "checks": [
+        {"when": {"status": 404}, "result": "available"},
+        {"when": {"all": [{"status": 200}, {"json": "$.data[0].id"}]}, "result": "taken"},
+        {"when": {"contains": "suspended"}, "result": "error", "reason": "Suspended ({status})"},
+        {"result": "error", "reason": "Unexpected status code: {status}"},
+    ],
+    "extract": {
+        "extra": {"name": "$.data[0].name", "missing": "$.nope"},
+        "media": {"avatar": {"regex": r'"avatar":\s*"([^"]+)"'}},
+    },
+}
+
+
+def _response(status, body=""):
+    return httpx.Response(status, content=body.encode(), request=httpx.Request("GET", "https://example.com"))
+
+
+def test_rule_evaluates_checks_in_order():
+    rule = rules.Rule(SPEC)
+    body = json.dumps({"data": [{"id": 7, "name": "Bob", "avatar": "https://img/b.png"}]})
+
+    taken = rule.evaluate(_response(200, body))
+    assert taken.status == Status.TAKEN
+    assert taken.extra == {"name": "Bob"}
+    assert taken.media == {"avatar": "https://img/b.png"}
+
+    assert rule.evaluate(_response(404)).status == Status.AVAILABLE
+    assert rule.evaluate(_response(200, "account suspended")).reason == "Suspended (200)"
+    assert rule.evaluate(_response(503)).reason == "Unexpected status code: 503"
+
+
+def test_rule_formats_request_templates():
+    url, kwargs = rules.Rule(SPEC).request("bob")
+    assert url == "https://example.com/api/bob"
+    assert kwargs["show_url"] == "https://example.com/bob"
+    assert kwargs["headers"]["X-Literal"] == "{kept}"
+    assert kwargs["headers"]["User-Agent"]
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"url": "x", "checks": []},
+        {"url": "x", "checks": [{"result": "maybe"}]},
+        {"url": "x", "checks": [{"when": {"colour": "red"}, "result": "taken"}]},
+        {"url": "x", "checks": [{"result": "taken"}], "retries": 3},
+    ],
+)
+def test_invalid_rules_are_rejected(spec):
+    with pytest.raises(ValueError):
+        rules.Rule(spec)
+
+
+def _registry_rules():
+    return [
+        entry
+        for category in registry.load_registry()["user"].values()
+        for entry in category
+        if entry.get("rule")
+    ]
+
+
+def test_extracted_rules_exist():
+    stems = {entry["stem"] for entry in _registry_rules()}
+    assert {"asciinema", "threads", "bitbucket", "hackerearth"} <= stems
+    # Modules that parse JSON in code keep running as code.
+    assert "gitlab" not in stems
+
+
+@pytest.mark.parametrize("entry", _registry_rules(), ids=lambda e: e["stem"])
+def test_extracted_rule_matches_module(entry, monkeypatch):
+    rule = rules.compiled(entry["rule"])
+    markers = [
+        check["when"]
+        for check in entry["rule"]["checks"]
+        if "when" in check
+    ]
+    texts = {""}
+    stack = list(markers)
+    while stack:
+        matcher = stack.pop()
+        texts.update([matcher["contains"]] if "contains" in matcher else [])
+        for key in ("all", "any"):
+            stack.extend(matcher.get(key, []))
+        if "not" in matcher:
+            stack.append(matcher["not"])
+
+    module = registry.lazy_module(entry)
+    validate = getattr(module, entry["validate"])
+    for status in (200, 301, 403, 404, 500):
+        for text in texts:
+            response = _response(status, text)
+            monkeypatch.setattr(orchestrator, "make_request", lambda url, **kw: response)
+            expected = validate("someone")
+            actual = rule.evaluate(response)
+            assert (actual.status, actual.get_reason()) == (expected.status, expected.get_reason())
+
+    # Usernames the module turns away before sending anything.
+    response = _response(404)
+    monkeypatch.setattr(orchestrator, "make_request", lambda url, **kw: response)
+    for probe in ("a", "x" * 40, "Upper", "bad name", "-dash", "under_"):
+        expected = validate(probe)
+        actual = rule.check_username(probe) or rule.evaluate(response)
+        assert (actual.status, actual.get_reason()) == (expected.status, expected.get_reason()), probe
+
+
+def test_rule_modules_run_without_import(monkeypatch):
+    async def fake_request(url, **kwargs):
+        return _response(404)
+
+    monkeypatch.setattr(orchestrator, "make_request_async", fake_request)
+    entry = next(e for e in _registry_rules() if e["stem"] == "asciinema")
+    module = registry.LazyModule(entry["stem"], str(registry.PACKAGE_ROOT / entry["path"]))
+
+    results = orchestrator.run_user_module(module, "someone", ScanConfig(show_all=True))
+    assert results[0].status == Status.AVAILABLE
+    assert results[0].url == "https://asciinema.org/~someone"
+    assert not module.is_loaded
+
+
+def test_rule_for_compiles_once(monkeypatch):
+    entry = next(e for e in _registry_rules() if e["stem"] == "asciinema")
+    module = registry.lazy_module(entry)
+    rule = rules.rule_for(module)
+
+    def recompiled(spec):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr(rules, "compiled", recompiled)
+    assert rules.rule_for(module) is rule
+
+
+def test_rule_file_becomes_a_scan_module(monkeypatch):
+    async def fake_request(url, **kwargs):
+        assert url == "https://example.com/api/bob"
+        return _response(404)
+
+    monkeypatch.setattr(orchestrator, "make_request_async", fake_request)
+    module = rules.RuleModule("example", "<rules>/dev/example.json", SPEC)
+
+    result = asyncio.run(module.validate_example("bob"))
+    assert result.status == Status.AVAILABLE
+
+
+def test_username_guards_become_checks():
+    source = (
+        "import re\n"
+        "from user_scanner.core.orchestrator import status_validate, Result\n"
+        "HANDLE = {'length': (3, 20)}\n"
+        "def validate_demo(name):\n"
+        "    if len(name) < 3 or 20 < len(name):\n"
+        "        return Result.error('Bad length')\n"
+        "    if not re.fullmatch(r'[a-z]+', name):\n"
+        "        return Result.available('Letters only')\n"
+        "    url = f'https://example.com/{name}'\n"
+        "    show_url = url\n"
+        "    return status_validate(url, available=404, taken=200, show_url=show_url)\n"
+    )
+    tree = ast.parse(source)
+    spec = rules.extract_rule(tree, tree.body[-1])
+
+    assert spec["show_url"] == spec["url"] == "https://example.com/{user}"
+    assert spec["username"][0]["when"] == {"any": [{"length": [None, 2]}, {"length": [21, None]}]}
+    rule = rules.Rule(spec)
+    assert rule.check_username("ab").get_reason() == "Bad length"
+    assert rule.check_username("abc1").status == Status.AVAILABLE
+    assert rule.check_username("abc") is None
+
+    # Module state other than HANDLE is still left to the code.
+    stateful = ast.parse(source.replace("HANDLE =", "RATE_LIMITS ="))
+    assert rules.extract_rule(stateful, stateful.body[-1]) is None
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import types
+
+import httpx
+
+from user_scanner.core import client_pool, orchestrator, session
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result
+from user_scanner.core.session import ScanSession
+
+
+def test_runs_share_one_loop_executor_and_pool():
+    scan = ScanSession(workers=4)
+
+    async def probe():
+        loop = asyncio.get_running_loop()
+        client = client_pool.pooled_client()
+        thread = await loop.run_in_executor(None, threading.current_thread)
+        return loop, client._transport.transport, thread
+
+    try:
+        first, second = scan.run(probe()), scan.run(probe())
+        assert first[0] is second[0]
+        # The second call reuses the first one's connections.
+        assert first[1] is second[1]
+        assert first[2] in scan.executor._threads
+        assert scan.runs == 2
+    finally:
+        scan.close()
+    assert first[0].is_closed()
+
+
+def test_run_cancels_what_it_left_behind():
+    scan = ScanSession(workers=2)
+    cancelled = []
+
+    async def linger():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def main():
+        asyncio.ensure_future(linger())
+        await asyncio.sleep(0)
+        return "done"
+
+    try:
+        assert scan.run(main()) == "done"
+        assert cancelled == [True]
+        assert not asyncio.all_tasks(scan.loop)
+    finally:
+        scan.close()
+
+
+def test_resize_swaps_the_default_executor():
+    scan = ScanSession(workers=2)
+
+    async def worker():
+        return await asyncio.get_running_loop().run_in_executor(None, threading.current_thread)
+
+    try:
+        scan.run(worker())
+        old = scan.executor
+        scan.resize(8)
+        assert scan.executor is not old and scan.workers == 8
+        assert scan.run(worker()) in scan.executor._threads
+        current = scan.executor
+        scan.resize(8)
+        assert scan.executor is current and scan.workers == 8
+    finally:
+        scan.close()
+
+
+def test_close_releases_the_pooled_transports(monkeypatch):
+    closed = []
+
+    async def record_close(self):
+        closed.append(self)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "aclose", record_close)
+    scan = ScanSession(workers=2)
+
+    async def scan_once():
+        async with client_pool.pooled_client() as client:
+            return client._transport.transport
+
+    transport = scan.run(scan_once())
+    assert not closed
+    scan.close()
+    assert closed == [transport]
+
+
+def test_scans_run_on_the_process_session():
+    threads = []
+
+    def validate(username):
+        threads.append(threading.current_thread())
+        return Result.taken()
+
+    module = types.ModuleType("fake.sessioned")
+    module.__file__ = "<in-memory>/fake/sessioned.py"
+    module.validate_sessioned = validate
+
+    loops = []
+
+    async def current():
+        loops.append(asyncio.get_running_loop())
+
+    orchestrator.run_user_module(module, "alice", ScanConfig())
+    session.run(current())
+    orchestrator.run_user_module(module, "bob", ScanConfig())
+    session.run(current())
+
+    assert loops[0] is loops[1] is session.get_session().loop
+    # Sync validators run on the session's worker pool.
+    assert len(threads) == 2 and set(threads) <= session.get_session().executor._threads
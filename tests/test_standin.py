@@ -0,0 +1,67 @@
+import time
+import types
+
+import httpx
+import pytest
+
+from user_scanner.core import impersonate, orchestrator, standin
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Status
+
+
+@pytest.fixture
+def server():
+    with standin.serving(rate_limit=2, slow_seconds=0.2, routes={"example.com": "profile"}) as running:
+        yield running
+
+
+def test_parse_mix():
+    assert standin.parse_mix("profile=3, json=1") == {"profile": 3, "json": 1}
+    for bad in ("profile", "teapot=1", "json=0"):
+        with pytest.raises(ValueError):
+            standin.parse_mix(bad)
+
+
+def test_behaviours(server):
+    with httpx.Client(base_url=server.url, proxy=None) as client:
+        profile = client.get("/profile/alice")
+        assert profile.status_code == (200 if server.is_taken("/profile/alice") else 404)
+        assert client.get("/profile/alice").status_code == profile.status_code
+
+        assert client.get("/json/alice").json() == {
+            "username": "alice",
+            "available": not server.is_taken("/json/alice"),
+        }
+
+        limited = [client.get(f"/ratelimit/user{i}") for i in range(3)]
+        assert limited[-1].status_code == 429
+        assert limited[-1].headers["retry-after"] == "1"
+
+        started = time.perf_counter()
+        slow = client.get("/slow/alice")
+        assert time.perf_counter() - started >= 0.15
+        assert slow.status_code in (200, 404) and slow.content
+
+        with pytest.raises(httpx.TransportError):
+            client.get("/reset/alice")
+
+    assert server.statuses[429] == 1 and server.statuses["reset"] == 1
+
+
+def test_redirecting_runs_unmodified_checks(server, capsys):
+    def check(username):
+        return orchestrator.status_validate(f"https://example.com/{username}", 404, 200)
+
+    module = types.ModuleType("fake.example")
+    module.__file__ = "<in-memory>/fake/example.py"
+    module.validate_example = check
+
+    names = [f"user{i}" for i in range(20)]
+    with standin.redirecting(server.url):
+        results = orchestrator.run_user_batch(names, ScanConfig(), modules=[module])
+        response = impersonate.impersonate_request("https://example.com/user0")
+
+    expected = {name: Status.TAKEN if server.is_taken(f"/{name}") else Status.AVAILABLE for name in names}
+    assert {r.username: r.status for r in results} == expected
+    assert response.status_code == (200 if expected["user0"] == Status.TAKEN else 404)
+    assert server.behaviours["profile"] == 21
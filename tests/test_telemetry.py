@@ -0,0 +1,87 @@
+import json
+import types
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import user_scanner.core.email_orchestrator  # noqa: F401  (installs the httpx hooks)
+from user_scanner.core import orchestrator, telemetry
+from user_scanner.core.helpers import ScanConfig
+from user_scanner.core.result import Result
+
+
+@pytest.fixture
+def stats():
+    collected = telemetry.Telemetry()
+    telemetry.set_telemetry(collected)
+    yield collected
+    telemetry.set_telemetry(None)
+
+
+def _module(name, validate):
+    module = types.ModuleType(f"fake.{name}")
+    module.__file__ = f"<in-memory>/fake/{name}.py"
+    setattr(module, f"validate_{name}", validate)
+    return module
+
+
+def test_histogram_buckets_and_quantiles():
+    hist = telemetry.Histogram()
+    for value in (0.01, 0.2, 0.2, 0.4, 30.0):
+        hist.observe(value)
+
+    assert hist.count == 5
+    assert hist.counts[0] == 1 and hist.counts[-1] == 1
+    assert hist.quantile(0.5) == 0.25
+    assert hist.quantile(1.0) == 30.0
+
+
+def test_checks_are_recorded_per_module(stats, capsys):
+    async def fetch(username):
+        # Streamed like a network body, so its bytes are counted as read.
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, stream=httpx.ByteStream(b"hello"))
+        )
+        async with httpx.AsyncClient(transport=transport, proxy=None) as client:
+            await client.get("https://example.com/" + username)
+        return Result.taken()
+
+    def blocking(username):
+        # Runs in a worker thread, which still reports to this check's probe.
+        telemetry.note_response(SimpleNamespace(status_code=503, content=b"busy"))
+        raise RuntimeError("boom")
+
+    modules = [_module("fetching", fetch), _module("blocking", blocking)]
+    orchestrator.run_user_batch(["a", "b"], ScanConfig(), modules=modules)
+
+    fetching = stats.modules["user/fetching"]
+    assert fetching.outcomes == {"found": 2}
+    assert fetching.http_statuses == {200: 2}
+    assert fetching.bytes == 10
+    assert fetching.execution.count == fetching.queue_wait.count == 2
+
+    blocking_stats = stats.modules["user/blocking"]
+    assert blocking_stats.outcomes == {"error": 2}
+    assert blocking_stats.http_statuses == {503: 2}
+
+    assert [name for name, _ in stats.flakiest()] == ["user/blocking"]
+    assert "user/blocking  100% of 2" in stats.summary()
+
+
+def test_exports(stats, tmp_path):
+    probe = telemetry.Probe("user/site")
+    probe.retries = 1
+    stats.record(probe, Result.available())
+
+    text = stats.to_prometheus()
+    assert 'user_scanner_check_duration_seconds_bucket{module="user/site",le="+Inf"} 1' in text
+    assert 'user_scanner_checks_total{module="user/site",outcome="not_found"} 1' in text
+    assert 'user_scanner_retries_total{module="user/site"} 1' in text
+
+    stats.export(tmp_path / "stats.prom")
+    assert (tmp_path / "stats.prom").read_text(encoding="utf-8") == text
+
+    stats.export(tmp_path / "stats.json")
+    data = json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))
+    assert data["modules"]["user/site"]["outcomes"] == {"not_found": 1}
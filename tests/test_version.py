@@ -1,5 +1,8 @@
 import json
 from types import SimpleNamespace
+
+import httpx
+
 from user_scanner.core import version
 
 
@@ -14,7 +17,7 @@ def test_load_local_version(tmp_path, monkeypatch):
 
 def test_get_pypi_version(monkeypatch):
     # Mock httpx.get to return an object with .json()
-    monkeypatch.setattr(version.httpx, "get",
+    monkeypatch.setattr(httpx, "get",
                         lambda url, timeout=7: SimpleNamespace(json=lambda: {"info": {"version": "1.2.3"}}))
     pv = version.get_pypi_version("http://fake")
     assert pv == "1.2.3"
@@ -1,12 +1,14 @@
 import argparse
+import atexit
 import json
 import os
 import sys
 import time
 
 from colorama import Fore, Style
-from itertools import islice
+from itertools import chain, islice
 from dataclasses import replace
+from typing import Iterable, Iterator, Optional, Tuple
 
 from user_scanner.cli.banner import print_banner
 from user_scanner.core import formatter
@@ -18,11 +20,6 @@ from user_scanner.core.cross_scan import (
     CrossScanConfig,
     run_cross_scan,
 )
-from user_scanner.core.email_orchestrator import (
-    run_email_category_batch,
-    run_email_full_batch,
-    run_email_module_batch,
-)
 from user_scanner.core.helpers import (
     ScanConfig,
     find_module,
@@ -30,23 +27,25 @@ from user_scanner.core.helpers import (
     get_site_name,
     is_loud,
     is_valid_email,
+    iter_target_file,
     load_categories,
+    load_config,
     load_modules,
     set_proxy_manager,
     find_category,
 )
-from user_scanner.core.orchestrator import (
-    run_user_category,
-    run_user_full,
-    run_user_module,
-)
+from user_scanner.core.breaker import get_breakers
+from user_scanner.core.coalesce import get_coalescing
+from user_scanner.core.handles import get_pruner, set_pruner
+from user_scanner.core.cache import get_cache, set_cache
+from user_scanner.core.columnar import ResultStore
 from user_scanner.core.result import Result, Status
+from user_scanner.core.sinks import Tally, add_sink, emit, has_failed, remove_sink
 from user_scanner.core.version import load_local_version
-from user_scanner.core.hudson import run_hudson_scan
 from user_scanner.utils.update import update_self
 from user_scanner.utils.updater_logic import check_for_updates
 from user_scanner.core.loud_prompt import check_loud_module_permission
-from user_scanner.core.patterns import expand_patterns_random, count_patterns
+from user_scanner.core.patterns import count_patterns, expand_patterns_random, parse_shard, shard_size
 
 # Color configs
 R = Fore.RED
@@ -66,6 +65,64 @@ def _csv_names(value) -> tuple:
     return tuple(name.strip() for name in raw.split(",") if name.strip())
 
 
+def _stream_target_file(path: str, is_email: bool) -> Iterator[str]:
+    """Targets from a -uf/-ef file, announcing the total once it is read.
+
+    The file is read while the scan runs, so a read error ends the run here
+    with the same message wherever in the file it comes.
+    """
+    kind = "email" if is_email else "username"
+
+    def skip(email: str) -> None:
+        print(f"{Y}[!] Skipping invalid email format: {email}{X}")
+
+    count = 0
+    try:
+        for target in iter_target_file(path, is_email, on_invalid=skip):
+            count += 1
+            yield target
+    except FileNotFoundError:
+        print(f"{R}[✘] Error: File not found: {path}{X}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"{R}[✘] Error reading {kind} file: {e}{X}")
+        sys.exit(1)
+
+    if count:
+        print(f"{C}[+] Loaded {count} {kind if count == 1 else kind + 's'} from {path}{X}")
+
+
+def _expand_targets(
+    names: Iterable[str], stop: int, seed: Optional[int] = None,
+    shard: Optional[Tuple[int, int]] = None, start: int = 0,
+) -> Iterator[str]:
+    """Expand each name's pattern lazily, capped at ``stop`` permutations.
+
+    With ``shard`` only that share of each pattern's permutations is scanned,
+    and ``start`` skips the first ones of it, which an earlier run with the
+    same ``seed`` already scanned.
+    """
+    for name in names:
+        total = count_patterns(name)
+        shown = min(max(0, shard_size(total, shard) - start), stop)
+        if shown > 1:
+            part = f" (shard {shard[0] + 1}/{shard[1]})" if shard else ""
+            if total > shown:
+                print(C + f"[+] Scanning {shown} of {total} permutations{part}" + Style.RESET_ALL)
+            else:
+                print(C + f"[+] Scanning {shown} permutations" + Style.RESET_ALL)
+        yield from islice(expand_patterns_random(name, seed=seed, shard=shard, start=start), stop)
+
+
+def _save_store(store: ResultStore, path: str) -> None:
+    try:
+        store.save(path)
+    except OSError as e:
+        print(f"{R}[✘] Error saving result store: {e}{X}")
+        return
+    print(G + f"\n[+] {len(store)} results stored in {path}" + Style.RESET_ALL)
+
+
 def main():
     if "--only-found" in sys.argv:
         print(f"{Fore.YELLOW}[!] The '--only-found' flag is deprecated and has been removed.{Style.RESET_ALL}")
@@ -129,6 +186,28 @@ def main():
         help="Limit permutations",
     )
 
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Scan only the I-th of N disjoint shares of each pattern's permutations, "
+        "to split one pattern across N machines",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for the order permutations are scanned in (default: random, "
+        "or 0 with --shard/--start-at)",
+    )
+
+    parser.add_argument(
+        "--start-at",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Skip the first N permutations of each pattern, to continue a run that scanned them",
+    )
+
     parser.add_argument(
         "-t",
         "--timeout",
@@ -140,14 +219,77 @@ def main():
         "-C",
         "--concurrency",
         type=int,
-        help="Override default concurrency limit (default: 60 for username, 25 for email scan)",
+        help="Ceiling on requests in flight; the window adapts beneath it "
+        "(default: 60 for username, 25 for email scan)",
+    )
+
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep exactly -C requests in flight instead of adapting the window "
+        "to observed latency and errors",
     )
 
     parser.add_argument(
         "-d", "--delay", type=float, default=0, help="Delay between requests"
     )
 
-    parser.add_argument("-f", "--format", choices=["csv", "json", "pdf"], help="Output format")
+    parser.add_argument(
+        "--host-rate",
+        type=float,
+        metavar="RPS",
+        help="Pace requests to any single host at RPS per second. Known "
+        "rate-limited hosts (GitHub, Reddit, Instagram) are paced by default; "
+        "0 disables pacing entirely",
+    )
+
+    parser.add_argument(
+        "--retries",
+        type=int,
+        metavar="N",
+        help="Retry a request up to N times on a timeout, dropped connection, "
+        "429 or 5xx, with jittered backoff (default: 2; 0 disables)",
+    )
+
+    parser.add_argument(
+        "--breaker",
+        type=int,
+        metavar="N",
+        help="Stop running a module's checks after N site failures in a row "
+        "(connection errors, timeouts, 429s, 5xx), probing again after --breaker-cooldown (default: 5; 0 disables)",
+    )
+
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        metavar="SECONDS",
+        help="How long a tripped module is paused before a probe (default: 30)",
+    )
+
+    parser.add_argument(
+        "--no-prune",
+        action="store_true",
+        help="Send every username to every module in batch scans, even ones "
+        "the site's username rules reject",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        metavar="N",
+        help="In batch scans, check up to N usernames per request on sites "
+        "with a multi-username endpoint (default: 50; 0 disables)",
+    )
+
+    parser.add_argument(
+        "--batch-interval",
+        type=float,
+        metavar="SECONDS",
+        help="How long a partly filled batch waits for more usernames before "
+        "it is sent (default: 0.1)",
+    )
+
+    parser.add_argument("-f", "--format", choices=["csv", "json", "jsonl", "pdf"], help="Output format")
 
     parser.add_argument(
         "--no-pdf-media",
@@ -157,6 +299,20 @@ def main():
 
     parser.add_argument("-o", "--output", type=str, help="Output file path")
 
+    parser.add_argument(
+        "--resume",
+        metavar="JOURNAL",
+        help="Continue an interrupted bulk scan from its checkpoint journal "
+        "(written next to a jsonl or csv -o as OUTPUT.checkpoint), skipping the checks it finished",
+    )
+
+    parser.add_argument(
+        "--store",
+        metavar="PATH",
+        help="Also save every result to a compact columnar file for analysis "
+        "(read it back with user_scanner.core.columnar.ResultStore.load)",
+    )
+
     parser.add_argument(
         "-P",
         "--proxy-file",
@@ -212,7 +368,7 @@ def main():
         "--cross-depth",
         type=int,
         default=DEFAULT_DEPTH,
-        help="Rounds of link-following. Each round pivots off the accounts the previous "
+        help="Hops of link-following. Each hop pivots off the accounts the previous "
         f"one found, reaching handles only a chain of links names (default: {DEFAULT_DEPTH})",
     )
 
@@ -227,6 +383,44 @@ def main():
         f"(default: {DEFAULT_SWEEP})",
     )
 
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Reuse recent verdicts from an on-disk cache instead of re-requesting "
+        "them; cached results are marked [cached] (default path: "
+        "~/.cache/user-scanner/results.sqlite3)",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        metavar="TTL",
+        help="How long cached verdicts stay fresh: one duration for found and not "
+        "found (e.g. 12h), or status=duration pairs such as found=30d,error=0 "
+        "(default: found=7d,not_found=1d,error=5m)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the result cache, even if enabled in config.json",
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="After the scan, list the slowest and flakiest modules from per-module "
+        "latency and outcome telemetry",
+    )
+
+    parser.add_argument(
+        "--stats-file",
+        metavar="PATH",
+        help="Save per-module telemetry histograms to PATH: Prometheus text for .prom/.txt, "
+        "JSON otherwise",
+    )
+
     parser.add_argument("-U", "--update", action="store_true", help="Update the tool")
 
     parser.add_argument(
@@ -251,6 +445,31 @@ def main():
         set_email_concurrency(args.concurrency)
         set_user_concurrency(args.concurrency)
 
+    if args.no_adaptive:
+        from user_scanner.core.email_orchestrator import set_adaptive as set_email_adaptive
+        from user_scanner.core.orchestrator import set_adaptive as set_user_adaptive
+        set_email_adaptive(False)
+        set_user_adaptive(False)
+
+    if args.host_rate is not None:
+        from user_scanner.core.ratelimit import set_host_rate
+        set_host_rate(args.host_rate)
+
+    if args.retries is not None:
+        from user_scanner.core.retry import set_retries
+        set_retries(args.retries)
+
+    if args.breaker is not None or args.breaker_cooldown is not None:
+        from user_scanner.core.breaker import configure_breakers
+        configure_breakers(args.breaker, args.breaker_cooldown)
+
+    if args.no_prune:
+        set_pruner(None)
+
+    if args.batch_size is not None or args.batch_interval is not None:
+        from user_scanner.core.coalesce import configure_coalescing
+        configure_coalescing(args.batch_size, args.batch_interval)
+
     if args.update:
         update_self()
         print(f"[{G}+{X}] {G}Update successful. Please restart the tool.{X}")
@@ -343,16 +562,35 @@ def main():
         parser.print_help()
         return
 
+    # The orchestrators pull in httpx, curl_cffi and rich's live display, which
+    # is most of the CLI's start-up time; --version, -lu and -le never get here.
+    from user_scanner.core.email_orchestrator import (
+        get_controller as get_email_controller,
+        run_email_batch,
+        run_email_category_batch,
+        run_email_full_batch,
+        run_email_module_batch,
+    )
+    from user_scanner.core.orchestrator import (
+        get_controller as get_user_controller,
+        run_user_batch,
+        run_user_category,
+        run_user_full,
+        run_user_module,
+    )
+
     if args.output and not args.format:
         ext = args.output.lower()
         if ext.endswith('.json'):
             args.format = 'json'
         elif ext.endswith('.csv'):
             args.format = 'csv'
+        elif ext.endswith(('.jsonl', '.ndjson')):
+            args.format = 'jsonl'
         elif ext.endswith('.pdf'):
             args.format = 'pdf'
         else:
-            print(f"\n{Fore.RED}[✘] Specify output format using -f (json, csv, pdf) or use a known file extension.{Style.RESET_ALL}")
+            print(f"\n{Fore.RED}[✘] Specify output format using -f (json, jsonl, csv, pdf) or use a known file extension.{Style.RESET_ALL}")
             sys.exit(1)
 
     # Initialize proxy manager if proxy file is provided
@@ -390,95 +628,85 @@ def main():
             print(f"{R}[✘] Error loading proxies: {e}{X}")
             sys.exit(1)
 
+    if (args.cache is not None or load_config().get("cache_results")) and not args.no_cache:
+        from user_scanner.core.cache import ResultCache, default_cache_path, parse_ttls
+        try:
+            ttls = parse_ttls(args.cache_ttl) if args.cache_ttl else None
+            set_cache(ResultCache(args.cache or default_cache_path(), ttls))
+            # Commits the pending writes when Ctrl-C or an error ends the scan early.
+            atexit.register(set_cache, None)
+        except (ValueError, OSError) as e:
+            print(f"{R}[✘] Error opening result cache: {e}{X}")
+            sys.exit(1)
+
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        print(f"{R}[✘] Error: {e}{X}")
+        sys.exit(1)
+    # Machines splitting a pattern, or a run picking up where one stopped,
+    # must walk the permutations in the same order.
+    seed = args.seed
+    if seed is None and (shard or args.start_at):
+        seed = 0
+
+    if args.stats or args.stats_file:
+        from user_scanner.core.telemetry import Telemetry, set_telemetry
+        set_telemetry(Telemetry())
+
     check_for_updates()
     print_banner()
 
 
-    # Handle bulk email file
-    if args.email_file:
-        try:
-            with open(args.email_file, "r", encoding="utf-8") as f:
-                emails = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                ]
-
-            # Validate email formats
-            valid_emails = []
-            for email in emails:
-                if is_valid_email(email):
-                    valid_emails.append(email)
-                else:
-                    print(f"{Y}[!] Skipping invalid email format: {email}{X}")
-
-            if not valid_emails:
-                print(f"{R}[✘] Error: No valid emails found in {args.email_file}{X}")
-                sys.exit(1)
+    # Bulk files are streamed: lines are read, filtered and expanded only as the
+    # scheduler asks for more work, so memory stays flat however long the file.
+    if args.email_file or args.username_file:
+        is_email = bool(args.email_file)
+        target_file = args.email_file or args.username_file
+        kind = "email" if is_email else "username"
+        names = _stream_target_file(target_file, is_email)
+        first_name = next(names, None)
 
-            print(
-                f"{C}[+] Loaded {len(valid_emails)} {'email' if len(valid_emails) == 1 else 'emails'} from {args.email_file}{X}"
-            )
-            is_email = True
-            targets_found = valid_emails
-        except FileNotFoundError:
-            print(f"{R}[✘] Error: File not found: {args.email_file}{X}")
-            sys.exit(1)
-        except Exception as e:
-            print(f"{R}[✘] Error reading email file: {e}{X}")
-            sys.exit(1)
-    # Handle bulk username file
-    elif args.username_file:
-        try:
-            with open(args.username_file, "r", encoding="utf-8") as f:
-                usernames = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                ]
-            if not usernames:
-                print(
-                    f"{R}[✘] Error: No valid usernames found in {args.username_file}{X}"
-                )
-                sys.exit(1)
-            print(
-                f"{C}[+] Loaded {len(usernames)} {'username' if len(usernames) == 1 else 'usernames'} from {args.username_file}{X}"
-            )
-            is_email = False
-            targets_found = usernames
-        except FileNotFoundError:
-            print(f"{R}[✘] Error: File not found: {args.username_file}{X}")
-            sys.exit(1)
-        except Exception as e:
-            print(f"{R}[✘] Error reading username file: {e}{X}")
+        if first_name is None:
+            print(f"{R}[✘] Error: No valid {kind}s found in {target_file}{X}")
             sys.exit(1)
+
+        targets = _expand_targets(chain([first_name], names), args.stop, seed, shard, args.start_at)
+        is_bulk = True
     else:
         is_email = args.email is not None
         if is_email and not is_valid_email(args.email):
             print(R + "[✘] Error: Invalid email format." + X)
             sys.exit(1)
 
-        target_name = args.username or args.email
-        targets_found = [target_name]
-
-    # Handle permutations (only for single username/email)
-
-    targets = []
-    for target_name in targets_found:
-        temp_targets = list(islice(expand_patterns_random(target_name), args.stop))
-        targets.extend(temp_targets)
-        if len(temp_targets) > 1:
-            total = count_patterns(target_name)
-            if total > len(temp_targets):
-                print(
-                    C + f"[+] Scanning {len(temp_targets)} of {total} permutations" + Style.RESET_ALL
-                )
-            else:
-                print(
-                    C + f"[+] Scanning {len(temp_targets)} permutations" + Style.RESET_ALL
-                )
+        first_name = args.username or args.email
+        targets = list(_expand_targets([first_name], args.stop, seed, shard, args.start_at))
+        if not targets:
+            print(f"{Y}[!] No permutations left to scan (--shard/--start-at){X}")
+            sys.exit(0)
+        is_bulk = len(targets) > 1
 
     results = []
+    # JSON Lines and CSV output are written as results land rather than at
+    # the end, so a long bulk scan keeps what it found if it is interrupted.
+    # Unless --cross-scan needs them, batch results are then not held in memory.
+    tally = Tally()
+    stream = None
+    if args.output and not args.output.lower().endswith(".pdf"):
+        if args.format == "jsonl":
+            stream = formatter.JsonlWriter(args.output)
+        elif args.format == "csv":
+            stream = formatter.CsvWriter(args.output)
+    if stream is not None:
+        add_sink(stream)
+        add_sink(tally)
+    collect = stream is None or bool(args.cross_scan)
+    # A columnar store takes results from the same stream, whatever -f is.
+    store = None
+    if args.store:
+        store = ResultStore()
+        add_sink(store)
+
     show_all = args.all
     if args.module and not args.all:
         raw_module_str = ",".join(args.module) if isinstance(args.module, list) else args.module
@@ -544,58 +772,136 @@ def main():
                     sys.exit(1)
                 validated_categories.append(cat_path)
 
-    for i, target in enumerate(targets):
-        if i != 0 and args.delay:
-            time.sleep(args.delay)
-
-        if is_email:
-            print(f"\n{Fore.CYAN} Checking email: {target}{Style.RESET_ALL}")
-        else:
-            print(f"\n{Fore.CYAN} Checking username: {target}{Style.RESET_ALL}")
-
-
-        if args.hudson_scan:
-            run_hudson_scan(target, is_email)
-            continue
+    # A -m run that names a loud module prompts per target, so it keeps the
+    # one-target-at-a-time loop; so does --delay, which paces whole targets.
+    loud_requested = not config.allow_loud and any(
+        is_loud(get_site_name(module), is_email) for module in validated_modules
+    )
+    in_batch = is_bulk and not (args.hudson_scan or args.delay or loud_requested)
+
+    # Bulk scans streaming to a file keep a checkpoint journal beside it, so a
+    # run that dies part-way can be resumed instead of restarted. JSON and PDF
+    # reports are written at the end, so an interrupted one has nothing to
+    # resume into.
+    journal = None
+    if args.resume and not in_batch:
+        print(f"{R}[✘] Error: --resume needs a bulk scan run in one batch (-uf/-ef, without --delay, --hudson or loud -m modules){X}")
+        sys.exit(1)
+    if args.resume and stream is None:
+        print(f"{R}[✘] Error: --resume needs results streamed to a file (-o with -f jsonl or csv){X}")
+        sys.exit(1)
+    if args.resume and args.cross_scan:
+        print(f"{R}[✘] Error: --resume cannot be used with --cross-scan {X}")
+        sys.exit(1)
+    if args.resume and not os.path.exists(args.resume):
+        print(f"{R}[✘] Error: Checkpoint journal not found: {args.resume}{X}")
+        sys.exit(1)
+    if in_batch and stream is not None:
+        from user_scanner.core.checkpoint import Journal, journal_path, set_journal
 
+        path = args.resume or journal_path(args.output)
+        try:
+            if not args.resume and os.path.exists(path):
+                os.remove(path)  # Left by an earlier run this one does not resume.
+            journal = Journal(path, "email" if is_email else "username")
+        except (ValueError, OSError) as e:
+            print(f"{R}[✘] Error opening checkpoint journal: {e}{X}")
+            sys.exit(1)
+        set_journal(journal)
+        # Stops with the output file, so it never vouches for a lost result.
+        add_sink(journal, requires=(stream,))
+        if args.resume:
+            print(f"{G}[+] Resuming: skipping {journal.resumed} checks already done in {path}{X}")
 
+    if in_batch:
         if args.module:
-            fn = run_email_module_batch if is_email else run_user_module
-            modules_to_run = []
-            for module in validated_modules:
-                site_name = get_site_name(module)
-                if not config.allow_loud and is_loud(site_name, is_email):
-                    if not check_loud_module_permission(site_name, target):
-                        skipped = Result.skipped().update(
-                            site_name=site_name,
-                            username=target,
-                            category=find_category(module) or "Unknown",
-                            is_email=is_email,
-                        )
-                        skipped.show(config)
-                        results.append(skipped)
-                        continue
-                    per_module_config = replace(config, allow_loud=True)
-                    results.extend(fn(module, target, per_module_config))
-                else:
-                    modules_to_run.append(module)
+            batch_modules = validated_modules
+        elif args.category:
+            batch_modules = [m for cat_path in validated_categories for m in load_modules(cat_path)]
+        else:
+            batch_modules = None
 
-            if modules_to_run:
-                results.extend(fn(modules_to_run, target, config))
+        label = "emails" if is_email else "usernames"
+        print(f"\n{C}[+] Scanning {label} in one batch{X}")
+        fn = run_email_batch if is_email else run_user_batch
+        try:
+            results.extend(fn(targets, config, batch_modules, collect=collect))
+        except KeyboardInterrupt:
+            if stream is not None:
+                stream.close()
+            if store is not None:
+                _save_store(store, args.store)
+            if journal is not None:
+                set_journal(None)
+                print(f"\n{Y}[!] Interrupted. Continue with --resume {journal.path}{X}")
+            sys.exit(130)
+
+        if journal is not None:
+            lost = has_failed(journal)
+            remove_sink(journal)
+            set_journal(None)
+            if lost:
+                print(f"\n{Y}[!] Not every result was saved; continue with --resume {journal.path}{X}")
+            elif journal.failed:
+                print(f"\n{Y}[i] {journal.failed} checks ended in errors; retry just those with --resume {journal.path}{X}")
+            else:
+                journal.discard()
+    else:
+        for i, target in enumerate(targets):
+            if i != 0 and args.delay:
+                time.sleep(args.delay)
 
-        elif args.category:
-            fn = run_email_category_batch if is_email else run_user_category
-            for cat_path in validated_categories:
-                results.extend(
-                    fn(
-                        cat_path,
-                        target,
-                        config,
+            if is_email:
+                print(f"\n{Fore.CYAN} Checking email: {target}{Style.RESET_ALL}")
+            else:
+                print(f"\n{Fore.CYAN} Checking username: {target}{Style.RESET_ALL}")
+
+
+            if args.hudson_scan:
+                from user_scanner.core.hudson import run_hudson_scan
+
+                run_hudson_scan(target, is_email)
+                continue
+
+
+            if args.module:
+                fn = run_email_module_batch if is_email else run_user_module
+                modules_to_run = []
+                for module in validated_modules:
+                    site_name = get_site_name(module)
+                    if not config.allow_loud and is_loud(site_name, is_email):
+                        if not check_loud_module_permission(site_name, target):
+                            skipped = Result.skipped().update(
+                                site_name=site_name,
+                                username=target,
+                                category=find_category(module) or "Unknown",
+                                is_email=is_email,
+                            )
+                            skipped.show(config)
+                            emit(skipped)
+                            results.append(skipped)
+                            continue
+                        per_module_config = replace(config, allow_loud=True)
+                        results.extend(fn(module, target, per_module_config))
+                    else:
+                        modules_to_run.append(module)
+
+                if modules_to_run:
+                    results.extend(fn(modules_to_run, target, config))
+
+            elif args.category:
+                fn = run_email_category_batch if is_email else run_user_category
+                for cat_path in validated_categories:
+                    results.extend(
+                        fn(
+                            cat_path,
+                            target,
+                            config,
+                        )
                     )
-                )
-        else:
-            fn = run_email_full_batch if is_email else run_user_full
-            results.extend(fn(target, config))
+            else:
+                fn = run_email_full_batch if is_email else run_user_full
+                results.extend(fn(target, config))
 
 
     if args.hudson_scan:
@@ -617,10 +923,25 @@ def main():
             )
         )
 
+    remove_sink(tally)
+    if stream is not None:
+        failed = has_failed(stream)
+        remove_sink(stream)
+        try:
+            stream.close()
+        except OSError:
+            if not failed:
+                raise  # Otherwise already reported when its write failed.
+    if store is not None:
+        remove_sink(store)
+        _save_store(store, args.store)
+
     is_pdf_export = args.format == "pdf" or (args.output and args.output.lower().endswith(".pdf"))
 
-    if args.output or is_pdf_export:
-        output_path = args.output or f"{targets_found[0] if targets_found else 'target'}_report.pdf"
+    if stream is not None:
+        print(G + f"\n[+] {stream.count} results streamed to {stream.path}" + Style.RESET_ALL)
+    elif args.output or is_pdf_export:
+        output_path = args.output or f"{first_name}_report.pdf"
 
         if is_pdf_export:
             version_str, _ = load_local_version()
@@ -630,7 +951,7 @@ def main():
             try:
                 pdf_bytes = formatter.into_pdf(
                     results,
-                    target=targets_found[0] if targets_found else "Target",
+                    target=first_name,
                     scan_type=scan_type_str,
                     total_modules=len(results),
                     include_media=not args.no_pdf_media,
@@ -660,23 +981,13 @@ def main():
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             print(G + f"\n[+] Results saved to {output_path}" + Style.RESET_ALL)
-        else:
-            content = formatter.into_csv(results) if args.format == "csv" else formatter.into_json(results)
-            try:
-                with open(output_path, "r", encoding="utf-8") as init_file:
-                    has_content = init_file.read().strip() != ""
-            except Exception:
-                has_content = False
-
-            with open(output_path, "a", encoding="utf-8") as f:
-                if has_content:
-                    f.write("\n")
-                f.write(content)
-            print(G + f"\n[+] Results saved to {output_path}" + Style.RESET_ALL)
 
 
-    total_found = len([r for r in results if r.is_found()])
-    total_skipped = len([r for r in results if r.status == Status.SKIPPED])
+    if collect:
+        total_found = len([r for r in results if r.is_found()])
+        total_skipped = len([r for r in results if r.status == Status.SKIPPED])
+    else:
+        total_found, total_skipped = tally.found, tally.skipped
 
     if not config.show_all and total_found == 0 and total_skipped == 0:
         print(f"\n{R}[✘] No results found for the given target(s).{X}")
@@ -687,5 +998,39 @@ def main():
             print(f"  {Y}Reason for skip: Module(s) notify{X} (but only if target exists there) {Y}the target with password reset email(s){X}")
             print(f"  {Y}Use {G}--allow-loud{X}{Y} to include those module(s) to be scanned{X}")
 
+    controller = get_email_controller() if is_email else get_user_controller()
+    if controller.completed:
+        print(f"  {C}Concurrency:{X} {controller.summary()}")
+
+    breakers = get_breakers()
+    if breakers is not None and breakers.tripped():
+        print(f"  {Y}Circuit breakers:{X} {breakers.summary()}")
+
+    pruner = get_pruner()
+    if pruner is not None and pruner.total:
+        print(f"  {C}Pruned:{X} {pruner.summary()}")
+
+    coalescing = get_coalescing()
+    if coalescing is not None and coalescing.total:
+        print(f"  {C}Batched:{X} {coalescing.summary()}")
+
+    cache = get_cache()
+    if cache is not None:
+        print(f"  {C}Cache:{X} {cache.hits} hit(s), {cache.misses} miss(es)")
+        set_cache(None)
+
+    if args.stats or args.stats_file:
+        from user_scanner.core.telemetry import get_telemetry, set_telemetry
+        telemetry = get_telemetry()
+        if args.stats:
+            print(f"\n{C}[i] Module telemetry{X}\n{telemetry.summary()}")
+        if args.stats_file:
+            try:
+                telemetry.export(args.stats_file)
+                print(G + f"\n[+] Module telemetry saved to {args.stats_file}" + Style.RESET_ALL)
+            except OSError as e:
+                print(f"\n{R}[✘] Failed to save module telemetry: {e}{X}")
+        set_telemetry(None)
+
 if __name__ == "__main__":
     main()
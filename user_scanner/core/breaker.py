@@ -0,0 +1,160 @@
+"""Per-module circuit breakers for bulk scans.
+
+When a site is down or has blocked us, every later target still runs its
+check and waits out the module timeout, and a 10k-target batch spends hours
+of concurrency slots on it. Each module gets a breaker instead. After
+``threshold`` site failures in a row — transport errors, timeouts, 429s and
+5xx, not errors about the username itself — it opens, and the orchestrators answer that
+module's checks at once with a "circuit open" error, without taking a slot.
+After ``cooldown`` seconds one check is let through as a probe. If the probe
+succeeds the breaker closes; if it fails the breaker opens for another
+cooldown.
+
+Short-circuited checks are errors, not verdicts, so a checkpointed batch
+keeps them in its journal's to-do set and ``--resume`` runs them again.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+from user_scanner.core import telemetry
+from user_scanner.core.result import Result, Status
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+DEFAULT_THRESHOLD = 5
+DEFAULT_COOLDOWN = 30.0
+
+# "[503] Status didn't match", "HTTP 502", ... as the validators word them.
+_SERVER_ERROR = re.compile(r"\b5\d\d\b")
+
+
+def is_site_failure(result: Result) -> bool:
+    """Whether an error says the site is unreachable or failing, not the username invalid."""
+    if result.status != Status.ERROR:
+        return False
+    import httpx  # Imported here: the CLI imports this module even when it never scans.
+
+    from user_scanner.core.concurrency import is_congestion
+
+    if is_congestion(result):
+        return True
+    # curl_cffi's errors are OSErrors.
+    if isinstance(result.reason, (httpx.HTTPError, OSError)):
+        return True
+    return bool(_SERVER_ERROR.search(str(result.reason or "")))
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD, cooldown: float = DEFAULT_COOLDOWN, clock: Callable[[], float] = time.monotonic):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0  # In a row.
+        self.rejected = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probe_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a check may run now; the one that half-opens the breaker is its probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = self._clock()
+            # A probe that never reported back (cancelled, say) does not keep
+            # the breaker shut for good.
+            probe_due = self._probe_at is None or now - self._probe_at >= self.cooldown
+            if now - self._opened_at >= self.cooldown and probe_due:
+                self.state = HALF_OPEN
+                self._probe_at = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, result: Result) -> None:
+        if result.status == Status.SKIPPED:
+            return
+        with self._lock:
+            if not is_site_failure(result):
+                self.state = CLOSED
+                self.failures = 0
+                self._probe_at = None
+                return
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.threshold):
+                self.state = OPEN
+                self.trips += 1
+                self._opened_at = self._clock()
+                self._probe_at = None
+
+    def rejection(self) -> Result:
+        retry_in = max(0.0, self.cooldown - (self._clock() - self._opened_at))
+        return Result.error(
+            f"Circuit open: {self.failures} errors in a row, checks paused (next probe in {retry_in:.0f}s)"
+        )
+
+
+class Breakers:
+    """One breaker per module, made on first use."""
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD, cooldown: float = DEFAULT_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_module(self, module: ModuleType, is_email: bool = False) -> CircuitBreaker:
+        name = telemetry.module_name(module, is_email)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(name, CircuitBreaker(self.threshold, self.cooldown))
+        return breaker
+
+    def tripped(self) -> List[Tuple[str, CircuitBreaker]]:
+        """Modules whose breaker opened during the run, most checks rejected first."""
+        tripped = [(name, b) for name, b in self._breakers.items() if b.trips]
+        return sorted(tripped, key=lambda item: item[1].rejected, reverse=True)
+
+    def summary(self) -> str:
+        tripped = self.tripped()
+        states = Counter(b.state for _, b in tripped)
+        rejected = sum(b.rejected for _, b in tripped)
+        names = ", ".join(name.split("/", 1)[1] for name, _ in tripped[:5])
+        more = f" (+{len(tripped) - 5} more)" if len(tripped) > 5 else ""
+        return (
+            f"{len(tripped)} module(s) tripped ({names}{more}); {rejected} check(s) short-circuited, "
+            f"{states[OPEN]} still open"
+        )
+
+
+_breakers: Optional[Breakers] = Breakers()
+
+
+def set_breakers(breakers: Optional[Breakers]) -> None:
+    global _breakers
+    _breakers = breakers
+
+
+def get_breakers() -> Optional[Breakers]:
+    return _breakers
+
+
+def configure_breakers(threshold: Optional[int] = None, cooldown: Optional[float] = None) -> None:
+    """Trip after ``threshold`` errors in a row (0 turns breakers off); None keeps a default."""
+    threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+    cooldown = DEFAULT_COOLDOWN if cooldown is None else cooldown
+    set_breakers(Breakers(threshold, cooldown) if threshold > 0 else None)
+
+
+def get_breaker(module: ModuleType, is_email: bool = False) -> Optional[CircuitBreaker]:
+    """The module's breaker; None when circuit breaking is off."""
+    return _breakers.for_module(module, is_email) if _breakers is not None else None
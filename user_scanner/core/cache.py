@@ -0,0 +1,181 @@
+"""Opt-in on-disk cache of module verdicts, keyed by (module, target).
+
+Investigations re-run the same handle over and over, and a cross-scan sweep
+re-checks handles the first pass already covered. A fresh verdict from
+minutes ago is as good as a new request, so with ``--cache`` the orchestrators
+look here first and only touch the network on a miss.
+
+How long a verdict stays fresh depends on what it says: an account that
+exists rarely disappears, a free handle may be claimed any day, and an error
+is worth retrying almost at once. TTLs are applied when an entry is read, so
+changing them with ``--cache-ttl`` also re-judges everything already stored.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from user_scanner.core.result import Result, Status
+
+DAY = 24 * 60 * 60
+
+DEFAULT_TTLS: Dict[Status, float] = {
+    Status.TAKEN: 7 * DAY,
+    Status.AVAILABLE: DAY,
+    Status.ERROR: 5 * 60,
+    # A skip reflects this run's --allow-loud choice, not the site.
+    Status.SKIPPED: 0,
+}
+
+# How --cache-ttl names each status.
+TTL_NAMES = {
+    "found": Status.TAKEN,
+    "taken": Status.TAKEN,
+    "available": Status.AVAILABLE,
+    "not_found": Status.AVAILABLE,
+    "error": Status.ERROR,
+}
+
+_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": DAY}
+
+
+def default_cache_path() -> Path:
+    env = os.environ.get("USER_SCANNER_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "user-scanner" / "results.sqlite3"
+
+
+def parse_duration(value: str) -> float:
+    """``"90"``, ``"15m"``, ``"12h"`` or ``"7d"`` as seconds."""
+    value = value.strip().lower()
+    if value and value[-1] in _UNITS:
+        return float(value[:-1]) * _UNITS[value[-1]]
+    return float(value)
+
+
+def parse_ttls(spec: str) -> Dict[Status, float]:
+    """Parse ``--cache-ttl``.
+
+    A bare duration applies to found and not-found verdicts alike; otherwise
+    a comma-separated list of ``status=duration`` pairs, e.g.
+    ``found=30d,error=0``. Unnamed statuses keep their defaults.
+    """
+    ttls = dict(DEFAULT_TTLS)
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        if "=" not in part:
+            seconds = parse_duration(part)
+            ttls[Status.TAKEN] = ttls[Status.AVAILABLE] = seconds
+            continue
+        name, _, duration = part.partition("=")
+        status = TTL_NAMES.get(name.strip().lower().replace("-", "_"))
+        if status is None:
+            raise ValueError(f"Unknown status in --cache-ttl: {name.strip()!r}")
+        ttls[status] = parse_duration(duration)
+    return ttls
+
+
+def module_key(module, category: str, is_email: bool) -> str:
+    kind = "email" if is_email else "user"
+    return f"{kind}/{category.lower()}/{module.__name__.split('.')[-1]}"
+
+
+class ResultCache:
+    """SQLite-backed store of serialised Results.
+
+    One connection is shared by the event loop and worker threads; writes are
+    committed in batches since a scan produces hundreds of them a second.
+    """
+
+    COMMIT_EVERY = 200
+
+    def __init__(self, path: str | Path, ttls: Optional[Dict[Status, float]] = None):
+        self.path = Path(path)
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " module TEXT NOT NULL, target TEXT NOT NULL, status INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL, payload TEXT NOT NULL,"
+            " PRIMARY KEY (module, target))"
+        )
+
+    def get(self, module: str, target: str) -> Optional[Result]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, stored_at, payload FROM results WHERE module = ? AND target = ?",
+                (module, target),
+            ).fetchone()
+
+        if row is not None:
+            status = Status(row[0])
+            if time.time() - row[1] < self.ttls.get(status, 0):
+                self.hits += 1
+                result = _decode(status, row[2])
+                result.from_cache = True
+                return result
+
+        self.misses += 1
+        return None
+
+    def put(self, module: str, target: str, result: Result) -> None:
+        if self.ttls.get(result.status, 0) <= 0:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (module, target, result.status.value, time.time(), _encode(result)),
+            )
+            self._pending += 1
+            if self._pending >= self.COMMIT_EVERY:
+                self._db.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+
+def _encode(result: Result) -> str:
+    return json.dumps(
+        {
+            "reason": result.get_reason() if result.has_reason() else None,
+            "url": result.url,
+            "extra": result.extra,
+            "media": result.media,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _decode(status: Status, payload: str) -> Result:
+    data = json.loads(payload)
+    return Result(status, data.get("reason"), url=data.get("url"), extra=data.get("extra"), media=data.get("media"))
+
+
+_cache: Optional[ResultCache] = None
+
+
+def set_cache(cache: Optional[ResultCache]) -> None:
+    global _cache
+    if _cache is not None and _cache is not cache:
+        _cache.close()
+    _cache = cache
+
+
+def get_cache() -> Optional[ResultCache]:
+    return _cache
@@ -0,0 +1,131 @@
+"""Checkpoint journal that lets an interrupted bulk scan pick up where it stopped.
+
+A ``-uf``/``-ef`` run over a large file can die hours in — out of memory, a
+dead proxy list, Ctrl-C — and nothing recorded which (target, module) pairs
+had finished, so the only way on was to start over. The journal is a sink on
+the result stream: every pair that reached a verdict is appended as one
+``target<TAB>Site`` line the moment it lands. ``--resume`` loads it back and
+the batch scheduler skips those pairs, so only the remainder is requested.
+
+Only found / not found verdicts are recorded. An error — the usual symptom of
+the proxy death that killed the run — is not a verdict, so a resumed scan
+retries it; a loud skip reflects this run's flags rather than the site.
+"""
+
+import os
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Optional, Set, Tuple
+
+from user_scanner.core.helpers import get_site_name
+from user_scanner.core.result import Result, Status
+
+SUFFIX = ".checkpoint"
+
+_HEADER = "# user-scanner checkpoint: "
+
+_DONE = (Status.TAKEN, Status.AVAILABLE)
+
+
+def journal_path(output: str) -> Path:
+    """Where the journal for a run writing to ``output`` lives."""
+    return Path(output + SUFFIX)
+
+
+class Journal:
+    """Append-only record of the pairs a scan has finished.
+
+    Opening an existing journal loads the pairs it holds; new ones are appended
+    to the same file, so a run may be resumed any number of times. Each line is
+    flushed as written and the file is fsynced at most every ``fsync_interval``
+    seconds, the same durability the JSON Lines output gives its results.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        kind: str,
+        fsync_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = Path(path)
+        self.kind = kind
+        self.completed: Set[Tuple[str, str]] = set()
+        self.resumed = 0
+        self.failed = 0
+        if self.path.exists():
+            self._load()
+        self.resumed = len(self.completed)
+
+        fresh = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = open(self.path, "a", encoding="utf-8")
+        if fresh:
+            self._file.write(f"{_HEADER}{kind}\n")
+            self._file.flush()
+        self._fsync_interval = fsync_interval
+        self._clock = clock
+        self._synced_at = clock()
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line.startswith(_HEADER):
+                    kind = line[len(_HEADER):]
+                    if kind != self.kind:
+                        raise ValueError(
+                            f"{self.path} is a checkpoint for a {kind} scan, not a {self.kind} scan"
+                        )
+                    continue
+                target, sep, site = line.rpartition("\t")
+                # A line cut short by the crash being resumed from is ignored.
+                if sep and target:
+                    self.completed.add((target, site))
+
+    def done(self, target: str, module: ModuleType) -> bool:
+        return (target, get_site_name(module).capitalize()) in self.completed
+
+    def write(self, result: Result) -> None:
+        if result.status not in _DONE:
+            if result.status == Status.ERROR:
+                self.failed += 1
+            return
+        if result.username is None or result.site_name is None:
+            return
+        pair = (result.username, result.site_name)
+        if pair in self.completed:
+            return
+        self.completed.add(pair)
+        self._file.write(f"{pair[0]}\t{pair[1]}\n")
+        self._file.flush()
+        now = self._clock()
+        if now - self._synced_at >= self._fsync_interval:
+            os.fsync(self._file.fileno())
+            self._synced_at = now
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the journal once there is nothing left to resume."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+_journal: Optional[Journal] = None
+
+
+def set_journal(journal: Optional[Journal]) -> None:
+    global _journal
+    if _journal is not None and _journal is not journal:
+        _journal.close()
+    _journal = journal
+
+
+def get_journal() -> Optional[Journal]:
+    return _journal
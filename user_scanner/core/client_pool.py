@@ -0,0 +1,223 @@
+"""Shared connection pools behind the scanners' ``httpx.AsyncClient``s.
+
+Most email modules open ``async with httpx.AsyncClient(...)`` for a single
+check, so every email × site paid a fresh TCP + TLS (often HTTP/2) handshake,
+and a bulk scan re-did it with the same host once per target. The pool keeps
+one transport per (http2, proxy, verify) for the running event loop; clients
+built over it share its keep-alive connections while keeping their own
+cookies, headers and timeouts — timeouts travel with each request in httpx,
+so they need no pool of their own. Proxies set in the environment
+(``HTTPS_PROXY`` and friends) are honoured through pooled transports too.
+
+Modules do not need rewriting: ``email_orchestrator`` passes every
+``AsyncClient`` constructed during a scan through ``adopt``. New code can ask
+for a pooled client outright with ``pooled_client(...)``.
+
+The same choke point lets ``replay`` swap the network out: while a transport
+override is set, every client the scanner builds — pooled or not, sync or
+async — is handed that transport instead.
+"""
+
+import asyncio
+import ipaddress
+import weakref
+from typing import Any, Coroutine, Dict, Optional, Tuple, TypeVar
+from urllib.request import getproxies
+
+import httpx
+
+from user_scanner.core import retry
+
+T = TypeVar("T")
+
+PoolKey = Tuple[bool, Optional[str], bool]
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+# A client built with any of these wants its own transport, so it keeps one.
+_UNPOOLABLE = ("transport", "mounts", "cert", "limits", "proxies", "app")
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """A pooled transport as one client sees it: closing the client leaves it
+    open. Requests through it are retried under the ``retry`` policy."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await retry.send_async(request, self.transport.handle_async_request)
+
+    async def aclose(self) -> None:
+        pass  # Owned by the pool, which closes it when the scan's loop is done.
+
+
+class AsyncClientPool:
+    def __init__(self, limits: httpx.Limits = DEFAULT_LIMITS):
+        self.limits = limits
+        # Connections belong to the loop that opened them, so each loop gets
+        # its own set; a loop that is gone takes its entry with it.
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[PoolKey, _SharedTransport]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def transport(
+        self, http2: bool = False, proxy: Optional[str] = None, verify: bool = True
+    ) -> httpx.AsyncBaseTransport:
+        if _override is not None:
+            return _SharedTransport(_override)
+        per_loop = self._transports.setdefault(asyncio.get_running_loop(), {})
+        key = (bool(http2), proxy, verify)
+        shared = per_loop.get(key)
+        if shared is None:
+            shared = per_loop[key] = _SharedTransport(
+                httpx.AsyncHTTPTransport(
+                    http2=bool(http2), proxy=proxy, verify=verify, limits=self.limits
+                )
+            )
+        return shared
+
+    def size(self) -> int:
+        """Transports open for the running loop."""
+        return len(self._transports.get(asyncio.get_running_loop(), {}))
+
+    async def aclose(self) -> None:
+        """Close the running loop's connections; call before the loop ends."""
+        transports = self._transports.pop(asyncio.get_running_loop(), {})
+        for shared in transports.values():
+            await shared.transport.aclose()
+
+
+_pool = AsyncClientPool()
+_override: Optional[Any] = None
+
+
+def get_client_pool() -> AsyncClientPool:
+    return _pool
+
+
+def set_transport_override(transport: Optional[Any]) -> None:
+    """Serve every client from ``transport`` (sync and async); None restores the network."""
+    global _override
+    _override = transport
+
+
+def get_transport_override() -> Optional[Any]:
+    return _override
+
+
+def _environment_proxies() -> Dict[str, Optional[str]]:
+    """Mount patterns for the environment's proxy settings: a proxy URL, or
+    None where ``NO_PROXY`` sends a host direct.
+
+    The same mapping httpx builds for a client left to read the environment.
+    """
+    settings = getproxies()
+    mounts: Dict[str, Optional[str]] = {}
+    # Only HTTP proxies: getproxies() also returns entries such as ftp.
+    for scheme in ("http", "https", "all"):
+        url = settings.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+
+    for host in (host.strip() for host in settings.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host.split("/")[0])
+        except ValueError:
+            address = None
+        if isinstance(address, ipaddress.IPv6Address):
+            mounts[f"all://[{host}]"] = None
+        elif address is not None or host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        else:
+            # ".example.com" covers its subdomains; "example.com" the domain too.
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+def env_mounts(
+    http2: bool = False, verify: bool = True
+) -> Dict[str, Optional[httpx.AsyncBaseTransport]]:
+    """Pooled transports for the ``HTTP(S)_PROXY``/``ALL_PROXY``/``NO_PROXY``
+    settings, mounted the way httpx mounts them for a client without one.
+
+    A client given ``transport=`` no longer reads the environment, so a pooled
+    client has to be handed these too, or it would bypass the user's proxy.
+    """
+    return {
+        pattern: None if url is None else _pool.transport(http2=http2, proxy=url, verify=verify)
+        for pattern, url in _environment_proxies().items()
+    }
+
+
+def apply_override(kwargs: Dict[str, Any]) -> bool:
+    """Point a client about to be built at the override transport, if one is set."""
+    if _override is None:
+        return False
+    for name in ("transport", "mounts", "proxy", "proxies", "app"):
+        kwargs.pop(name, None)
+    kwargs["transport"] = _override
+    return True
+
+
+def adopt(kwargs: Dict[str, Any]) -> None:
+    """Point an ``AsyncClient(**kwargs)`` about to be built at a pooled transport.
+
+    Leaves ``kwargs`` alone outside a running loop, or when the caller brought
+    its own transport or options a shared transport cannot honour.
+    """
+    if apply_override(kwargs):
+        kwargs["transport"] = _SharedTransport(kwargs["transport"])
+        return
+    if any(name in kwargs for name in _UNPOOLABLE):
+        return
+    verify = kwargs.get("verify", True)
+    proxy = kwargs.get("proxy")
+    if not isinstance(verify, bool) or not (proxy is None or isinstance(proxy, str)):
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    # A proxy passed to the client would get a private transport of its own.
+    kwargs.pop("proxy", None)
+    http2 = kwargs.get("http2", False)
+    kwargs["transport"] = _pool.transport(http2=http2, proxy=proxy, verify=verify)
+    if proxy is None and kwargs.get("trust_env", True):
+        mounts = env_mounts(http2, verify)
+        if mounts:
+            kwargs["mounts"] = mounts
+
+
+def pooled_client(**kwargs: Any) -> httpx.AsyncClient:
+    """An ``httpx.AsyncClient`` over the running loop's shared connections."""
+    adopt(kwargs)
+    return httpx.AsyncClient(**kwargs)
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """``asyncio.run`` that closes the pooled connections before the loop goes.
+
+    For one-off loops; scans run on ``session``, whose loop keeps its
+    connections from one call to the next.
+    """
+
+    async def _main() -> T:
+        try:
+            return await coro
+        finally:
+            await _pool.aclose()
+
+    return asyncio.run(_main())
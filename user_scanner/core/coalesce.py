@@ -0,0 +1,182 @@
+"""Coalesce one site's pending checks into a single multi-username request.
+
+A few sites answer for many usernames in one request: GitHub's GraphQL API,
+GitLab's GraphQL ``users(usernames:)``, Bluesky's ``getProfiles`` and
+Mojang's bulk name lookup. A batch scan still sent them one request per
+username. A module can now define, next to ``validate_<site>``::
+
+    BATCH_SIZE = 10  # the most usernames the endpoint takes (0: none)
+
+    def validate_<site>_batch(usernames):
+        return {username: Result, ...}
+
+In a batch scan (``stream_user_batch``) such a module's checks do not each
+send a request: they join the module's open batch, which is sent when it holds
+``max_size`` usernames (the smaller of ``--batch-size`` and ``BATCH_SIZE``) or
+``interval`` seconds after it opened, whichever comes first, and takes one
+concurrency slot. Usernames the batch function leaves out of its answer — all
+of them, if it raises — are checked one by one with ``validate_<site>``, so a
+batch function only answers for the usernames it is sure of.
+"""
+
+import asyncio
+import copy
+from collections import Counter
+from types import ModuleType
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from user_scanner.core import telemetry
+from user_scanner.core.result import Result
+
+DEFAULT_MAX_SIZE = 50
+DEFAULT_INTERVAL = 0.1
+
+BatchFunc = Callable[[List[str]], Dict[str, Result]]
+# Sends one batch for a module; None when it failed and every username
+# should be checked on its own.
+Sender = Callable[[ModuleType, BatchFunc, List[str]], Awaitable[Optional[Dict[str, Result]]]]
+
+
+def batch_func(module: ModuleType) -> Optional[BatchFunc]:
+    """The module's ``validate_<site>_batch``, if it has one."""
+    from user_scanner.core import rules  # Imports httpx; the CLI only needs the settings.
+
+    if rules.rule_for(module) is not None:
+        # Rule modules run on the shared engine and are never imported.
+        return None
+    return getattr(module, f"validate_{module.__name__.rsplit('.', 1)[-1]}_batch", None)
+
+
+class Coalescer:
+    """The open batch of one module's pending checks in one scan."""
+
+    def __init__(self, module: ModuleType, func: BatchFunc, max_size: int, batches: "Batches"):
+        self.module = module
+        self.func = func
+        self.max_size = max_size
+        self._batches = batches
+        self._usernames: List[str] = []
+        self._waiters: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, username: str) -> Optional[Result]:
+        """This username's verdict from a batch; None when it must be checked alone."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        if self._usernames:
+            self._batches.riders += 1
+        self._usernames.append(username)
+        self._waiters.append(waiter)
+        if len(self._usernames) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._batches.coalescing.interval, self.flush)
+        return await waiter
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        usernames, waiters = self._usernames, self._waiters
+        self._usernames, self._waiters = [], []
+        if usernames:
+            task = asyncio.ensure_future(self._answer(usernames, waiters))
+            self._batches.tasks.add(task)
+            task.add_done_callback(self._batches.tasks.discard)
+
+    async def _answer(self, usernames: List[str], waiters: List[asyncio.Future]) -> None:
+        answers: Optional[Dict[str, Result]] = None
+        try:
+            if not all(waiter.done() for waiter in waiters):
+                self._batches.coalescing.sent(self.module)
+                answers = await self._batches.send(self.module, self.func, list(dict.fromkeys(usernames)))
+        except Exception:
+            answers = None
+        finally:
+            self._batches.riders -= len(usernames) - 1
+            answers = answers or {}
+            handed: Set[str] = set()
+            for username, waiter in zip(usernames, waiters):
+                if waiter.done():
+                    continue
+                result = answers.get(username)
+                if result is not None and username in handed:
+                    # The same username twice in one batch: each check gets its own Result.
+                    result = copy.copy(result)
+                handed.add(username)
+                waiter.set_result(result)
+            self._batches.coalescing.answered[telemetry.module_name(self.module, False)] += len(answers)
+
+
+class Batches:
+    """The coalescers of one scan, on its event loop."""
+
+    def __init__(self, coalescing: "Coalescing", send: Sender):
+        self.coalescing = coalescing
+        self.send = send
+        # Checks waiting on a batch beyond its first: they share its request,
+        # so they do not count against the concurrency window.
+        self.riders = 0
+        self.tasks: Set[asyncio.Task] = set()
+        self._coalescers: Dict[ModuleType, Optional[Coalescer]] = {}
+
+    def coalescer_for(self, module: ModuleType) -> Optional[Coalescer]:
+        try:
+            return self._coalescers[module]
+        except KeyError:
+            pass
+        func = batch_func(module)
+        coalescer = None
+        if func is not None:
+            # A module's BATCH_SIZE caps the batch; 0 turns batching off for it.
+            size = getattr(module, "BATCH_SIZE", None)
+            max_size = self.coalescing.max_size if size is None else min(size, self.coalescing.max_size)
+            coalescer = Coalescer(module, func, max_size, self) if max_size > 1 else None
+        self._coalescers[module] = coalescer
+        return coalescer
+
+
+class Coalescing:
+    """Batching settings, and how many checks batches answered per module."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, interval: float = DEFAULT_INTERVAL):
+        self.max_size = max_size
+        self.interval = interval
+        self.answered: Counter = Counter()
+        self.requests: Counter = Counter()
+
+    def start(self, send: Sender) -> Batches:
+        return Batches(self, send)
+
+    def sent(self, module: ModuleType) -> None:
+        self.requests[telemetry.module_name(module, False)] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.answered.values())
+
+    def summary(self) -> str:
+        top = ", ".join(
+            f"{name.split('/', 1)[1]} {n}/{self.requests[name]}" for name, n in self.answered.most_common(5) if n
+        )
+        return f"{self.total} check(s) answered by {sum(self.requests.values())} batch request(s) ({top})"
+
+
+_coalescing: Optional[Coalescing] = Coalescing()
+
+
+def set_coalescing(coalescing: Optional[Coalescing]) -> None:
+    global _coalescing
+    _coalescing = coalescing
+
+
+def get_coalescing() -> Optional[Coalescing]:
+    """Batch coalescing settings; None when it is off."""
+    return _coalescing
+
+
+def configure_coalescing(max_size: Optional[int] = None, interval: Optional[float] = None) -> None:
+    """Batch up to ``max_size`` usernames (0 or 1 turns batching off); None keeps a default."""
+    max_size = DEFAULT_MAX_SIZE if max_size is None else max_size
+    interval = DEFAULT_INTERVAL if interval is None else interval
+    set_coalescing(Coalescing(max_size, interval) if max_size > 1 else None)
@@ -0,0 +1,199 @@
+"""Column-oriented store of scan results for post-scan analytics.
+
+A bulk run leaves millions of ``Result`` objects or a flat JSON/CSV dump, and
+questions like "which handles are taken on 20+ sites" or "error rate per
+module" become Python loops over dicts. ``ResultStore`` keeps one row per
+result in typed ``array`` columns instead — status as a byte, site, category
+and target as ids into per-column dictionaries, latency as a float — about 15
+bytes a row. Its summaries are built from C-level passes over those columns
+(``bytes.translate`` masks, ``itertools.compress``, ``Counter`` counting), so
+they take milliseconds over millions of rows.
+
+The store is a sink: register it with ``sinks.add_sink`` (or use
+``collecting()``) and the orchestrators fill it as results land; the CLI's
+``--store PATH`` does this for a whole run. ``save`` and
+``load`` round-trip it through a compact columnar file; ``to_columns`` hands
+plain columns to pandas or pyarrow where those are installed.
+"""
+
+import json
+import math
+import sys
+from array import array
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from itertools import compress
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from user_scanner.core.result import Result, Status
+from user_scanner.core.sinks import add_sink, remove_sink
+
+MAGIC = b"USCOL1\n"
+
+# Dictionary-encoded columns; everything else is numeric.
+_KEYS = ("site", "category", "target")
+
+_TYPECODES = {"status": "b", "site": "I", "category": "H", "target": "I", "latency": "f"}
+
+
+class _Dictionary:
+    """Value <-> id mapping for one dictionary-encoded column."""
+
+    __slots__ = ("values", "ids")
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = list(values)
+        self.ids: Dict[str, int] = {value: i for i, value in enumerate(self.values)}
+
+    def encode(self, value: Optional[str]) -> int:
+        value = value or ""
+        found = self.ids.get(value)
+        if found is None:
+            found = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return found
+
+
+class ResultStore:
+    def __init__(self):
+        self.status = array("b")
+        self.site = array("I")
+        self.category = array("H")
+        self.target = array("I")
+        # Seconds per check; NaN where unknown (cache hits, loaded results).
+        self.latency = array("f")
+        self._dicts = {key: _Dictionary() for key in _KEYS}
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def write(self, result: Result) -> None:
+        self.status.append(result.status.value)
+        self.site.append(self._dicts["site"].encode(result.site_name))
+        self.category.append(self._dicts["category"].encode(result.category))
+        self.target.append(self._dicts["target"].encode(result.username))
+        self.latency.append(math.nan if result.elapsed is None else result.elapsed)
+
+    def extend(self, results: Iterable[Result]) -> "ResultStore":
+        for result in results:
+            self.write(result)
+        return self
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result]) -> "ResultStore":
+        return cls().extend(results)
+
+    @contextmanager
+    def collecting(self) -> Iterator["ResultStore"]:
+        """Fill the store from every result the orchestrators emit meanwhile."""
+        add_sink(self)
+        try:
+            yield self
+        finally:
+            remove_sink(self)
+
+    def values(self, key: str) -> List[str]:
+        """The distinct values of ``site``, ``category`` or ``target``, by id."""
+        return self._dicts[key].values
+
+    def _mask(self, statuses: Sequence[Status]) -> bytes:
+        # One byte per row, 1 where the row's status is wanted.
+        table = bytearray(256)
+        for status in statuses:
+            table[status.value] = 1
+        return self.status.tobytes().translate(table)
+
+    def _column(self, key: str) -> array:
+        if key not in _KEYS:
+            raise ValueError(f"Cannot group by {key!r}; use one of {', '.join(_KEYS)}")
+        return getattr(self, key)
+
+    def status_counts(self) -> Dict[Status, int]:
+        raw = self.status.tobytes()
+        return {status: raw.count(status.value) for status in Status}
+
+    def count_by(self, key: str, *statuses: Status) -> Counter:
+        """Rows per ``key`` value, optionally only those with one of ``statuses``."""
+        column = self._column(key)
+        ids = compress(column, self._mask(statuses)) if statuses else column
+        names = self._dicts[key].values
+        return Counter({names[i]: n for i, n in Counter(ids).items()})
+
+    def targets_found_on(self, min_sites: int = 1) -> List[Tuple[str, int]]:
+        """Targets found on at least ``min_sites`` sites, most found first."""
+        found = self.count_by("target", Status.TAKEN)
+        return [(target, n) for target, n in found.most_common() if n >= min_sites]
+
+    def error_rate(self, key: str = "site") -> Dict[str, float]:
+        """Share of each ``key`` value's checks that ended in an error, worst first.
+
+        Skipped checks are left out: they never ran.
+        """
+        ran = self.count_by(key, Status.TAKEN, Status.AVAILABLE, Status.ERROR)
+        errors = self.count_by(key, Status.ERROR)
+        rates = {name: errors[name] / total for name, total in ran.items() if total}
+        return dict(sorted(rates.items(), key=lambda item: item[1], reverse=True))
+
+    def latency_quantiles(
+        self, key: str = "site", quantiles: Sequence[float] = (0.5, 0.95)
+    ) -> Dict[str, Tuple[float, ...]]:
+        """Latency quantiles (seconds) of each ``key`` value's timed checks."""
+        per_group: Dict[int, List[float]] = defaultdict(list)
+        for group, seconds in zip(self._column(key), self.latency):
+            if seconds == seconds:  # Not NaN.
+                per_group[group].append(seconds)
+
+        names = self._dicts[key].values
+        out = {}
+        for group, samples in per_group.items():
+            samples.sort()
+            last = len(samples) - 1
+            out[names[group]] = tuple(samples[min(last, int(q * len(samples)))] for q in quantiles)
+        return out
+
+    def rows(self, *statuses: Status) -> List[int]:
+        """Row indexes, optionally only those with one of ``statuses``."""
+        indexes = range(len(self))
+        return list(compress(indexes, self._mask(statuses))) if statuses else list(indexes)
+
+    def to_columns(self) -> Dict[str, list]:
+        """Decoded columns, ready for ``pandas.DataFrame`` or ``pyarrow.table``."""
+        columns: Dict[str, list] = {"status": [Status(code).name.lower() for code in self.status]}
+        for key in _KEYS:
+            names = self._dicts[key].values
+            columns[key] = [names[i] for i in getattr(self, key)]
+        columns["latency"] = self.latency.tolist()
+        return columns
+
+    def save(self, path: str | Path) -> None:
+        """Write the store as a header line and one raw block per column."""
+        header = {
+            "rows": len(self),
+            "byteorder": sys.byteorder,
+            "columns": {name: code for name, code in _TYPECODES.items()},
+            "dictionaries": {key: self._dicts[key].values for key in _KEYS},
+        }
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            f.write(b"\n")
+            for name in _TYPECODES:
+                getattr(self, name).tofile(f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ResultStore":
+        store = cls()
+        with open(path, "rb") as f:
+            if f.readline() != MAGIC:
+                raise ValueError(f"{path} is not a result store")
+            header = json.loads(f.readline())
+            rows = header["rows"]
+            for name, code in header["columns"].items():
+                column = array(code)
+                column.fromfile(f, rows)
+                if header["byteorder"] != sys.byteorder:
+                    column.byteswap()
+                setattr(store, name, column)
+        store._dicts = {key: _Dictionary(values) for key, values in header["dictionaries"].items()}
+        return store
@@ -0,0 +1,189 @@
+"""Adaptive in-flight window for the orchestrators.
+
+``-C`` used to be the number of requests kept in flight, full stop — too low
+on a fast link, too high behind a proxy pool. It is now a ceiling: the window
+starts small, doubles while responses stay quick and clean (slow start), then
+grows by one per round-trip's worth of completions. Timeouts and 429s halve it;
+latency climbing well past the best seen trims it by a quarter.
+
+``AIMDController`` is plain state and outlives a single event loop, so what one
+target's scan learned carries over to the next. ``AdaptiveSemaphore`` is the
+per-loop gate the workers actually wait on.
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Deque, List, Optional
+
+import httpx
+
+from user_scanner.core.result import Result, Status
+
+# p95 may drift this far above the best epoch seen and still count as flat.
+LATENCY_TOLERANCE = 1.5
+# Past this multiple the window is trimmed even without an explicit error.
+LATENCY_BACKOFF = 2.5
+# Non-congestion errors may rise this much over the baseline rate.
+ERROR_TOLERANCE = 0.05
+MIN_EPOCH = 8
+
+
+def is_congestion(result: Result) -> bool:
+    """Whether an error says "slow down" rather than "this site is broken"."""
+    if result.status != Status.ERROR:
+        return False
+    reason = result.reason
+    if isinstance(reason, (httpx.TimeoutException, asyncio.TimeoutError, TimeoutError)):
+        return True
+    text = str(reason or "").lower()
+    return "429" in text or "timed out" in text or "rate limit" in text
+
+
+def _p95(samples: List[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+
+
+class AIMDController:
+    def __init__(self, ceiling: int, floor: int = 1, start: Optional[int] = None, adaptive: bool = True):
+        self.floor = max(1, floor)
+        self.adaptive = adaptive
+        self.set_ceiling(ceiling, start)
+
+    def set_ceiling(self, ceiling: int, start: Optional[int] = None) -> None:
+        self.ceiling = max(self.floor, ceiling)
+        if not self.adaptive:
+            self.limit = self.ceiling
+        else:
+            self.limit = min(self.ceiling, max(self.floor, start or self.ceiling // 8 or 1))
+        self.ssthresh = self.ceiling
+        self.peak = self.limit
+        self.backoffs = 0
+        self.completed = 0
+        self._baseline_p95: Optional[float] = None
+        self._baseline_errors: Optional[float] = None
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._cooldown = 0
+
+    def observe(self, latency: float, congested: bool = False, failed: bool = False) -> None:
+        self.completed += 1
+        if not self.adaptive:
+            return
+
+        if self._cooldown:
+            self._cooldown -= 1
+
+        if congested:
+            if not self._cooldown:
+                # One halving per round-trip: the other requests already in
+                # flight were sent at the old window and will fail the same way.
+                self.ssthresh = max(self.floor, self.limit // 2)
+                self._resize(self.ssthresh)
+                self.backoffs += 1
+                self._cooldown = self.limit
+                self._latencies.clear()
+                self._errors = 0
+            return
+
+        self._latencies.append(latency)
+        self._errors += failed
+        if len(self._latencies) >= max(MIN_EPOCH, self.limit):
+            self._end_epoch()
+
+    def _end_epoch(self) -> None:
+        p95 = _p95(self._latencies)
+        error_rate = self._errors / len(self._latencies)
+        self._latencies.clear()
+        self._errors = 0
+
+        if self._baseline_p95 is None or self._baseline_errors is None:
+            self._baseline_p95, self._baseline_errors = p95, error_rate
+
+        flat = (
+            p95 <= self._baseline_p95 * LATENCY_TOLERANCE
+            and error_rate <= self._baseline_errors + ERROR_TOLERANCE
+        )
+        if flat:
+            grown = self.limit * 2 if self.limit < self.ssthresh else self.limit + 1
+            self._resize(grown)
+        elif p95 > self._baseline_p95 * LATENCY_BACKOFF:
+            self.ssthresh = max(self.floor, int(self.limit * 0.75))
+            self._resize(self.ssthresh)
+            self.backoffs += 1
+        else:
+            # Not worse enough to shrink, but slow start is over.
+            self.ssthresh = min(self.ssthresh, self.limit)
+
+        # The best epoch is the yardstick, but it is let drift up slowly so a
+        # scan that moves on to slower sites is not judged by the fastest ones.
+        self._baseline_p95 = min(p95, self._baseline_p95 * 1.1)
+        self._baseline_errors = min(error_rate, self._baseline_errors + 0.01)
+
+    def _resize(self, limit: int) -> None:
+        self.limit = max(self.floor, min(self.ceiling, limit))
+        self.peak = max(self.peak, self.limit)
+
+    def summary(self) -> str:
+        if not self.adaptive:
+            return f"fixed at {self.limit} in flight"
+        return (
+            f"settled at {self.limit} in flight (peak {self.peak}, ceiling "
+            f"{self.ceiling}, {self.backoffs} back-off{'s' if self.backoffs != 1 else ''})"
+        )
+
+
+class AdaptiveSemaphore:
+    """An ``asyncio.Semaphore`` whose capacity follows an ``AIMDController``."""
+
+    def __init__(self, controller: AIMDController):
+        self.controller = controller
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self.controller.limit
+
+    async def acquire(self) -> None:
+        while self._in_flight >= self.controller.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # Woken, then cancelled before taking the slot: pass it on.
+                    self._wake()
+                raise
+        self._in_flight += 1
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def observe(self, result: Result, latency: float) -> None:
+        self.controller.observe(
+            latency,
+            congested=is_congestion(result),
+            failed=result.status == Status.ERROR,
+        )
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.controller.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> "AdaptiveSemaphore":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.release()
@@ -9,6 +9,7 @@ a pivot named by handle, and a site where the same handle merely happens to be
 taken. Every hit is scored so the difference survives into the report.
 """
 
+import asyncio
 from dataclasses import dataclass
 from types import ModuleType
 from typing import Dict, Iterable, List, Optional, Set, Tuple
@@ -23,7 +24,6 @@ from user_scanner.core.confidence import (
     rank_emails,
     score,
 )
-from user_scanner.core.email_orchestrator import run_email_full_batch, run_email_module_batch
 from user_scanner.core.helpers import (
     ScanConfig,
     find_module,
@@ -32,7 +32,6 @@ from user_scanner.core.helpers import (
     load_categories,
     load_modules,
 )
-from user_scanner.core.orchestrator import run_user_full, run_user_module
 from user_scanner.core.pivots import (
     Pivot,
     extract_email_pivots,
@@ -43,6 +42,7 @@ from user_scanner.core.pivots import (
     select_pivots,
 )
 from user_scanner.core.result import Result
+from user_scanner.core import session
 
 DEFAULT_SWEEP = 3
 DEFAULT_DEPTH = 1
@@ -71,7 +71,7 @@ class CrossScanConfig:
     # username pivot wastes a request, a stray address puts a third party in the
     # report and can hand them to a module that mails them.
     emails: str = "verified"
-    # How many targets may be swept against every module, across all rounds —
+    # How many targets may be swept against every module, across all hops —
     # usernames and addresses draw on the same budget, since sweeping either one
     # costs a full pass over that scan type. Zero turns sweeping off entirely,
     # leaving only the sites a pivot named.
@@ -82,12 +82,16 @@ class CrossScanConfig:
 def run_cross_scan(
     results: List[Result], configs: ScanConfig, cross_configs: CrossScanConfig
 ) -> List[Result]:
-    """Mine finished results for usernames and scan them.
-
-    Runs ``depth`` rounds: each round pivots off the accounts the previous one
-    found, so a handle reachable only through a chain of profile links is still
-    reached. Returns every round's results; the caller owns merging them into
-    its own list for export.
+    """Mine finished results for usernames and addresses, and scan them.
+
+    Follows hits up to ``depth`` hops from the first pass, so a handle reachable
+    only through a chain of profile links is still reached. There are no rounds:
+    every scan is a job on one event loop, and each hit is mined the moment it
+    lands. A site it names is checked at once; the usernames and addresses worth
+    sweeping are ranked, against the budget, as soon as the job that found them
+    finishes. A chain takes as long as its own hops, not ``depth`` full passes.
+    Returns every job's results; the caller owns merging them into its own list
+    for export.
     """
     print(f"\n{Fore.MAGENTA}== CROSS-SCAN =={Style.RESET_ALL}")
 
@@ -102,86 +106,186 @@ def run_cross_scan(
         )
         return []
 
-    depth = max(1, cross_configs.depth)
-    budget = max(0, cross_configs.sweep)
-    all_pivots: List[Pivot] = []
-    cross_results: List[Result] = []
-    swept: Set[str] = _already_swept(results)
-    checked: Set[Tuple[str, str]] = set()
-    scanned_emails: Set[str] = _already_scanned(results)
-    email_ratings: Dict[str, Confidence] = {}
-    source: List[Result] = list(results)
-
-    for round_number in range(1, depth + 1):
-        pivots = _fresh_pivots(source, cross_configs.links, swept, checked)
-        ranked = _fresh_emails(source, cross_configs.emails, scanned_emails)
-        if not pivots and not ranked:
-            if round_number == 1:
-                print(
-                    f"{Fore.YELLOW}[!] No usernames, links or addresses to pivot "
-                    f"from.{Style.RESET_ALL}"
-                )
-                return []
-            print(f"\n{Fore.CYAN}[i] Round {round_number}: nothing new to follow.{Style.RESET_ALL}")
-            break
-
-        if depth > 1:
-            print(f"\n{Fore.MAGENTA}-- round {round_number} of {depth} --{Style.RESET_ALL}")
-        if pivots:
-            _print_pivots(pivots)
-        if ranked:
-            _print_emails(ranked)
-        all_pivots.extend(pivots)
-
-        sweepable = 0 if scope is not None and not scope else len(rank_usernames(pivots))
-        for_usernames, for_emails = _split_budget(budget, sweepable, len(ranked))
-        usernames = _sweep_targets(pivots, for_usernames)
-        to_scan = _email_targets(ranked, for_emails, email_modules)
-        budget -= len(usernames) + len(to_scan)
-        swept.update(username.lower() for username in usernames)
-        scanned_emails.update(entry.email for entry in to_scan)
-        email_ratings.update({entry.email: entry.confidence for entry in to_scan})
-
-        round_results: List[Result] = []
-        for username in usernames:
-            print(
-                f"\n{Fore.CYAN}[+] Sweeping every module for username: {username}{Style.RESET_ALL}"
-            )
-            swept_results = (
-                run_user_full(username, configs)
-                if scope is None
-                else run_user_module(scope, username, configs)
-            )
-            round_results.extend(_tag(swept_results, all_pivots, username))
+    scan = _CrossScan(results, configs, cross_configs, scope, email_modules)
+    cross_results = session.run(scan.run())
+    if cross_results is None:
+        print(f"{Fore.YELLOW}[!] No usernames, links or addresses to pivot from.{Style.RESET_ALL}")
+        return []
 
-        for username, modules in _named_targets(pivots, swept, checked, configs, scope).items():
-            print(
-                f"\n{Fore.CYAN}[+] Checking {username} on its {len(modules)} linked "
-                f"site(s){Style.RESET_ALL}"
-            )
-            round_results.extend(
-                _tag(run_user_module(modules, username, configs), all_pivots, username)
-            )
+    _apply_confidence(results, cross_results, scan.pivots, scan.email_ratings)
+    _print_summary(results, cross_results)
+    return cross_results
 
-        for entry in to_scan:
-            print(f"\n{Fore.CYAN}[+] Scanning email: {entry.email}{Style.RESET_ALL}")
-            email_results = (
-                run_email_full_batch(entry.email, configs)
-                if email_modules is None
-                else run_email_module_batch(email_modules, entry.email, configs)
-            )
-            round_results.extend(_tag_emails(email_results, entry))
 
-        checked.update((p.site, p.username.lower()) for p in pivots if p.site)
-        cross_results.extend(round_results)
+class _CrossScan:
+    """The jobs of one cross-scan, and everything they have found so far.
 
-        if round_number < depth:
-            _apply_confidence(results, cross_results, all_pivots, email_ratings)
-            source = _followable(round_results)
+    A job scans one target — a username against every module, a username
+    against the sites pivots named, or an address — and its hop is one more
+    than that of the job whose hit led to it; the first pass is hop 0. All jobs
+    share one request window per scan type.
+    """
 
-    _apply_confidence(results, cross_results, all_pivots, email_ratings)
-    _print_summary(results, cross_results)
-    return cross_results
+    def __init__(
+        self,
+        prior: List[Result],
+        configs: ScanConfig,
+        cross_configs: CrossScanConfig,
+        scope: Optional[List[ModuleType]],
+        email_modules: Optional[List[ModuleType]],
+    ):
+        self.prior = prior
+        self.configs = configs
+        self.cross = cross_configs
+        self.scope = scope
+        self.email_modules = email_modules
+        self.depth = max(1, cross_configs.depth)
+        self.budget = max(0, cross_configs.sweep)
+        self.pivots: List[Pivot] = []
+        self._known: Set[Pivot] = set()
+        self.results: List[Result] = []
+        self.swept: Set[str] = _already_swept(prior)
+        self.checked: Set[Tuple[str, str]] = set()
+        self.scanned_emails: Set[str] = _already_scanned(prior)
+        self.email_ratings: Dict[str, Confidence] = {}
+        self._jobs: Set[asyncio.Task] = set()
+
+    async def run(self) -> Optional[List[Result]]:
+        """Every job's results; None when the first pass gives nothing to follow."""
+        from user_scanner.core import email_orchestrator, orchestrator
+        from user_scanner.core.concurrency import AdaptiveSemaphore
+
+        self._user_sem = AdaptiveSemaphore(orchestrator.get_controller())
+        self._email_sem = AdaptiveSemaphore(email_orchestrator.get_controller())
+
+        with orchestrator.scan_progress() as progress:
+            self._progress = progress
+            self._task_id = progress.add_task("[cyan]Cross-scanning...", total=0, window=self._user_sem.limit)
+
+            new = [pivot for result in self.prior for pivot in self._mine(result, hop=0)]
+            if not new and not self._jobs and not _fresh_emails(self.prior, self.cross.emails, self.scanned_emails):
+                return None
+            if new:
+                _print_pivots(sorted(new, key=lambda p: (p.kind.rank, p.source_site, p.username.lower())))
+            self._settle(self.prior, hop=0)
+
+            while self._jobs:
+                done, _ = await asyncio.wait(set(self._jobs), return_when=asyncio.FIRST_COMPLETED)
+                self._jobs -= done
+                for job in done:
+                    job.result()
+        return self.results
+
+    def _mine(self, result: Result, hop: int) -> List[Pivot]:
+        """Check the sites a hit names right away; returns its pivots not seen before."""
+        pivots = _fresh_pivots(_followable([result]), self.cross.links, self.swept, self.checked)
+        new = [pivot for pivot in pivots if pivot not in self._known]
+        self._known.update(new)
+        self.pivots.extend(new)
+
+        for username, modules in _named_targets(pivots, self.swept, self.checked, self.configs, self.scope).items():
+            self._start("named", username, modules, hop + 1)
+        self.checked.update((p.site, p.username.lower()) for p in pivots if p.site)
+        return new
+
+    def _settle(self, hits: List[Result], hop: int) -> None:
+        """Spend sweep budget on what a finished job found, best-vouched first."""
+        source = _followable(hits) if hop else hits
+        # Sites already checked do not rule a username out: the sweep covers
+        # every other module too.
+        pivots = _fresh_pivots(source, self.cross.links, self.swept, set())
+        ranked = _fresh_emails(source, self.cross.emails, self.scanned_emails)
+        if ranked:
+            _print_emails(ranked)
+
+        sweepable = 0 if self.scope is not None and not self.scope else len(rank_usernames(pivots))
+        for_usernames, for_emails = _split_budget(self.budget, sweepable, len(ranked))
+        usernames = _sweep_targets(pivots, for_usernames) if pivots else []
+        to_scan = _email_targets(ranked, for_emails, self.email_modules)
+        self.budget -= len(usernames) + len(to_scan)
+
+        for username in usernames:
+            self.swept.add(username.lower())
+            self._start("sweep", username, self._sweep_modules(username), hop + 1)
+        for entry in to_scan:
+            self.scanned_emails.add(entry.email)
+            self.email_ratings[entry.email] = entry.confidence
+            self._start("email", entry.email, self.email_modules, hop + 1, entry)
+
+    def _sweep_modules(self, username: str) -> List[ModuleType]:
+        from user_scanner.core.orchestrator import all_modules
+
+        modules = self.scope if self.scope is not None else all_modules(no_nsfw=self.configs.no_nsfw)
+        # A site a pivot named may already be checked, or in flight, for it.
+        named = {site for site, name in self.checked if name == username.lower()}
+        return [module for module in modules if module.__name__ not in named]
+
+    def _start(
+        self,
+        kind: str,
+        target: str,
+        modules: Optional[List[ModuleType]],
+        hop: int,
+        entry: Optional[RankedEmail] = None,
+    ) -> None:
+        self._jobs.add(asyncio.create_task(self._job(kind, target, modules, hop, entry)))
+
+    async def _job(
+        self,
+        kind: str,
+        target: str,
+        modules: Optional[List[ModuleType]],
+        hop: int,
+        entry: Optional[RankedEmail],
+    ) -> None:
+        from user_scanner.core.email_orchestrator import stream_email_batch
+        from user_scanner.core.orchestrator import all_modules, count_pairs, stream_user_batch
+        from user_scanner.core.sinks import emit
+
+        if modules is None:
+            modules = all_modules(is_email=kind == "email", no_nsfw=self.configs.no_nsfw)
+        hops = f" (hop {hop} of {self.depth})" if self.depth > 1 else ""
+        if kind == "sweep":
+            print(f"\n{Fore.CYAN}[+] Sweeping every module for username: {target}{hops}{Style.RESET_ALL}")
+        elif kind == "named":
+            print(f"\n{Fore.CYAN}[+] Checking {target} on its {len(modules)} linked site(s){hops}{Style.RESET_ALL}")
+        else:
+            print(f"\n{Fore.CYAN}[+] Scanning email: {target}{hops}{Style.RESET_ALL}")
+
+        progress, task_id = self._progress, self._task_id
+        total = len(modules) if kind == "email" else count_pairs([target], modules) or 0
+        progress.update(task_id, total=(progress.tasks[task_id].total or 0) + total)
+
+        def on_start(site: str) -> None:
+            progress.update(task_id, description=f"[cyan]Cross-scanning... ({site})")
+
+        if kind == "email":
+            stream = stream_email_batch([target], self.configs, modules, on_start, sem=self._email_sem)
+        else:
+            stream = stream_user_batch([target], self.configs, modules, on_start, sem=self._user_sem)
+
+        hits: List[Result] = []
+        async for result in stream:
+            progress.update(task_id, advance=1, window=self._user_sem.limit)
+            if entry is not None:
+                _tag_emails([result], entry)
+            else:
+                _tag([result], self.pivots, target)
+            self.results.append(result)
+            if result.is_found():
+                # Rated now, against what is known so far, so a conflicting
+                # hit is not followed; the final ratings come at the end.
+                _apply_confidence(self.prior, self.results, self.pivots, self.email_ratings, hits=[result])
+                hits.append(result)
+            result.show(self.configs)
+            emit(result)
+            if hop < self.depth:
+                new = self._mine(result, hop)
+                if new:
+                    _print_pivots(new)
+
+        if hop < self.depth:
+            self._settle(hits, hop)
 
 
 def _scope(
@@ -265,7 +369,7 @@ def _already_swept(results: Iterable[Result]) -> Set[str]:
 def _fresh_pivots(
     source: List[Result], links: str, swept: Set[str], checked: Set[Tuple[str, str]]
 ) -> List[Pivot]:
-    """Pivots from ``source`` that no earlier round has already acted on.
+    """Pivots from ``source`` that no earlier job has already acted on.
 
     A swept username had every module run against it, so nothing about it is
     left to do; a named pair is done once that one site has been checked.
@@ -290,7 +394,7 @@ def _already_scanned(results: Iterable[Result]) -> Set[str]:
 
 
 def _fresh_emails(source: List[Result], emails: str, scanned: Set[str]) -> List[RankedEmail]:
-    """Addresses in ``source`` no earlier round has already scanned, best first."""
+    """Addresses in ``source`` no earlier job has already scanned, best first."""
     pivots = [
         pivot
         for pivot in select_email_pivots(extract_email_pivots(source), emails)
@@ -301,15 +405,15 @@ def _fresh_emails(source: List[Result], emails: str, scanned: Set[str]) -> List[
     return rank_emails(pivots, build_anchors(confirmed=_followable(source)))
 
 
-def _followable(round_results: List[Result]) -> List[Result]:
-    """The hits a further round may pivot off.
+def _followable(results: List[Result]) -> List[Result]:
+    """The hits a further hop may pivot off.
 
     An account whose metadata names someone else is a handle collision, and
     following its links would walk into a stranger's footprint.
     """
     return [
         result
-        for result in round_results
+        for result in results
         if result.is_found()
         and result.extra.get("confidence") != Confidence.CONFLICTING.value
     ]
@@ -486,12 +590,13 @@ def _apply_confidence(
     cross_results: Iterable[Result],
     pivots: Iterable[Pivot],
     email_ratings: Dict[str, Confidence],
+    hits: Optional[List[Result]] = None,
 ) -> None:
-    """Rate every hit, and record the rating on it.
+    """Rate every hit (or just ``hits``), and record the rating on it.
 
-    Scoring runs once the pass is over because the anchors come from its own
-    confirmed hits — a sweep hit cannot be judged before the accounts it is
-    judged against have been fetched.
+    The final ratings come once the pass is over because the anchors come from
+    its own confirmed hits — a sweep hit cannot be fully judged before the
+    accounts it is judged against have been fetched.
 
     An account reached by scanning an address inherits that address's rating
     rather than being scored on its own metadata: the account is only as well
@@ -499,9 +604,11 @@ def _apply_confidence(
     verdict says nothing about who owns the mailbox.
     """
     named = {(p.site, p.username.lower()) for p in pivots if p.site}
-    hits = [r for r in cross_results if r.is_found()]
+    found = [r for r in cross_results if r.is_found()]
+    if hits is None:
+        hits = found
     anchors = build_anchors(
-        confirmed=[r for r in hits if _is_named(r, named)],
+        confirmed=[r for r in found if _is_named(r, named)],
         emails=[str(r.username) for r in prior if r.is_email and r.username],
         urls=[p.url for p in pivots if p.url],
     )
@@ -1,8 +1,9 @@
 import asyncio
+import time
 import httpx
 from pathlib import Path
 from types import ModuleType
-from typing import List, Optional, Set, Union, Callable
+from typing import Any, AsyncIterator, Coroutine, Iterable, List, Optional, Set, Union, Callable
 
 from colorama import Fore, Style
 
@@ -17,14 +18,33 @@ from user_scanner.core.helpers import (
     load_modules,
     get_global_timeout,
 )
+from user_scanner.core import client_pool, ratelimit, retry, session, telemetry
+from user_scanner.core.breaker import get_breaker
+from user_scanner.core.cache import get_cache, module_key
+from user_scanner.core.checkpoint import get_journal
+from user_scanner.core.concurrency import AdaptiveSemaphore, AIMDController
+from user_scanner.core.orchestrator import all_modules, count_pairs, scan_progress, stream_pairs
 from user_scanner.core.result import Result
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
+from user_scanner.core.sinks import emit
 
 # Monkey-patch httpx clients to automatically use proxies for email scans
 _original_async_client_init = httpx.AsyncClient.__init__
 _original_client_init = httpx.Client.__init__
 
+def _with_hook(kwargs: dict, hook, event: str = "request") -> None:
+    # Pace every request by host and credit every response to its check; a
+    # caller that already installed a hook (make_request's pooled clients)
+    # keeps just the one.
+    hooks = dict(kwargs.get("event_hooks") or {})
+    event_hooks = list(hooks.get(event, []))
+    if hook not in event_hooks:
+        event_hooks.append(hook)
+    hooks[event] = event_hooks
+    kwargs["event_hooks"] = hooks
+
 def _patched_async_client_init(self, *args, **kwargs):
+    _with_hook(kwargs, ratelimit.async_request_hook)
+    _with_hook(kwargs, telemetry.async_response_hook, "response")
     if "proxy" not in kwargs and "proxies" not in kwargs:
         proxy = get_proxy()
         if proxy:
@@ -33,10 +53,14 @@ def _patched_async_client_init(self, *args, **kwargs):
     global_timeout = get_global_timeout()
     if global_timeout is not None:
         kwargs["timeout"] = global_timeout
-        
+
+    # Reuse the scan's keep-alive connections instead of handshaking per check.
+    client_pool.adopt(kwargs)
     _original_async_client_init(self, *args, **kwargs)
 
 def _patched_client_init(self, *args, **kwargs):
+    _with_hook(kwargs, ratelimit.request_hook)
+    _with_hook(kwargs, telemetry.response_hook, "response")
     if "proxy" not in kwargs and "proxies" not in kwargs:
         proxy = get_proxy()
         if proxy:
@@ -45,7 +69,8 @@ def _patched_client_init(self, *args, **kwargs):
     global_timeout = get_global_timeout()
     if global_timeout is not None:
         kwargs["timeout"] = global_timeout
-        
+
+    client_pool.apply_override(kwargs)
     _original_client_init(self, *args, **kwargs)
 
 httpx.AsyncClient.__init__ = _patched_async_client_init  # type: ignore[method-assign]
@@ -54,24 +79,76 @@ httpx.Client.__init__ = _patched_client_init  # type: ignore[method-assign]
 
 # Concurrency control
 MAX_CONCURRENT_REQUESTS = 25
+_controller = AIMDController(MAX_CONCURRENT_REQUESTS)
 
 def set_concurrency(val: int):
     global MAX_CONCURRENT_REQUESTS
     MAX_CONCURRENT_REQUESTS = val
+    _controller.set_ceiling(val)
+
+def set_adaptive(enabled: bool):
+    """Pin the in-flight window at the -C ceiling instead of adapting it."""
+    _controller.adaptive = enabled
+    _controller.set_ceiling(MAX_CONCURRENT_REQUESTS)
+
+def get_controller() -> AIMDController:
+    return _controller
 
 async def _async_worker(
     module: ModuleType,
     email: str,
-    sem: asyncio.Semaphore,
+    sem: Union[asyncio.Semaphore, AdaptiveSemaphore],
     configs: ScanConfig,
     printed_cats: Optional[Set] = None,
     on_start: Optional[Callable[[str], None]] = None,
+) -> Result:
+    cache = get_cache()
+    if cache is not None:
+        category = find_category(module) or "Email"
+        key = module_key(module, category, is_email=True)
+        cached = cache.get(key, email)
+        if cached is not None:
+            return cached.update(
+                site_name=get_site_name(module).capitalize(),
+                username=email,
+                category=category,
+                is_email=True,
+            )
+
+    breaker = get_breaker(module, is_email=True)
+    if breaker is not None and not breaker.allow():
+        return breaker.rejection().update(
+            site_name=get_site_name(module).capitalize(),
+            username=email,
+            category=find_category(module) or "Email",
+            is_email=True,
+        )
+
+    probe = telemetry.begin(module, is_email=True)
+    result = await _run_module(module, email, sem, configs, on_start)
+    telemetry.finish(probe, result)
+    if breaker is not None:
+        breaker.record(result)
+    if cache is not None:
+        cache.put(key, email, result)
+    return result
+
+
+async def _run_module(
+    module: ModuleType,
+    email: str,
+    sem: Union[asyncio.Semaphore, AdaptiveSemaphore],
+    configs: ScanConfig,
+    on_start: Optional[Callable[[str], None]] = None,
 ) -> Result:
     async with sem:
+        telemetry.mark_started()
         site_name = get_site_name(module)
         if on_start:
             on_start(site_name)
         func = get_scan_func(module)
+        ratelimit.configure_module(module)
+        retry.configure_module(module)
         actual_cat = find_category(module) or "Email"
 
         params = {
@@ -89,6 +166,7 @@ async def _async_worker(
         if not configs.allow_loud and is_loud(site_name, is_email=True):
             return Result.skipped().update(**params)
 
+        started = time.perf_counter()
         try:
             import inspect
             module_timeout = (get_global_timeout() or 15.0) + 10.0
@@ -97,10 +175,15 @@ async def _async_worker(
             else:
                 result = await asyncio.wait_for(asyncio.to_thread(func, email), timeout=module_timeout)
         except asyncio.TimeoutError:
+            telemetry.mark_timed_out()
             result = Result.error(f"Module execution timed out after {module_timeout}s")
         except Exception as e:
             result = Result.error(e)
 
+        result.elapsed = time.perf_counter() - started
+        if isinstance(sem, AdaptiveSemaphore):
+            sem.observe(result, result.elapsed)
+
         return result.update(**params)
 
 
@@ -113,18 +196,11 @@ async def _run_batch(
     if not modules:
         return []
 
-    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    sem = AdaptiveSemaphore(_controller)
     results = []
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        transient=True,
-    ) as progress:
-        task_id = progress.add_task(f"[cyan]Scanning {email}...", total=len(modules))
+    with scan_progress() as progress:
+        task_id = progress.add_task(f"[cyan]Scanning {email}...", total=len(modules), window=sem.limit)
 
         def on_start_cb(site: str):
             progress.update(task_id, description=f"[cyan]Scanning {email}... ({site})")
@@ -141,7 +217,7 @@ async def _run_batch(
                     on_start=on_start_cb,
                 )
             )
-            t.add_done_callback(lambda t: progress.advance(task_id))
+            t.add_done_callback(lambda t: progress.update(task_id, advance=1, window=sem.limit))
             tasks.append(t)
 
         for coro in asyncio.as_completed(tasks):
@@ -155,6 +231,8 @@ async def _run_batch(
                     printed_cats.add(actual_cat)
 
             result.show(configs)
+
+            emit(result)
             results.append(result)
 
     return results
@@ -163,9 +241,6 @@ async def _run_batch(
 async def _run_email_module_batch_async(
     module: Union[ModuleType, List[ModuleType]], email: str, configs: ScanConfig
 ) -> List[Result]:
-    loop = asyncio.get_running_loop()
-    import concurrent.futures
-    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=250))
     modules = [module] if isinstance(module, ModuleType) else list(module)
     return await _run_batch(modules, email, configs, printed_cats=set())
 
@@ -173,15 +248,12 @@ async def _run_email_module_batch_async(
 def run_email_module_batch(
     module: Union[ModuleType, List[ModuleType]], email: str, configs: ScanConfig
 ) -> List[Result]:
-    return asyncio.run(_run_email_module_batch_async(module, email, configs))
+    return session.run(_run_email_module_batch_async(module, email, configs))
 
 
 async def _run_email_category_batch_async(
     category_path: Path, email: str, configs: ScanConfig
 ) -> List[Result]:
-    loop = asyncio.get_running_loop()
-    import concurrent.futures
-    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=250))
     cat_name = category_path.stem.capitalize()
     modules = load_modules(category_path)
     printed_cats = set()
@@ -200,13 +272,10 @@ async def _run_email_category_batch_async(
 def run_email_category_batch(
     category_path: Path, email: str, configs: ScanConfig
 ) -> List[Result]:
-    return asyncio.run(_run_email_category_batch_async(category_path, email, configs))
+    return session.run(_run_email_category_batch_async(category_path, email, configs))
 
 
 async def _run_email_full_batch_async(email: str, configs: ScanConfig) -> List[Result]:
-    loop = asyncio.get_running_loop()
-    import concurrent.futures
-    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=250))
     categories = load_categories(True, configs.no_nsfw)
     all_results = []
     printed_cats: Set[str] = set()
@@ -214,7 +283,7 @@ async def _run_email_full_batch_async(email: str, configs: ScanConfig) -> List[R
     # 1. Pre-spawn all tasks for all categories (global concurrency)
     category_modules = []
     total_tasks = 0
-    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    sem = AdaptiveSemaphore(_controller)
     
     for cat_name, cat_path in categories.items():
         display_name = cat_name.capitalize()
@@ -223,15 +292,8 @@ async def _run_email_full_batch_async(email: str, configs: ScanConfig) -> List[R
         total_tasks += len(modules)
 
     # 2. Await tasks category by category to stream grouped output
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        transient=True,
-    ) as progress:
-        task_id = progress.add_task(f"[cyan]Scanning {email}...", total=total_tasks)
+    with scan_progress() as progress:
+        task_id = progress.add_task(f"[cyan]Scanning {email}...", total=total_tasks, window=sem.limit)
         
         def on_start_cb(site: str):
             progress.update(task_id, description=f"[cyan]Scanning {email}... ({site})")
@@ -250,7 +312,7 @@ async def _run_email_full_batch_async(email: str, configs: ScanConfig) -> List[R
                         on_start=on_start_cb,
                     )
                 )
-                t.add_done_callback(lambda t: progress.advance(task_id))
+                t.add_done_callback(lambda t: progress.update(task_id, advance=1, window=sem.limit))
                 tasks.append(t)
             spawned_category_tasks.append((display_name, tasks))
                 
@@ -273,9 +335,75 @@ async def _run_email_full_batch_async(email: str, configs: ScanConfig) -> List[R
                         printed_cats.add(display_name)
 
                 result.show(configs)
+
+                emit(result)
                 all_results.append(result)
 
     return all_results
 
 def run_email_full_batch(email: str, configs: ScanConfig) -> List[Result]:
-    return asyncio.run(_run_email_full_batch_async(email, configs))
+    return session.run(_run_email_full_batch_async(email, configs))
+
+
+async def stream_email_batch(
+    emails: Iterable[str],
+    configs: ScanConfig,
+    modules: Optional[List[ModuleType]] = None,
+    on_start: Optional[Callable[[str], None]] = None,
+    sem: Optional[AdaptiveSemaphore] = None,
+) -> AsyncIterator[Result]:
+    """Scan many emails in one event loop, yielding each result as it lands.
+
+    ``modules`` defaults to every email module. The global
+    ``MAX_CONCURRENT_REQUESTS`` window stays full across target boundaries;
+    streams running side by side share it by passing one ``sem``.
+    """
+    if modules is None:
+        modules = all_modules(is_email=True, no_nsfw=configs.no_nsfw)
+    if sem is None:
+        sem = AdaptiveSemaphore(_controller)
+
+    def run_pair(module: ModuleType, email: str) -> Coroutine[Any, Any, Result]:
+        return _async_worker(module, email, sem, configs, on_start=on_start)
+
+    journal = get_journal()
+    skip = journal.done if journal is not None else None
+    async for result in stream_pairs(emails, modules, run_pair, MAX_CONCURRENT_REQUESTS, skip):
+        yield result
+
+
+async def _run_email_batch_async(
+    emails: Iterable[str], configs: ScanConfig, modules: Optional[List[ModuleType]], collect: bool = True
+) -> List[Result]:
+    if modules is None:
+        modules = all_modules(is_email=True, no_nsfw=configs.no_nsfw)
+    total = count_pairs(emails, modules)
+    results = []
+
+    with scan_progress() as progress:
+        task_id = progress.add_task("[cyan]Scanning emails...", total=total, window=_controller.limit)
+
+        def on_start_cb(site: str):
+            progress.update(task_id, description=f"[cyan]Scanning emails... ({site})")
+
+        async for result in stream_email_batch(emails, configs, modules, on_start=on_start_cb):
+            progress.update(task_id, advance=1, window=_controller.limit)
+            result.show(configs)
+            emit(result)
+            if collect:
+                results.append(result)
+
+    return results
+
+
+def run_email_batch(
+    emails: Iterable[str],
+    configs: ScanConfig,
+    modules: Optional[List[ModuleType]] = None,
+    collect: bool = True,
+) -> List[Result]:
+    """Scan every email against ``modules`` (default: all) in a single run.
+
+    ``collect=False`` leaves the results to the registered sinks only.
+    """
+    return session.run(_run_email_batch_async(emails, configs, modules, collect))
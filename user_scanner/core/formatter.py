@@ -1,5 +1,10 @@
+import csv
+import io
 import json
-from typing import List, Optional
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, TextIO
 
 from user_scanner.core.result import CSV_FIELDS, Result
 
@@ -16,7 +21,112 @@ def get_json_data(results: List[Result]) -> list:
 
 
 def into_csv(results: List[Result]) -> str:
-    return CSV_HEADER + "\n" + "\n".join(result.to_csv() for result in results)
+    output = io.StringIO()
+    rows = write_csv(results, output)
+    text = output.getvalue()
+    return text[:-1] if rows else text
+
+
+def write_csv(results: Iterable[Result], f: TextIO, header: bool = True) -> int:
+    """Write ``results`` to ``f`` through one ``csv.writer``; returns the row count.
+
+    ``Result.to_csv`` builds a buffer and a writer for every row, which is what
+    a single result wants but dominates an export of millions. Here each row
+    is just its cell list handed to the one writer, straight into ``f``.
+    """
+    writer = csv.writer(f, lineterminator="\n")
+    if header:
+        writer.writerow(CSV_FIELDS)
+    writerow = writer.writerow
+    rows = 0
+    for result in results:
+        writerow(result.csv_row())
+        rows += 1
+    return rows
+
+
+class CsvWriter:
+    """Appends a CSV row per result as it lands, like ``JsonlWriter``.
+
+    The header is written only when the file is new or empty, so re-running
+    into the same file extends one table instead of stacking headers in it.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.count = 0
+        size = self.path.stat().st_size if self.path.exists() else 0
+        self._file = open(self.path, "a", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file, lineterminator="\n")
+        if size == 0:
+            self._writer.writerow(CSV_FIELDS)
+        else:
+            # Older exports did not end in a newline.
+            with open(self.path, "rb") as existing:
+                existing.seek(-1, os.SEEK_END)
+                if existing.read(1) != b"\n":
+                    self._file.write("\n")
+        self._file.flush()
+
+    def write(self, result: Result) -> None:
+        self._writer.writerow(result.csv_row())
+        self._file.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "CsvWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class JsonlWriter:
+    """Appends one compact ``Result.to_dict()`` line per result as it lands.
+
+    Each line is flushed to the OS when written, so a crash of the scanner
+    loses nothing already scanned; the file is fsynced at most every
+    ``fsync_interval`` seconds, which bounds what a power loss can take. The
+    file is only ever appended to, so re-running into it costs nothing extra.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        fsync_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = Path(path)
+        self.count = 0
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._fsync_interval = fsync_interval
+        self._clock = clock
+        self._synced_at = clock()
+
+    def write(self, result: Result) -> None:
+        self._file.write(json.dumps(result.to_dict(), ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+        self._file.flush()
+        self.count += 1
+        now = self._clock()
+        if now - self._synced_at >= self._fsync_interval:
+            os.fsync(self._file.fileno())
+            self._synced_at = now
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def into_pdf(
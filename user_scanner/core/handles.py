@@ -0,0 +1,123 @@
+"""Username rules sites declare, so a batch skips handles a site cannot hold.
+
+A pattern scan such as ``-u john[a-z0-9]{0-4}`` sends thousands of candidates
+to every module, and many sites reject a good share of them on sight: too
+short, too long, a character they do not allow. Those modules answered with an
+error only once scheduled, each having taken a slot, a thread and a progress
+tick first. A module can now declare its rules::
+
+    HANDLE = {"length": (3, 30), "chars": "a-z0-9-", "first": "a-z0-9"}
+
+``length`` is ``(min, max)`` (``max`` may be None), and ``chars``, ``first``
+and ``last`` are regex character-class bodies for every character, the first
+and the last. The registry reads the declaration from the module's source, so
+checking a handle imports nothing, and it is compiled into one regular
+expression. The batch scheduler drops the (target, module) pairs that fail it
+before starting them and counts them per module for the summary.
+
+A declaration must never be stricter than the module's own checks; anything
+it cannot express (say, "not digits only") stays in the module.
+"""
+
+import re
+import weakref
+from collections import Counter
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+from user_scanner.core import registry, telemetry
+
+_KEYS = {"length", "chars", "first", "last"}
+
+
+class HandleRule:
+    """A site's username rules, compiled into one ``fullmatch``."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        unknown = set(spec) - _KEYS
+        if unknown:
+            raise ValueError(f"Unknown HANDLE key(s): {', '.join(sorted(unknown))}")
+        low, high = spec.get("length") or (1, None)
+        if low < 1 or (high is not None and high < low):
+            raise ValueError(f"Invalid HANDLE length: {low}-{high}")
+        self.spec = spec
+
+        pattern = f"(?=.{{{low},{'' if high is None else high}}}\\Z)"
+        if spec.get("first"):
+            pattern += f"[{spec['first']}]"
+        pattern += f"[{spec['chars']}]*" if spec.get("chars") else ".*"
+        if spec.get("last"):
+            # Checked behind the end, so a one-character handle meets both
+            # ``first`` and ``last``.
+            pattern += f"(?<=[{spec['last']}])"
+        self._fullmatch = re.compile(pattern, re.DOTALL).fullmatch
+
+    def admits(self, handle: str) -> bool:
+        return self._fullmatch(handle) is not None
+
+
+def read_spec(value: Any) -> Dict[str, Any]:
+    """A ``HANDLE`` value as registry data (lists, not tuples), checked by compiling it."""
+    if not isinstance(value, dict):
+        raise ValueError("HANDLE must be a dict")
+    spec = {key: list(item) if isinstance(item, tuple) else item for key, item in value.items()}
+    HandleRule(spec)
+    return spec
+
+
+_rules: "weakref.WeakKeyDictionary[ModuleType, Optional[HandleRule]]" = weakref.WeakKeyDictionary()
+
+
+def rule_for(module: ModuleType) -> Optional[HandleRule]:
+    """The module's compiled rule, if it declares one."""
+    try:
+        return _rules[module]
+    except KeyError:
+        pass
+    entry = registry.entry_for(module)
+    # Registry modules are read from their entry, so no source is executed;
+    # anything else (a module built in a test, say) from its own namespace.
+    spec = entry.get("handle") if entry is not None else module.__dict__.get("HANDLE")
+    rule = HandleRule(spec) if spec else None
+    _rules[module] = rule
+    return rule
+
+
+class Pruner:
+    """Skips pairs whose target the module's rule rejects, counting them per module."""
+
+    def __init__(self) -> None:
+        self.pruned: Counter = Counter()
+
+    def rejects(self, target: str, module: ModuleType) -> bool:
+        rule = rule_for(module)
+        return rule is not None and not rule.admits(target)
+
+    def skips(self, target: str, module: ModuleType) -> bool:
+        """``rejects``, counting the pair when it is dropped."""
+        if self.rejects(target, module):
+            self.pruned[telemetry.module_name(module, False)] += 1
+            return True
+        return False
+
+    @property
+    def total(self) -> int:
+        return sum(self.pruned.values())
+
+    def summary(self) -> str:
+        top = ", ".join(f"{name.split('/', 1)[1]} {n}" for name, n in self.pruned.most_common(5))
+        more = f" (+{len(self.pruned) - 5} more)" if len(self.pruned) > 5 else ""
+        return f"{self.total} check(s) not sent, the username being invalid on the site ({top}{more})"
+
+
+_pruner: Optional[Pruner] = Pruner()
+
+
+def set_pruner(pruner: Optional[Pruner]) -> None:
+    global _pruner
+    _pruner = pruner
+
+
+def get_pruner() -> Optional[Pruner]:
+    """The batch pruner; None when pruning is off."""
+    return _pruner
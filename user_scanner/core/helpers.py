@@ -1,8 +1,6 @@
-import importlib
-import importlib.util
 from types import ModuleType
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import inspect
 import json
 import os
@@ -14,7 +12,7 @@ import asyncio
 from dataclasses import dataclass
 from typing import Any, Callable
 
-import httpx
+from user_scanner.core import registry, session
 
 # Pragmatic RFC 5322 / email-validator-style syntax check: an unquoted
 # dot-atom local part, a dotted host name, and an alphabetic TLD. It does not
@@ -86,6 +84,28 @@ def is_valid_email(email: str) -> bool:
     if len(local) > 64 or len(domain) > 253:
         return False
     return bool(EMAIL_RE.fullmatch(email))
+
+
+def iter_target_file(
+    path: str | Path, is_email: bool = False, on_invalid: Optional[Callable[[str], None]] = None
+) -> Iterator[str]:
+    """Yield the targets of a one-per-line file without reading it whole.
+
+    Blank lines and ``#`` comments are dropped; with ``is_email`` a line that is
+    not a valid address is passed to ``on_invalid`` instead of being yielded.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            target = line.strip()
+            if not target or target.startswith("#"):
+                continue
+            if is_email and not is_valid_email(target):
+                if on_invalid:
+                    on_invalid(target)
+                continue
+            yield target
+
+
 def get_site_name(module) -> str:
     name = module.__name__.split(".")[-1].capitalize().replace("_", ".")
     if name == "X":
@@ -95,18 +115,20 @@ def get_site_name(module) -> str:
 
 @functools.lru_cache(maxsize=None)
 def load_modules(category_path: Path) -> List[ModuleType]:
-    modules = []
-    for file in category_path.glob("*.py"):
-        if file.name == "__init__.py":
-            continue
-        spec = importlib.util.spec_from_file_location(file.stem, str(file))
-        if spec is None or spec.loader is None:
-            continue
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+    """The modules of one category, as lazily-executed ``LazyModule`` objects.
+
+    Known scan categories come from the prebuilt registry without touching the
+    module files; any other directory is walked the same way, file by file.
+    """
+    kind = registry.kind_of(category_path)
+    if kind is not None:
+        return [registry.lazy_module(entry) for entry in registry.entries(kind, category_path.name)]
 
-        modules.append(module)
-    return modules
+    return [
+        registry.LazyModule(file.stem, str(file))
+        for file in sorted(category_path.glob("*.py"))
+        if file.name != "__init__.py"
+    ]
 
 
 @functools.lru_cache(maxsize=None)
@@ -146,28 +168,38 @@ def get_scan_func(module) -> Optional[Callable[[str], Any]]:
 
 def find_module(name: str, is_email: bool = False, no_nsfw: bool = False) -> List[ModuleType]:
     name = name.lower()
+    kind = "email" if is_email else "user"
+    categories = load_categories(is_email, no_nsfw)
 
     return [
-        module
-        for category_path in load_categories(is_email, no_nsfw).values()
-        for module in load_modules(category_path)
-        if module.__name__.split(".")[-1].lower() == name
+        registry.lazy_module(entry)
+        for category, modules in registry.load_registry().get(kind, {}).items()
+        if category in categories
+        for entry in modules
+        if entry["stem"].lower() == name
     ]
 
 
+@functools.lru_cache(maxsize=None)
+def _category_names() -> frozenset:
+    return frozenset(load_categories(False)) | frozenset(load_categories(True))
+
+
 def find_category(module: ModuleType) -> str | None:
     module_file = getattr(module, "__file__", None)
     if not module_file:
         return None
 
     category = Path(module_file).parent.name.lower()
-    if category in load_categories(False) or category in load_categories(True):
+    if category in _category_names():
         return category.capitalize()
 
     return None
 
 
 async def _validate_proxy_async(proxy: str, timeout: int) -> Optional[str]:
+    import httpx
+
     try:
         async with httpx.AsyncClient(proxy=proxy, timeout=timeout) as client:
             response = await client.get("http://gstatic.com/generate_204")
@@ -195,7 +227,7 @@ async def _validate_proxies_batch(proxy_list: List[str], timeout: int, max_worke
 
 def validate_proxies(proxy_list: List[str], timeout: int = 5, max_workers: int = 50) -> List[str]:
     """Validate proxies by testing them against gstatic.com/generate_204. Returns list of working proxies."""
-    return asyncio.run(_validate_proxies_batch(proxy_list, timeout, max_workers))
+    return session.run(_validate_proxies_batch(proxy_list, timeout, max_workers))
 
 
 class ProxyManager:
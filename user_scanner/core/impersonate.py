@@ -1,9 +1,10 @@
 import asyncio
 import threading
-from typing import Callable, Literal, Optional
+from typing import Any, Callable, Literal, Optional
 
 from curl_cffi import requests as cffi
 
+from user_scanner.core import ratelimit, retry, telemetry
 from user_scanner.core.helpers import get_global_timeout, get_proxy
 from user_scanner.core.result import Result
 
@@ -15,6 +16,15 @@ _key_locks: dict[tuple, threading.Lock] = {}
 _warmed: set[tuple] = set()
 _lock = threading.Lock()
 
+# Stands in for the curl_cffi sessions while set (see ``replay``); called as
+# ``impersonate_request`` is, and returns any response with the same surface.
+_request_override: Optional[Callable[..., Any]] = None
+
+
+def set_request_override(handler: Optional[Callable[..., Any]]) -> None:
+    global _request_override
+    _request_override = handler
+
 
 def impersonate_validate(
     url: str,
@@ -52,10 +62,42 @@ def impersonate_request(
     impersonating session and return the raw response. Reuses the same cached
     session as ``impersonate_validate`` for a given (impersonate, proxy), so a
     follow-up call (e.g. a profile API request) inherits the clearance cookie.
+
+    Timeouts, dropped connections, 429s and 5xx are retried per ``retry``.
     """
+    send = _request_override or live_request
+
+    def attempt():
+        response = send(method, url, warmup_url=warmup_url, impersonate=impersonate, **kwargs)
+        telemetry.note_response(response)
+        return response
+
+    return retry.send(method, url, attempt, classify=_error_kind)
+
+
+def _error_kind(exc: BaseException) -> retry.ErrorKind:
+    """``retry.error_kind`` for curl_cffi errors (and httpx ones from an override)."""
+    if isinstance(exc, cffi.exceptions.DNSError):
+        return None  # A name that does not resolve now will not in a second.
+    if isinstance(exc, cffi.exceptions.ConnectTimeout):
+        return "connect"
+    if isinstance(exc, (cffi.exceptions.Timeout, cffi.exceptions.ConnectionError)):
+        return "read"
+    return retry.error_kind(exc)
+
+
+def live_request(
+    method: Literal["GET", "POST"],
+    url: str,
+    warmup_url: Optional[str] = None,
+    impersonate: str = DEFAULT_IMPERSONATE,
+    **kwargs,
+) -> cffi.Response:
+    """``impersonate_request`` over the real network, whatever override is set."""
     session = _get_warm_session(impersonate, get_proxy(), warmup_url)
     kwargs.setdefault("timeout", _timeout())
     kwargs.setdefault("allow_redirects", False)
+    ratelimit.wait(url)
     return session.request(method, url, **kwargs)
 
 
@@ -106,6 +148,7 @@ def _get_warm_session(
             if key not in _warmed:
                 # A blocked (403) warm-up still returns normally and sets the cookie;
                 # only a network error leaves the session unwarmed for a later retry.
+                ratelimit.wait(warmup_url)
                 session.get(warmup_url, timeout=_timeout())
                 _warmed.add(key)
 
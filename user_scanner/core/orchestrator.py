@@ -1,9 +1,26 @@
 import asyncio
+import contextvars
 import inspect
-import concurrent.futures
+import time
+import weakref
+from contextvars import ContextVar
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, List, Dict, Optional, Set, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 import threading
 
 import httpx
@@ -20,32 +37,127 @@ from user_scanner.core.helpers import (
     load_modules,
     get_global_timeout,
 )
+from user_scanner.core import client_pool, ratelimit, registry, retry, rules, session, telemetry
+from user_scanner.core.breaker import get_breaker
+from user_scanner.core.cache import get_cache, module_key
+from user_scanner.core.checkpoint import get_journal
+from user_scanner.core.coalesce import BatchFunc, Batches, get_coalescing
+from user_scanner.core.handles import get_pruner
+from user_scanner.core.concurrency import AdaptiveSemaphore, AIMDController
 from user_scanner.core.result import Result
+from user_scanner.core.sinks import emit
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 
 
 MAX_CONCURRENT_REQUESTS = 60
-_shared_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(MAX_CONCURRENT_REQUESTS * 2, 250))
+# -C is the ceiling; the window actually in use adapts beneath it.
+_controller = AIMDController(MAX_CONCURRENT_REQUESTS)
 
 def set_concurrency(val: int):
-    global MAX_CONCURRENT_REQUESTS, _shared_executor
+    global MAX_CONCURRENT_REQUESTS
     MAX_CONCURRENT_REQUESTS = val
-    _shared_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(val * 2, 250))
+    session.get_session().resize(max(val * 2, session.DEFAULT_WORKERS))
+    _controller.set_ceiling(val)
+
+def set_adaptive(enabled: bool):
+    """Pin the in-flight window at the -C ceiling instead of adapting it."""
+    _controller.adaptive = enabled
+    _controller.set_ceiling(MAX_CONCURRENT_REQUESTS)
+
+def get_controller() -> AIMDController:
+    return _controller
+
+
+def scan_progress() -> Progress:
+    """The progress bar every scan shows, including the live in-flight window."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("[dim]window {task.fields[window]}"),
+        transient=True,
+    )
+
 
 async def _async_worker(
     module: ModuleType,
     username: str,
-    sem: asyncio.Semaphore,
+    sem: Union[asyncio.Semaphore, AdaptiveSemaphore],
     configs: ScanConfig,
     printed_cats: Optional[Set] = None,
     cat_override: Optional[str] = None,
-    on_start: Optional[Callable[[str], None]] = None
+    on_start: Optional[Callable[[str], None]] = None,
+    batches: Optional[Batches] = None,
+) -> Result:
+    cache = get_cache()
+    if cache is not None:
+        # Looked up before taking a slot: a hit costs no request, so it should
+        # not wait behind the ones that do.
+        category = cat_override or find_category(module) or "Unknown"
+        key = module_key(module, category, is_email=False)
+        cached = cache.get(key, username)
+        if cached is not None:
+            return cached.update(
+                site_name=get_site_name(module).capitalize(), username=username, category=category
+            )
+
+    breaker = get_breaker(module)
+    if breaker is not None and not breaker.allow():
+        # The site keeps failing: answer without taking a slot or a timeout.
+        return breaker.rejection().update(
+            site_name=get_site_name(module).capitalize(),
+            username=username,
+            category=cat_override or find_category(module) or "Unknown",
+        )
+
+    probe = telemetry.begin(module)
+    result = await _run_module(module, username, sem, configs, cat_override, on_start, batches)
+    telemetry.finish(probe, result)
+    if breaker is not None:
+        breaker.record(result)
+    if cache is not None:
+        cache.put(key, username, result)
+    return result
+
+
+async def _run_module(
+    module: ModuleType,
+    username: str,
+    sem: Union[asyncio.Semaphore, AdaptiveSemaphore],
+    configs: ScanConfig,
+    cat_override: Optional[str] = None,
+    on_start: Optional[Callable[[str], None]] = None,
+    batches: Optional[Batches] = None,
 ) -> Result:
+    if batches is not None and (configs.allow_loud or not is_loud(get_site_name(module))):
+        coalescer = batches.coalescer_for(module)
+        if coalescer is not None:
+            # No slot of its own: the batch takes one when it is sent.
+            telemetry.mark_started()
+            batched = await coalescer.submit(username)
+            if batched is not None:
+                return batched.update(
+                    site_name=get_site_name(module).capitalize(),
+                    username=username,
+                    category=cat_override or find_category(module) or "Unknown",
+                )
+
     async with sem:
+        telemetry.mark_started()
         site_name = get_site_name(module)
         if on_start:
             on_start(site_name)
-        func = get_scan_func(module)
+        rule = rules.rule_for(module)
+        func: Optional[Callable[[str], Any]]
+        if rule is not None:
+            # Declarative sites run on the shared engine; the module is never imported.
+            func = rule.validate
+        else:
+            func = get_scan_func(module)
+            ratelimit.configure_module(module)
+            retry.configure_module(module)
         actual_cat = cat_override or find_category(module) or "Unknown"
 
         params = {
@@ -54,52 +166,94 @@ async def _async_worker(
             "category": actual_cat,
         }
 
-        if not func:
+        if func is None:
             return Result.error(f"{site_name} has no validate_ function", **params)
 
         if not configs.allow_loud and is_loud(site_name):
             return Result.skipped().update(**params)
 
+        started = time.perf_counter()
         try:
             module_timeout = (get_global_timeout() or 15.0) + 10.0
             if inspect.iscoroutinefunction(func):
                 result = await asyncio.wait_for(func(username), timeout=module_timeout)
+            elif is_deferrable(module):
+                result = await asyncio.wait_for(_run_deferred(func, username), timeout=module_timeout)
             else:
                 loop = asyncio.get_running_loop()
+                # The worker thread sees this check's context, so its
+                # requests are credited to it.
+                context = contextvars.copy_context()
                 result = await asyncio.wait_for(
-                    loop.run_in_executor(_shared_executor, func, username),
+                    loop.run_in_executor(session.get_session().executor, context.run, func, username),
                     timeout=module_timeout
                 )
         except asyncio.TimeoutError:
+            telemetry.mark_timed_out()
             result = Result.error(f"Module execution timed out after {module_timeout}s")
         except Exception as e:
             result = Result.error(e)
 
+        result.elapsed = time.perf_counter() - started
+        if isinstance(sem, AdaptiveSemaphore):
+            sem.observe(result, result.elapsed)
+
         return result.update(**params)
 
 
+async def _send_batch(
+    module: ModuleType,
+    func: BatchFunc,
+    usernames: List[str],
+    sem: Union[asyncio.Semaphore, AdaptiveSemaphore],
+) -> Optional[Dict[str, Result]]:
+    """One coalesced request for ``usernames``; None if it failed."""
+    async with sem:
+        ratelimit.configure_module(module)
+        retry.configure_module(module)
+        answers: Optional[Dict[str, Result]] = None
+        # What the window controller sees: the batch, as one request.
+        outcome = Result.available()
+        started = time.perf_counter()
+        module_timeout = (get_global_timeout() or 15.0) + 10.0
+        try:
+            if inspect.iscoroutinefunction(func):
+                answers = await asyncio.wait_for(func(usernames), timeout=module_timeout)
+            else:
+                loop = asyncio.get_running_loop()
+                context = contextvars.copy_context()
+                answers = await asyncio.wait_for(
+                    loop.run_in_executor(session.get_session().executor, context.run, func, usernames),
+                    timeout=module_timeout
+                )
+        except asyncio.TimeoutError:
+            outcome = Result.error(f"Batch timed out after {module_timeout}s")
+        except Exception as e:
+            outcome = Result.error(e)
+
+        elapsed = time.perf_counter() - started
+        if isinstance(sem, AdaptiveSemaphore):
+            sem.observe(outcome, elapsed)
+        for result in (answers or {}).values():
+            result.elapsed = elapsed
+        return answers
+
+
 async def _run_batch(
     modules: List[ModuleType],
     username: str,
     configs: ScanConfig,
     printed_cats: Optional[Set] = None,
     cat_override: Optional[str] = None,
-    sem: Optional[asyncio.Semaphore] = None
+    sem: Optional[AdaptiveSemaphore] = None
 ) -> List[Result]:
     if sem is None:
-        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        sem = AdaptiveSemaphore(_controller)
         
     results = []
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        transient=True,
-    ) as progress:
-        task_id = progress.add_task(f"[cyan]Scanning {username}...", total=len(modules))
+    with scan_progress() as progress:
+        task_id = progress.add_task(f"[cyan]Scanning {username}...", total=len(modules), window=sem.limit)
 
         def on_start_cb(site: str):
             progress.update(task_id, description=f"[cyan]Scanning {username}... ({site})")
@@ -109,7 +263,7 @@ async def _run_batch(
             t = asyncio.create_task(
                 _async_worker(module, username, sem, configs, cat_override=cat_override, on_start=on_start_cb)
             )
-            t.add_done_callback(lambda t: progress.advance(task_id))
+            t.add_done_callback(lambda t: progress.update(task_id, advance=1, window=sem.limit))
             tasks.append(t)
 
         for coro in asyncio.as_completed(tasks):
@@ -123,6 +277,8 @@ async def _run_batch(
                     printed_cats.add(actual_cat)
                     
             result.show(configs)
+                    
+            emit(result)
             results.append(result)
         
     return results
@@ -132,7 +288,7 @@ def run_user_module(
     module: Union[ModuleType, List[ModuleType]], username: str, configs: ScanConfig
 ) -> List[Result]:
     modules = [module] if isinstance(module, ModuleType) else list(module)
-    return asyncio.run(_run_batch(modules, username, configs, printed_cats=set()))
+    return session.run(_run_batch(modules, username, configs, printed_cats=set()))
 
 
 def run_user_category(
@@ -146,7 +302,7 @@ def run_user_category(
         print(f"\n{Fore.MAGENTA}== {category_name.upper()} SITES =={Style.RESET_ALL}")
         printed_cats.add(category_name)
 
-    return asyncio.run(
+    return session.run(
         _run_batch(
             modules,
             username,
@@ -161,7 +317,7 @@ async def _run_user_full_async(username: str, configs: ScanConfig) -> List[Resul
     all_results = []
     printed_cats = set()
 
-    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    sem = AdaptiveSemaphore(_controller)
     
     # 1. Pre-spawn all tasks for all categories (global concurrency)
     category_modules = []
@@ -173,15 +329,8 @@ async def _run_user_full_async(username: str, configs: ScanConfig) -> List[Resul
         total_tasks += len(modules)
 
     # 2. Await tasks category by category to stream grouped output
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        transient=True,
-    ) as progress:
-        task_id = progress.add_task(f"[cyan]Scanning {username}...", total=total_tasks)
+    with scan_progress() as progress:
+        task_id = progress.add_task(f"[cyan]Scanning {username}...", total=total_tasks, window=sem.limit)
         
         def on_start_cb(site: str):
             progress.update(task_id, description=f"[cyan]Scanning {username}... ({site})")
@@ -193,7 +342,7 @@ async def _run_user_full_async(username: str, configs: ScanConfig) -> List[Resul
                 t = asyncio.create_task(
                     _async_worker(module, username, sem, configs, cat_override=display_name, on_start=on_start_cb)
                 )
-                t.add_done_callback(lambda t: progress.advance(task_id))
+                t.add_done_callback(lambda t: progress.update(task_id, advance=1, window=sem.limit))
                 tasks.append(t)
             spawned_category_tasks.append((display_name, tasks))
         
@@ -215,33 +364,262 @@ async def _run_user_full_async(username: str, configs: ScanConfig) -> List[Resul
                         printed_cats.add(display_name)
                         
                 result.show(configs)
+                        
+                emit(result)
                 all_results.append(result)
 
     return all_results
 
 
 def run_user_full(username: str, configs: ScanConfig) -> List[Result]:
-    return asyncio.run(_run_user_full_async(username, configs))
+    return session.run(_run_user_full_async(username, configs))
 
 
+def all_modules(is_email: bool = False, no_nsfw: bool = False) -> List[ModuleType]:
+    """Every module of one scan type, in category order."""
+    return [
+        module
+        for cat_path in load_categories(is_email, no_nsfw).values()
+        for module in load_modules(cat_path)
+    ]
 
 
+async def stream_pairs(
+    targets: Iterable[str],
+    modules: List[ModuleType],
+    run_pair: Callable[[ModuleType, str], Coroutine[Any, Any, Result]],
+    window: int,
+    skip: Optional[Callable[[str, ModuleType], bool]] = None,
+    riders: Optional[Callable[[], int]] = None,
+) -> AsyncIterator[Result]:
+    """Run every (target, module) pair with at most ``window`` in flight.
+
+    Pairs are drawn lazily, target by target, and a new one is started the
+    moment any running one finishes — so a slow site on one target never holds
+    back the next target, and ``targets`` may be an unbounded iterator. Results
+    are yielded in completion order. Pairs for which ``skip`` is true (a
+    resumed scan's finished ones, or usernames a site cannot hold) are never
+    started. ``riders`` counts the running pairs that share another pair's
+    request (see ``core.coalesce``); they do not count against ``window``.
+    """
+    pairs: Iterator[Tuple[str, ModuleType]] = (
+        (target, module)
+        for target in targets
+        for module in modules
+        if skip is None or not skip(target, module)
+    )
+    pending: Set[asyncio.Task] = set()
+    exhausted = False
+
+    try:
+        while True:
+            started = 0
+            while not exhausted and len(pending) - (riders() if riders else 0) < window:
+                try:
+                    target, module = next(pairs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.create_task(run_pair(module, target)))
+                started += 1
+
+            if riders is not None and started:
+                # Let the new pairs reach their batches: each one that joined
+                # another's request frees its place in the window.
+                joined = riders()
+                await asyncio.sleep(0)
+                if riders() > joined:
+                    continue
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # A consumer that stops early must not leave orphaned requests running.
+        for task in pending:
+            task.cancel()
+
+
+async def stream_user_batch(
+    targets: Iterable[str],
+    configs: ScanConfig,
+    modules: Optional[List[ModuleType]] = None,
+    on_start: Optional[Callable[[str], None]] = None,
+    sem: Optional[AdaptiveSemaphore] = None,
+) -> AsyncIterator[Result]:
+    """Scan many usernames in one event loop, yielding each result as it lands.
+
+    ``modules`` defaults to every username module. The global
+    ``MAX_CONCURRENT_REQUESTS`` window stays full across target boundaries;
+    streams running side by side share it by passing one ``sem``. Checks of
+    modules with a ``validate_<site>_batch`` are coalesced into multi-username
+    requests unless batching is off.
+    """
+    if modules is None:
+        modules = all_modules(no_nsfw=configs.no_nsfw)
+    if sem is None:
+        sem = AdaptiveSemaphore(_controller)
+    coalescing = get_coalescing()
+    # A single target has nothing to share a request with.
+    single = isinstance(targets, (list, tuple)) and len(targets) < 2
+    batches = (
+        coalescing.start(lambda module, func, usernames: _send_batch(module, func, usernames, sem))
+        if coalescing is not None and not single
+        else None
+    )
+
+    def run_pair(module: ModuleType, target: str) -> Coroutine[Any, Any, Result]:
+        return _async_worker(module, target, sem, configs, on_start=on_start, batches=batches)
+
+    journal, pruner = get_journal(), get_pruner()
+    checks = [check for check in (journal and journal.done, pruner and pruner.skips) if check]
+    skip = (lambda target, module: any(check(target, module) for check in checks)) if checks else None
+    riders = (lambda: batches.riders) if batches is not None else None
+    async for result in stream_pairs(targets, modules, run_pair, MAX_CONCURRENT_REQUESTS, skip, riders):
+        yield result
+
+
+def count_pairs(targets: Iterable[str], modules: List[ModuleType]) -> Optional[int]:
+    """Pairs a batch will run, for its progress bar; None for a streamed file."""
+    if not isinstance(targets, (list, tuple)):
+        return None
+    journal, pruner = get_journal(), get_pruner()
+    if journal is None and pruner is None:
+        return len(targets) * len(modules)
+    return sum(
+        not (journal is not None and journal.done(target, module))
+        and not (pruner is not None and pruner.rejects(target, module))
+        for target in targets
+        for module in modules
+    )
+
+
+async def _run_user_batch_async(
+    targets: Iterable[str], configs: ScanConfig, modules: Optional[List[ModuleType]], collect: bool = True
+) -> List[Result]:
+    if modules is None:
+        modules = all_modules(no_nsfw=configs.no_nsfw)
+    total = count_pairs(targets, modules)
+    results = []
+
+    with scan_progress() as progress:
+        task_id = progress.add_task("[cyan]Scanning usernames...", total=total, window=_controller.limit)
+
+        def on_start_cb(site: str):
+            progress.update(task_id, description=f"[cyan]Scanning usernames... ({site})")
+
+        async for result in stream_user_batch(targets, configs, modules, on_start=on_start_cb):
+            progress.update(task_id, advance=1, window=_controller.limit)
+            result.show(configs)
+            emit(result)
+            if collect:
+                results.append(result)
+
+    return results
+
+
+def run_user_batch(
+    targets: Iterable[str],
+    configs: ScanConfig,
+    modules: Optional[List[ModuleType]] = None,
+    collect: bool = True,
+) -> List[Result]:
+    """Scan every target against ``modules`` (default: all) in a single run.
+
+    With ``collect=False`` results only reach the registered sinks and the
+    returned list stays empty, so memory does not grow with the batch.
+    """
+    return session.run(_run_user_batch_async(targets, configs, modules, collect))
+
+
+
+
+
+# Set while a deferrable validator runs on the event loop: generic_validate
+# then hands its request back instead of sending it from the loop's thread.
+_deferring: ContextVar[bool] = ContextVar("_deferring", default=False)
+
+
+class DeferredRequest(NamedTuple):
+    url: str
+    func: Callable[[httpx.Response], Result]
+    kwargs: dict
+
+
+def is_deferrable(module: ModuleType) -> bool:
+    """Whether a sync module's validator can run on the loop (see ``registry.deferrable``)."""
+    entry = registry.entry_for(module)
+    return bool(entry and entry.get("deferrable"))
+
+
+async def _run_deferred(func: Callable[[str], Any], username: str) -> Result:
+    token = _deferring.set(True)
+    try:
+        outcome = func(username)
+    finally:
+        _deferring.reset(token)
+
+    if isinstance(outcome, DeferredRequest):
+        return await generic_validate_async(outcome.url, outcome.func, **outcome.kwargs)
+    # Returned early without a request, e.g. a handle the site can't have.
+    return outcome
 
 
 _clients: Dict[tuple, httpx.Client] = {}
 _clients_lock = threading.Lock()
 
 def get_client(use_http2: bool, proxy_val: Optional[str], verify: bool = True) -> httpx.Client:
-    key = (use_http2, proxy_val, verify)
+    override = client_pool.get_transport_override()
+    key = (use_http2, proxy_val, verify, override)
     if key not in _clients:
         with _clients_lock:
             if key not in _clients:
-                _clients[key] = httpx.Client(http2=use_http2, proxy=proxy_val, verify=verify)
+                options: Dict[str, Any] = {"proxy": proxy_val}
+                client_pool.apply_override(options)
+                _clients[key] = httpx.Client(
+                    http2=use_http2,
+                    verify=verify,
+                    event_hooks={
+                        "request": [ratelimit.request_hook],
+                        "response": [telemetry.response_hook],
+                    },
+                    **options,
+                )
     return _clients[key]
 
 
-def make_request(url: str, **kwargs) -> httpx.Response:
-    """Simple wrapper to **httpx.get** that predefines headers and timeout"""
+# Async clients are per event loop, over the loop's pooled transports.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def get_async_client(use_http2: bool, proxy_val: Optional[str], verify: bool = True) -> httpx.AsyncClient:
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    override = client_pool.get_transport_override()
+    # Without a proxy of its own, the client honours the environment's, as
+    # get_client's does; httpx stops reading it once given a transport.
+    mounts = client_pool.env_mounts(use_http2, verify) if proxy_val is None and override is None else {}
+    key = (use_http2, proxy_val, verify, override, tuple(mounts.items()))
+    if key not in clients:
+        clients[key] = httpx.AsyncClient(
+            transport=client_pool.get_client_pool().transport(use_http2, proxy_val, verify),
+            mounts=mounts,
+            # The transport carries the proxy; an explicit None keeps one from
+            # being injected again as a second, private transport.
+            proxy=None,
+            event_hooks={
+                "request": [ratelimit.async_request_hook],
+                "response": [telemetry.async_response_hook],
+            },
+        )
+    return clients[key]
+
+
+def _request_options(kwargs: dict) -> Tuple[str, bool, Optional[str], bool]:
+    """Fill in make_request's defaults and split off the client-level options."""
     if "headers" not in kwargs:
         kwargs["headers"] = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
@@ -267,17 +645,21 @@ def make_request(url: str, **kwargs) -> httpx.Response:
     method = kwargs.pop("method", "GET")
     use_http2 = kwargs.pop("http2", False)
     verify = kwargs.pop("verify", True)
+    return method, use_http2, proxy_val, verify
+
 
+def make_request(url: str, **kwargs) -> httpx.Response:
+    """Simple wrapper to **httpx.get** that predefines headers and timeout"""
+    method, use_http2, proxy_val, verify = _request_options(kwargs)
     client = get_client(use_http2, proxy_val, verify)
+    return retry.send(method, url, lambda: client.request(method.upper(), url, **kwargs))
 
-    max_retries = 0
-    for attempt in range(max_retries + 1):
-        try:
-            return client.request(method.upper(), url, **kwargs)
-        except (httpx.ConnectTimeout, httpx.ReadTimeout) as e:
-            if attempt == max_retries:
-                raise e
-    raise RuntimeError("Request failed after retries")
+
+async def make_request_async(url: str, **kwargs) -> httpx.Response:
+    """``make_request`` for async validators: same defaults, no worker thread."""
+    method, use_http2, proxy_val, verify = _request_options(kwargs)
+    client = get_async_client(use_http2, proxy_val, verify)
+    return await client.request(method.upper(), url, **kwargs)
 
 
 def generic_validate(
@@ -286,6 +668,9 @@ def generic_validate(
     """
     A generic validate function that makes a request and executes the provided function on the response.
     """
+    if _deferring.get():
+        return DeferredRequest(url, func, kwargs)  # type: ignore[return-value]
+
     # Look for 'show_url' in kwargs, if not found, use the request 'url'
     display_url = kwargs.get("show_url", None)
 
@@ -298,6 +683,19 @@ def generic_validate(
         return Result.error(e, url=display_url)
 
 
+async def generic_validate_async(
+    url: str, func: Callable[[httpx.Response], Result], **kwargs
+) -> Result:
+    """``generic_validate`` for async validators."""
+    display_url = kwargs.get("show_url", None)
+
+    try:
+        response = await make_request_async(url, **kwargs)
+        return func(response).update(url=display_url)
+    except Exception as e:
+        return Result.error(e, url=display_url)
+
+
 def status_validate(
     url: str, available: int | List[int], taken: int | List[int], **kwargs
 ) -> Result:
@@ -306,7 +704,20 @@ def status_validate(
     checks if the request status matches the available or taken.
     **Available** and **Taken** must either be whole numbers or lists of whole numbers.
     """
+    # We pass all kwargs (including show_url if it exists) to generic_validate
+    return generic_validate(url, _status_matcher(available, taken), **kwargs)
+
 
+async def status_validate_async(
+    url: str, available: int | List[int], taken: int | List[int], **kwargs
+) -> Result:
+    """``status_validate`` for async validators."""
+    return await generic_validate_async(url, _status_matcher(available, taken), **kwargs)
+
+
+def _status_matcher(
+    available: int | List[int], taken: int | List[int]
+) -> Callable[[httpx.Response], Result]:
     def inner(response: httpx.Response):
         # Checks if a number is equal or is contained inside
         def contains(a, b):
@@ -325,5 +736,4 @@ def status_validate(
             return Result.taken()
         return Result.error(f"[{status}] Status didn't match. Report this on Github.")
 
-    # We pass all kwargs (including show_url if it exists) to generic_validate
-    return generic_validate(url, inner, **kwargs)
+    return inner
@@ -1,7 +1,9 @@
 import itertools
+import math
+import operator
 import random
 from dataclasses import dataclass
-from typing import Iterator, List, Set
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -15,17 +17,19 @@ Block = str | PatternBlock
 
 class Lexer:
     def __init__(self, input: str) -> None:
-        self.tokens = list(input)
+        self.input = input
+        self.pos = 0
 
     def peek(self) -> str:
-        if self.tokens:
-            return self.tokens[0]
+        if self.pos < len(self.input):
+            return self.input[self.pos]
         return ""
 
     def next(self) -> str:
-        if self.tokens:
-            return self.tokens.pop(0)
-        return ""
+        cur = self.peek()
+        if cur:
+            self.pos += 1
+        return cur
 
     def parse_number(self) -> int | None:
         res = None
@@ -111,25 +115,18 @@ def _parse_lenset(lexer: Lexer) -> Set[int]:
     return lenset
 
 
-def _append_string(blocks: list, new: str):
-    if not blocks:
-        blocks.append(new)
-    elif isinstance(blocks[-1], str):
-        blocks[-1] += new
-    else:
-        blocks.append(new)
-
-
 def _parse_patterns(input: str) -> List[Block]:
     lexer = Lexer(input)
     res: List[Block] = []
+    # Runs of literal text are joined once, not one "+=" per character.
+    literal: List[str] = []
 
     while lexer.peek():
         cur = lexer.next()
 
         if cur == "\\":
             if lexer.peek() in ("[", "]", "\\"):
-                _append_string(res, lexer.next())
+                literal.append(lexer.next())
 
         elif cur == "[":
             charset = _parse_charset(lexer)
@@ -140,6 +137,9 @@ def _parse_patterns(input: str) -> List[Block]:
             else:
                 lenset.add(1)
 
+            if literal:
+                res.append("".join(literal))
+                literal.clear()
             res.append(PatternBlock(charset=sorted(charset), lenset=sorted(lenset)))
 
         elif cur == "]":
@@ -148,7 +148,10 @@ def _parse_patterns(input: str) -> List[Block]:
             raise ValueError('Invalid unescaped "]"')
 
         else:
-            _append_string(res, cur)
+            literal.append(cur)
+
+    if literal:
+        res.append("".join(literal))
 
     return res
 
@@ -192,34 +195,191 @@ def expand_patterns(input: str) -> Iterator[str]:
     yield from _iter_pattern(blocks)
 
 
-def expand_patterns_random(input: str, capacity: int = 1000) -> Iterator[str]:
-    """Expand a pattern string in randomized order using reservoir sampling.
+# Largest lookup table a block keeps: each digit of an index then spells a
+# whole chunk of characters instead of one.
+_CHUNK_TABLE_LIMIT = 1 << 16
 
-    Yields the same set of results as expand_patterns, but in a shuffled order.
-    For small result sets (<= capacity), all items are buffered and shuffled.
-    For larger sets, reservoir sampling ensures uniform randomness without
-    loading everything into memory at once.
-    """
-    patterns = expand_patterns(input)
-    buffer = []
 
-    for _ in range(capacity):
-        try:
-            buffer.append(next(patterns))
-        except StopIteration:
-            random.shuffle(buffer)
-            yield from buffer
-            return
+def _block_digits(block: PatternBlock) -> List[Tuple[int, Callable[[int], str]]]:
+    """A block's digits as ``(radix, decode)`` pairs, most significant first.
 
-    random.shuffle(buffer)
+    A string of one length is a number in base ``len(charset)``, so a block
+    with a single length splits into digits that each look a chunk of its
+    characters up in a table. A block with several lengths is one digit whose
+    value picks the length (shortest first) and then the string.
+    """
+    base = len(block.charset)
+    longest = max(block.lenset, default=0)
+    chunk = 1
+    while base > 1 and chunk < longest and base ** (chunk + 1) <= _CHUNK_TABLE_LIMIT:
+        chunk += 1
+    tables = [["".join(combo) for combo in itertools.product(block.charset, repeat=k)] for k in range(chunk + 1)]
+
+    # Per length: its count and its chunk tables, least significant first.
+    layouts = []
+    for length in block.lenset:
+        full, head = divmod(length, chunk)
+        layouts.append((base**length, [tables[chunk]] * full + ([tables[head]] if head else [])))
+
+    if len(layouts) == 1:
+        return [(len(table), table.__getitem__) for table in reversed(layouts[0][1])]
+
+    def decode(value: int) -> str:
+        for count, layout in layouts:
+            if value < count:
+                break
+            value -= count
+        parts = []
+        for table in layout:
+            value, d = divmod(value, len(table))
+            parts.append(table[d])
+        return "".join(reversed(parts))
+
+    return [(sum(count for count, _ in layouts), decode)]
+
+
+class PatternSpace:
+    """Every expansion of a pattern, addressable by its position in ``expand_patterns`` order.
+
+    The pattern is read as a mixed-radix number, the first block the most
+    significant: each ``[...]{...}`` block contributes one digit value per
+    expansion (shortest lengths first, then the charset product in order) and
+    literal text contributes none. ``space[i]`` decodes index ``i`` digit by
+    digit, so any candidate costs O(number of blocks) without generating the
+    ones before it.
+
+    ``size`` is the number of expansions. ``len()`` returns the same, but
+    overflows past ``sys.maxsize`` on huge patterns.
+    """
 
-    for item in patterns:
-        pos = random.randrange(capacity)
-        buffer[pos], item = item, buffer[pos]
-        yield item
+    def __init__(self, input: str) -> None:
+        self.blocks = _parse_patterns(input)
+        self._pieces: List[str] = []
+        # (piece position, radix, decode), least significant first.
+        self._digits: List[Tuple[int, int, Callable[[int], str]]] = []
+        for block in self.blocks:
+            if isinstance(block, str):
+                self._pieces.append(block)
+                continue
+            for radix, decode in _block_digits(block):
+                self._digits.insert(0, (len(self._pieces), radix, decode))
+                self._pieces.append("")
+        self.size = math.prod(radix for _, radix, _ in self._digits)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("pattern index out of range")
+        return next(self.take((index,)))
+
+    def __iter__(self) -> Iterator[str]:
+        return _iter_pattern(self.blocks)
+
+    def take(self, indices: Iterable[int]) -> Iterator[str]:
+        """The expansion at each of ``indices``, which must be in range; ``self[i]`` in bulk.
+
+        Built from ``map`` over ``operator`` functions and table lookups, so
+        the per-candidate work runs in C rather than in a Python loop.
+        """
+        if not self._digits:
+            text = "".join(self._pieces)
+            return (text for _ in indices)
+
+        streams = {}
+        rest = iter(indices)
+        for position, radix, decode in self._digits[:-1]:
+            rest, here = itertools.tee(rest)
+            streams[position] = map(decode, map(operator.mod, here, itertools.repeat(radix)))
+            rest = map(operator.floordiv, rest, itertools.repeat(radix))
+        position, _, decode = self._digits[-1]
+        streams[position] = map(decode, rest)
+
+        template = "".join(
+            "{}" if i in streams else piece.replace("{", "{{").replace("}", "}}")
+            for i, piece in enumerate(self._pieces)
+        )
+        return map(template.format, *(streams[i] for i in sorted(streams)))
+
+
+class IndexPermutation:
+    """A seeded pseudo-random bijection on ``range(size)``, evaluated one index at a time.
+
+    Two rounds of xor-with-key, multiply-by-odd-key and xorshift, each a
+    bijection on ``bits``-bit integers, shuffle the smallest power of two
+    covering ``size``. A value that lands past ``size`` goes round again
+    (cycle-walking) until it falls inside, which keeps the whole a bijection
+    on ``range(size)``; the domain is under twice ``size``, so that takes
+    under two passes on average. Nothing is stored, and the same seed gives
+    the same order on every machine.
+    """
 
-    random.shuffle(buffer)
-    yield from buffer
+    def __init__(self, size: int, seed: int = 0) -> None:
+        self.size = size
+        bits = max(1, (size - 1).bit_length())
+        self._mask = (1 << bits) - 1
+        self._shift = (bits + 1) // 2
+        keys = random.Random(seed)
+        self._keys = [(keys.getrandbits(bits), keys.getrandbits(bits) | 1) for _ in range(2)]
+
+    def _shuffle(self, index: int) -> int:
+        for key, multiplier in self._keys:
+            index = ((index ^ key) * multiplier) & self._mask
+            index ^= index >> self._shift
+        return index
+
+    def __call__(self, index: int) -> int:
+        index = self._shuffle(index)
+        while index >= self.size:
+            index = self._shuffle(index)
+        return index
+
+    def map(self, positions: Iterable[int]) -> Iterator[int]:
+        """The permuted index for each of ``positions``; ``self(p)`` in bulk."""
+        repeat = itertools.repeat
+        stream = iter(positions)
+        for key, multiplier in self._keys:
+            stream = map(operator.xor, stream, repeat(key))
+            stream = map(operator.and_, map(operator.mul, stream, repeat(multiplier)), repeat(self._mask))
+            stream, shifted = itertools.tee(stream)
+            stream = map(operator.xor, stream, map(operator.rshift, shifted, repeat(self._shift)))
+
+        size, shuffle = self.size, self._shuffle
+        for index in stream:
+            while index >= size:
+                index = shuffle(index)
+            yield index
+
+
+def expand_patterns_random(
+    input: str,
+    capacity: int = 1000,
+    *,
+    seed: Optional[int] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    start: int = 0,
+) -> Iterator[str]:
+    """Expand a pattern string in randomized order.
+
+    Yields the same set of results as expand_patterns, ordered by a seeded
+    permutation of their indices (``IndexPermutation``) and decoded straight
+    from ``PatternSpace``. Nothing is buffered, so the order is uniform over
+    the whole space and the first candidate of a huge pattern comes as soon
+    as the first of a small one. ``capacity`` is ignored; it sized the
+    reservoir this used to shuffle through.
+
+    ``seed`` fixes the order (random when None). ``shard=(i, n)`` keeps only
+    positions ``i, i + n, i + 2n, ...`` of that order, so ``n`` machines given
+    the same seed split the space without overlap. ``start`` skips that many
+    of the shard's candidates, to resume a run that already scanned them.
+    """
+    space = PatternSpace(input)
+    order = IndexPermutation(space.size, random.getrandbits(64) if seed is None else seed)
+    index, count = shard or (0, 1)
+    yield from space.take(order.map(range(index + start * count, space.size, count)))
 
 
 def count_patterns(input: str) -> int:
@@ -235,3 +395,23 @@ def count_patterns(input: str) -> int:
         if isinstance(block, PatternBlock):
             total *= sum(len(block.charset) ** length for length in block.lenset)
     return total
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """``"I/N"`` (1-based, as on the command line) to ``(I - 1, N)``."""
+    index, sep, count = value.partition("/")
+    try:
+        i, n = int(index), int(count)
+    except ValueError:
+        raise ValueError(f'Invalid shard "{value}", expected I/N such as 1/4') from None
+    if not sep or not 1 <= i <= n:
+        raise ValueError(f'Invalid shard "{value}", expected I/N with 1 <= I <= N')
+    return i - 1, n
+
+
+def shard_size(total: int, shard: Optional[Tuple[int, int]]) -> int:
+    """How many of ``total`` expansions fall in ``shard``."""
+    if shard is None:
+        return total
+    index, count = shard
+    return len(range(index, total, count))
@@ -0,0 +1,159 @@
+"""Per-host request pacing shared by every HTTP path in the scanner.
+
+A batch scan fires the same site's check once per target, so a handful of
+hosts take most of the load. Each host gets a token bucket; a request that
+would overdraw it waits its turn instead of being sent into a 429. Waits are
+reserved up front, so concurrent callers queue in order rather than polling.
+
+The curl_cffi sessions in ``impersonate`` consult the limiter directly; httpx
+clients — ``make_request``'s pooled ones and every client an email module
+builds — do so through the ``request`` event hook.
+"""
+
+import asyncio
+import threading
+import time
+from types import ModuleType
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+# (requests per second, burst). Matched against the request host and every
+# parent domain, so "github.com" also paces api.github.com.
+DEFAULT_HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+    "github.com": (5.0, 10),
+    "reddit.com": (2.0, 4),
+    "instagram.com": (1.0, 3),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out waits instead of blocking."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait to use it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        default: Optional[Tuple[float, int]] = None,
+    ):
+        self.limits = dict(DEFAULT_HOST_LIMITS if limits is None else limits)
+        self.default = default
+        self.enabled = True
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, host: str, rate: float, burst: int) -> None:
+        with self._lock:
+            self.limits[host.lower()] = (rate, burst)
+            self._buckets.clear()
+
+    def set_default(self, limit: Optional[Tuple[float, int]]) -> None:
+        with self._lock:
+            self.default = limit
+            self._buckets.clear()
+
+    def bucket(self, host: Optional[str]) -> Optional[TokenBucket]:
+        if not self.enabled or not host:
+            return None
+        host = host.lower()
+        try:
+            return self._buckets[host]
+        except KeyError:
+            pass
+
+        with self._lock:
+            key, limit = self._match(host)
+            if limit is None:
+                bucket = None
+            else:
+                # Subdomains matched by one entry share that entry's bucket.
+                bucket = self._buckets.get(key) or TokenBucket(*limit)
+                self._buckets[key] = bucket
+            self._buckets[host] = bucket
+        return bucket
+
+    def _match(self, host: str) -> Tuple[str, Optional[Tuple[float, int]]]:
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            candidate = ".".join(labels[i:])
+            if candidate in self.limits:
+                return candidate, self.limits[candidate]
+        return host, self.default
+
+    def delay(self, url: str) -> float:
+        bucket = self.bucket(urlsplit(url).hostname)
+        return bucket.reserve() if bucket else 0.0
+
+
+_limiter = HostRateLimiter()
+
+
+def get_limiter() -> HostRateLimiter:
+    return _limiter
+
+
+def set_host_rate(rate: Optional[float], burst: Optional[int] = None) -> None:
+    """Pace every host without an entry of its own at ``rate`` requests/sec.
+
+    ``0`` turns pacing off entirely, the known-host defaults included.
+    """
+    if rate is not None and rate <= 0:
+        _limiter.enabled = False
+        return
+    _limiter.enabled = True
+    _limiter.set_default((rate, burst or max(1, int(rate))) if rate else None)
+
+
+def set_host_limit(host: str, rate: float, burst: int = 1) -> None:
+    _limiter.set_limit(host, rate, burst)
+
+
+def configure_module(module: ModuleType) -> None:
+    """Apply a module's own ``RATE_LIMITS = {host: (rate, burst)}`` override."""
+    for host, (rate, burst) in (getattr(module, "RATE_LIMITS", None) or {}).items():
+        if _limiter.limits.get(host.lower()) != (rate, burst):
+            _limiter.set_limit(host, rate, burst)
+
+
+def wait(url: str) -> None:
+    """Block the calling (worker) thread until ``url``'s host may be hit."""
+    pause = _limiter.delay(url)
+    if pause > 0:
+        time.sleep(pause)
+
+
+async def wait_async(url: str) -> None:
+    pause = _limiter.delay(url)
+    if pause > 0:
+        await asyncio.sleep(pause)
+
+
+def request_hook(request: httpx.Request) -> None:
+    """``event_hooks["request"]`` entry for ``httpx.Client``."""
+    wait(str(request.url))
+
+
+async def async_request_hook(request: httpx.Request) -> None:
+    """``event_hooks["request"]`` entry for ``httpx.AsyncClient``."""
+    await wait_async(str(request.url))
@@ -0,0 +1,444 @@
+"""Prebuilt index of every scan module, so discovery does not execute them.
+
+Listing modules, resolving ``-m github`` or scheduling a category used to
+exec all ~500 module files up front, importing httpx, curl_cffi and each
+site's helpers before the first request. The registry records what discovery
+needs — stem, category, file, site name, validate function, async flag and
+loud flag — in ``registry.json`` next to the package, read in one go. It also
+marks the modules whose one request the orchestrator may send itself (see
+``deferrable``), and keeps their ``HANDLE`` username rules (see
+``core.handles``).
+
+Modules come back as ``LazyModule`` objects: real ``ModuleType`` instances
+whose source only runs on first attribute access, which in practice is when
+the orchestrator schedules them.
+
+Regenerate after adding, editing, renaming or removing a module with::
+
+    python -m user_scanner.core.registry
+
+Each entry carries a digest of its file's contents. A start normally reads
+only ``registry.json`` and the sizes and mtimes of the module files, checked
+against a stamp kept in the user's cache directory. When they differ, every
+file is hashed and an entry whose file was added, changed or removed is
+described again from source, still without executing anything. The refreshed
+registry replaces the file atomically when the install is writable; otherwise
+this process works from its in-memory copy. A stale file costs time, not
+correctness. Bump ``FORMAT`` when ``describe`` changes what it derives from a
+file, so every entry is redone.
+"""
+
+import ast
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple, Union
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+REGISTRY_PATH = PACKAGE_ROOT / "registry.json"
+KINDS = {"user": "user_scan", "email": "email_scan"}
+# Part of every digest: changing it invalidates every entry.
+FORMAT = b"registry/3"
+
+
+class LazyModule(ModuleType):
+    """A scan module that executes its source on first attribute access."""
+
+    def __init__(self, name: str, file: str):
+        super().__init__(name)
+        self.__file__ = file
+        self._lazy_lock = threading.RLock()
+        self._lazy_state = "pending"
+
+    def _lazy_load(self) -> None:
+        with self._lazy_lock:
+            if self._lazy_state != "pending":
+                return
+            self._lazy_state = "loading"
+            try:
+                spec = importlib.util.spec_from_file_location(self.__name__, self.__file__)
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"Cannot load module from {self.__file__}")
+                self.__spec__ = spec
+                self.__loader__ = spec.loader
+                # Executes the file in this object's own namespace, so every
+                # reference already handed out sees the loaded module.
+                spec.loader.exec_module(self)
+            except BaseException:
+                self._lazy_state = "pending"
+                raise
+            self._lazy_state = "loaded"
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_state == "loaded"
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("_lazy") or self.__dict__.get("_lazy_state") == "loaded":
+            raise AttributeError(f"module {self.__name__!r} has no attribute {attr!r}")
+        # Another thread mid-load holds the lock, so this waits for it to finish.
+        self._lazy_load()
+        try:
+            return self.__dict__[attr]
+        except KeyError:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {attr!r}") from None
+
+    def __dir__(self):
+        self._lazy_load()
+        return super().__dir__()
+
+
+def _scan_root(kind: str) -> Path:
+    return PACKAGE_ROOT / KINDS[kind]
+
+
+def _category_dirs(kind: str) -> Dict[str, Path]:
+    root = _scan_root(kind)
+    return {
+        entry.name: Path(entry.path)
+        for entry in os.scandir(root)
+        if entry.is_dir() and "__" not in entry.name
+    }
+
+
+def _module_files(category_dir: Path) -> List[str]:
+    """Module sources and ``.json`` rule files, sorted by stem."""
+    return sorted(
+        (entry.name for entry in os.scandir(category_dir)
+         if entry.name.endswith((".py", ".json")) and entry.name != "__init__.py"),
+        key=lambda name: name.rsplit(".", 1)[0],
+    )
+
+
+def _digest(path: Path) -> str:
+    # Line endings normalised, so a CRLF checkout matches the shipped file.
+    data = path.read_bytes().replace(b"\r\n", b"\n")
+    return hashlib.blake2b(FORMAT + data, digest_size=8).hexdigest()
+
+
+# A module naming any of these does I/O of its own somewhere, which would
+# block the event loop if its validator ran there.
+_BLOCKING_NAMES = frozenset({
+    "make_request", "httpx", "requests", "curl_cffi", "urlopen", "socket",
+    "subprocess", "sleep", "asyncio", "threading",
+})
+_DEFERRABLE_CALLS = ("generic_validate", "status_validate")
+
+
+def _referenced_names(tree: ast.AST) -> set:
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            names.add(node.attr)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            if isinstance(node, ast.ImportFrom) and node.module:
+                names.update(node.module.split("."))
+            for alias in node.names:
+                names.update(alias.name.split("."))
+                names.add(alias.asname or alias.name)
+    return names
+
+
+def _reachable_names(tree: ast.Module, func: ast.FunctionDef) -> set:
+    """Names ``func`` can reach: its own, and those of the module-level
+    functions, classes, assignments and imports it uses, followed through.
+
+    Other top-level statements run when the module is imported, so they
+    always count.
+    """
+    defined: Dict[str, List[set]] = {}
+    names: set = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node is not func:
+                defined.setdefault(node.name, []).append(_referenced_names(node))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            module = node.module.split(".") if isinstance(node, ast.ImportFrom) and node.module else []
+            for alias in node.names:
+                bound = alias.asname or alias.name.split(".")[0]
+                defined.setdefault(bound, []).append({bound, *alias.name.split("."), *module})
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            assigned = [target.id for target in targets if isinstance(target, ast.Name)]
+            if len(assigned) == len(targets):
+                for target_name in assigned:
+                    defined.setdefault(target_name, []).append(_referenced_names(node))
+            else:
+                names |= _referenced_names(node)
+        elif not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)):
+            names |= _referenced_names(node)
+
+    pending = list(_referenced_names(func) | names)
+    while pending:
+        name = pending.pop()
+        if name in names and name not in defined:
+            continue
+        names.add(name)
+        for used in defined.pop(name, []):
+            pending.extend(used - names)
+    return names
+
+
+def deferrable(tree: ast.Module, func: ast.FunctionDef) -> bool:
+    """Whether a sync validator's only I/O is the ``generic_validate`` or
+    ``status_validate`` call it ends with.
+
+    Such a validator can run on the event loop: it just builds a request,
+    which the orchestrator then sends asynchronously instead of parking a
+    worker thread on it.
+    """
+    last = func.body[-1] if func.body else None
+    if not (
+        isinstance(last, ast.Return)
+        and isinstance(last.value, ast.Call)
+        and isinstance(last.value.func, ast.Name)
+        and last.value.func.id in _DEFERRABLE_CALLS
+    ):
+        return False
+    calls = [
+        node for node in ast.walk(func)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _DEFERRABLE_CALLS
+    ]
+    # Code the validator never reaches, such as a validate_<site>_batch (see
+    # ``core.coalesce``) that runs on a worker thread, does not count.
+    names = _reachable_names(tree, func)
+    return (
+        len(calls) == 1
+        and not names & _BLOCKING_NAMES
+        and not any(name.startswith("impersonate") for name in names)
+    )
+
+
+def _handle(tree: ast.Module) -> Optional[dict]:
+    """A module's ``HANDLE = {...}`` declaration (see ``core.handles``), if it has one."""
+    from user_scanner.core.handles import read_spec
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "HANDLE" for target in node.targets
+        ):
+            return read_spec(ast.literal_eval(node.value))
+    return None
+
+
+def describe(path: Path, kind: str) -> dict:
+    """Registry entry for one module file, read from its syntax tree."""
+    from user_scanner.core.helpers import get_site_name, is_loud
+    from user_scanner.core.rules import Rule, extract_rule
+
+    stem = path.stem
+    site_name = get_site_name(ModuleType(stem))
+    if path.suffix == ".json":
+        spec = json.loads(path.read_text(encoding="utf-8"))
+        Rule(spec)  # A broken rule file fails here, not mid-scan.
+        return {
+            "stem": stem,
+            "path": path.relative_to(PACKAGE_ROOT).as_posix(),
+            "digest": _digest(path),
+            "site_name": site_name,
+            "validate": f"validate_{stem}",
+            "async": True,
+            "deferrable": False,
+            "loud": is_loud(site_name, is_email=kind == "email"),
+            "rule": spec,
+            "handle": None,
+        }
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    candidates: Dict[str, Union[ast.FunctionDef, ast.AsyncFunctionDef]] = {}
+    for stmt in tree.body:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)) and stmt.name.startswith("validate_"):
+            candidates[stmt.name] = stmt
+
+    # get_scan_func takes the first validate_ function in dir() order.
+    validate = min(candidates) if candidates else None
+    node = candidates[validate] if validate is not None else None
+    is_deferrable = isinstance(node, ast.FunctionDef) and deferrable(tree, node)
+    # Checked by the rule engine without importing the module at all.
+    rule = extract_rule(tree, node) if isinstance(node, ast.FunctionDef) and is_deferrable and kind == "user" else None
+    return {
+        "stem": stem,
+        "path": path.relative_to(PACKAGE_ROOT).as_posix(),
+        "digest": _digest(path),
+        "site_name": site_name,
+        "validate": validate,
+        "async": isinstance(node, ast.AsyncFunctionDef),
+        "deferrable": is_deferrable,
+        "loud": is_loud(site_name, is_email=kind == "email"),
+        "rule": rule,
+        # Lets the batch scheduler drop usernames the site cannot hold.
+        "handle": _handle(tree) if kind == "user" else None,
+    }
+
+
+def build_registry() -> dict:
+    registry: dict = {}
+    for kind in KINDS:
+        registry[kind] = {
+            category: [describe(category_dir / name, kind) for name in _module_files(category_dir)]
+            for category, category_dir in sorted(_category_dirs(kind).items())
+        }
+    return registry
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Replace ``path`` in one step, so a concurrent reader never sees half a file."""
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(temp, 0o644)
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+
+def write_registry(path: Optional[Path] = None, registry: Optional[dict] = None) -> dict:
+    registry = build_registry() if registry is None else registry
+    path = REGISTRY_PATH if path is None else path
+    _write_atomic(path, json.dumps(registry, indent=1, sort_keys=True) + "\n")
+    return registry
+
+
+def _stamp() -> str:
+    """Sizes and mtimes of the module files and of ``registry.json``, hashed."""
+    stamp = hashlib.blake2b(FORMAT, digest_size=8)
+    for path in [REGISTRY_PATH] + [
+        category_dir / name
+        for kind in KINDS
+        for _, category_dir in sorted(_category_dirs(kind).items())
+        for name in _module_files(category_dir)
+    ]:
+        try:
+            stat = path.stat()
+            stamp.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            stamp.update(f"{path}:missing\n".encode())
+    return stamp.hexdigest()
+
+
+def _stamp_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    # One stamp per install.
+    install = hashlib.blake2b(str(PACKAGE_ROOT).encode(), digest_size=8).hexdigest()
+    return Path(base) / "user-scanner" / f"registry-{install}.stamp"
+
+
+def _refresh(registry: dict, kind: str) -> Tuple[dict, bool]:
+    """``kind``'s entries matched against the files on disk, and whether any
+    had to be described again."""
+    known = registry.get(kind)
+    known = known if isinstance(known, dict) else {}
+    refreshed: dict = {}
+    changed = False
+    for category, category_dir in sorted(_category_dirs(kind).items()):
+        previous = {
+            entry.get("path"): entry for entry in known.get(category, []) if isinstance(entry, dict)
+        }
+        current = []
+        for name in _module_files(category_dir):
+            path = category_dir / name
+            entry = previous.get(path.relative_to(PACKAGE_ROOT).as_posix())
+            if entry is None or entry.get("digest") != _digest(path):
+                entry = describe(path, kind)
+                changed = True
+            current.append(entry)
+        changed = changed or len(current) != len(previous)
+        refreshed[category] = current
+    return refreshed, changed or set(refreshed) != set(known)
+
+
+@functools.lru_cache(maxsize=None)
+def load_registry() -> dict:
+    try:
+        registry = json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        registry = {}
+    if not isinstance(registry, dict):
+        registry = {}
+
+    stamp_path = _stamp_path()
+    try:
+        current = stamp_path.read_text(encoding="utf-8") == _stamp()
+    except OSError:
+        current = False
+    if current and all(isinstance(registry.get(kind), dict) for kind in KINDS):
+        return {kind: registry[kind] for kind in KINDS}
+
+    refreshed = {kind: _refresh(registry, kind) for kind in KINDS}
+    registry = {kind: entries for kind, (entries, _) in refreshed.items()}
+    try:
+        if any(changed for _, changed in refreshed.values()):
+            write_registry(registry=registry)
+        # Only once the file on disk matches the tree.
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(stamp_path, _stamp())
+    except OSError:
+        pass  # A read-only install still works from the in-memory rebuild.
+    return registry
+
+
+def entries(kind: str, category: str) -> List[dict]:
+    return load_registry().get(kind, {}).get(category, [])
+
+
+@functools.lru_cache(maxsize=None)
+def _entries_by_path() -> Dict[str, dict]:
+    return {
+        str(PACKAGE_ROOT / entry["path"]): entry
+        for kind in load_registry().values()
+        for category in kind.values()
+        for entry in category
+    }
+
+
+def entry_for(module: ModuleType) -> Optional[dict]:
+    """The registry entry of a scan module, if it is one."""
+    return _entries_by_path().get(getattr(module, "__file__", None) or "")
+
+
+def kind_of(category_path: Path) -> Optional[str]:
+    parent = category_path.parent.name
+    return next((kind for kind, folder in KINDS.items() if folder == parent), None)
+
+
+_lazy_modules: Dict[str, ModuleType] = {}
+_lazy_lock = threading.Lock()
+
+
+def lazy_module(entry: dict) -> ModuleType:
+    """The one module object for an entry, shared by every lookup.
+
+    A ``.json`` rule file becomes a ``RuleModule``; a source file a
+    ``LazyModule``.
+    """
+    path = str(PACKAGE_ROOT / entry["path"])
+    with _lazy_lock:
+        module = _lazy_modules.get(path)
+        if module is None:
+            if path.endswith(".json"):
+                from user_scanner.core.rules import RuleModule
+
+                module = RuleModule(entry["stem"], path, entry["rule"])
+            else:
+                module = LazyModule(entry["stem"], path)
+            _lazy_modules[path] = module
+    return module
+
+
+if __name__ == "__main__":
+    written = write_registry()
+    total = sum(len(mods) for kind in written.values() for mods in kind.values())
+    print(f"Wrote {total} modules to {REGISTRY_PATH}")
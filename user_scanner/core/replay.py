@@ -0,0 +1,290 @@
+"""Record and replay the scanner's HTTP traffic from a fixture directory.
+
+Throughput could only be measured against live sites, and tests patched
+``make_request`` one module at a time. ``RecordingTransport`` sits under every
+client a real scan builds and saves each exchange as a fixture;
+``ReplayTransport`` later serves those fixtures back, with latency drawn from
+a configurable distribution, so whole pipelines run offline and repeatably.
+
+Both are installed through the scanner's existing choke points: the transport
+override in ``client_pool`` (every ``httpx.Client`` and ``AsyncClient``,
+pooled or not) and the request override in ``impersonate`` (the curl_cffi
+sessions). Replayed curl_cffi calls get an ``httpx.Response``, which has the
+``status_code``/``text``/``json()``/``headers`` surface modules use.
+
+Fixtures are JSON files named by a hash of method, URL and body, grouped per
+host. A request whose body differs from every recording (a timestamp, a
+nonce) falls back to the latest fixture for the same method and URL.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Literal, Optional, Protocol, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+import user_scanner.core.email_orchestrator  # noqa: F401  (patches the httpx clients the override rides on)
+from user_scanner.core import client_pool, impersonate
+
+# Describe the stored (decoded) body wrongly, or not at all, on replay.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+class Latency:
+    """Per-response delay, parsed from a spec.
+
+    ``0`` or ``none``; ``fixed:S`` (or just ``S``); ``uniform:LO,HI``;
+    ``lognormal:MEDIAN,SIGMA``; ``recorded`` replays each fixture's own
+    timing. All values are seconds.
+    """
+
+    def __init__(self, spec: str = "recorded", rng: Optional[random.Random] = None):
+        self.spec = spec
+        self._rng = rng or random.Random()
+        kind, _, args = spec.partition(":")
+        try:
+            values = [float(v) for v in args.split(",")] if args else []
+            if kind in ("0", "none"):
+                self._sample = lambda recorded: 0.0
+            elif kind == "recorded":
+                self._sample = lambda recorded: recorded
+            elif kind == "fixed" and len(values) == 1:
+                self._sample = lambda recorded: values[0]
+            elif kind == "uniform" and len(values) == 2:
+                self._sample = lambda recorded: self._rng.uniform(*values)
+            elif kind == "lognormal" and len(values) == 2:
+                mu = math.log(values[0])
+                self._sample = lambda recorded: self._rng.lognormvariate(mu, values[1])
+            elif not args:
+                fixed = float(kind)
+                self._sample = lambda recorded: fixed
+            else:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Invalid latency spec: {spec!r}") from None
+
+    def sample(self, recorded: float = 0.0) -> float:
+        return max(0.0, self._sample(recorded))
+
+
+def _key(method: str, url: str, body: bytes) -> Tuple[str, str]:
+    loose = hashlib.sha1(f"{method.upper()} {url}".encode()).hexdigest()[:16]
+    exact = hashlib.sha1(body).hexdigest()[:8] if body else "nobody"
+    return loose, exact
+
+
+class FixtureStore:
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[str, str], Optional[dict]] = {}
+
+    def _dir(self, url: str) -> Path:
+        return self.root / (httpx.URL(url).host or "_")
+
+    def get(self, method: str, url: str, body: bytes = b"") -> Optional[dict]:
+        loose, exact = _key(method, url, body)
+        cache_key = (loose, exact)
+        if cache_key not in self._cache:
+            folder = self._dir(url)
+            exact_path = folder / f"{loose}-{exact}.json"
+            path: Optional[Path] = exact_path
+            if not exact_path.exists():
+                candidates = sorted(folder.glob(f"{loose}-*.json"), key=lambda p: p.stat().st_mtime)
+                path = candidates[-1] if candidates else None
+            self._cache[cache_key] = json.loads(path.read_text(encoding="utf-8")) if path else None
+        return self._cache[cache_key]
+
+    def put(self, method: str, url: str, body: bytes, status: int, headers, content: bytes, elapsed: float) -> None:
+        loose, exact = _key(method, url, body)
+        try:
+            text, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        fixture = {
+            "method": method.upper(),
+            "url": url,
+            "status": status,
+            "headers": [[k, v] for k, v in headers if k.lower() not in _DROPPED_HEADERS],
+            "body": text,
+            "encoding": encoding,
+            "elapsed": round(elapsed, 6),
+        }
+        folder = self._dir(url)
+        with self._lock:
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"{loose}-{exact}.json").write_text(json.dumps(fixture, ensure_ascii=False), encoding="utf-8")
+            self._cache.pop((loose, exact), None)
+
+
+def _response(fixture: dict, request: httpx.Request) -> httpx.Response:
+    body = fixture["body"].encode("utf-8") if fixture["encoding"] == "utf-8" else base64.b64decode(fixture["body"])
+    return httpx.Response(fixture["status"], headers=fixture["headers"], content=body, request=request)
+
+
+def as_httpx_request(method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Request:
+    """The httpx request a curl_cffi call amounts to (used to key it and to send it elsewhere)."""
+    body: bytes = b""
+    if kwargs.get("json") is not None:
+        body = json.dumps(kwargs["json"], separators=(",", ":")).encode()
+    elif isinstance(kwargs.get("data"), dict):
+        body = urlencode(kwargs["data"]).encode()
+    elif isinstance(kwargs.get("data"), (str, bytes)):
+        data = kwargs["data"]
+        body = data.encode() if isinstance(data, str) else data
+    return httpx.Request(
+        method.upper(), url, params=kwargs.get("params"), headers=kwargs.get("headers"), content=body
+    )
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serves fixtures; a request without one gets ``fallback_status`` or a ConnectError."""
+
+    def __init__(
+        self,
+        fixtures: str | Path | FixtureStore,
+        latency: str | Latency = "recorded",
+        fallback_status: Optional[int] = None,
+    ):
+        self.store = fixtures if isinstance(fixtures, FixtureStore) else FixtureStore(fixtures)
+        self.latency = latency if isinstance(latency, Latency) else Latency(latency)
+        self.fallback_status = fallback_status
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, request: httpx.Request) -> Tuple[httpx.Response, float]:
+        fixture = self.store.get(request.method, str(request.url), request.content)
+        if fixture is None:
+            self.misses += 1
+            if self.fallback_status is None:
+                raise httpx.ConnectError(f"No fixture for {request.method} {request.url}", request=request)
+            return httpx.Response(self.fallback_status, request=request), self.latency.sample()
+        self.hits += 1
+        return _response(fixture, request), self.latency.sample(fixture.get("elapsed", 0.0))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        response, delay = self._lookup(request)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response, delay = self._lookup(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    def request(self, method: str, url: str, warmup_url=None, impersonate=None, **kwargs) -> httpx.Response:
+        """Stands in for ``impersonate_request``."""
+        return self.handle_request(as_httpx_request(method, url, kwargs))
+
+    def close(self) -> None:
+        pass  # Shared by every client while installed.
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends requests to the network and saves every exchange as a fixture."""
+
+    def __init__(self, fixtures: str | Path | FixtureStore, verify: bool = True):
+        self.store = fixtures if isinstance(fixtures, FixtureStore) else FixtureStore(fixtures)
+        self.recorded = 0
+        self._sync = httpx.HTTPTransport(verify=verify)
+        self._async = httpx.AsyncHTTPTransport(verify=verify)
+
+    def _save(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> httpx.Response:
+        self.store.put(
+            request.method, str(request.url), request.content,
+            response.status_code, response.headers.multi_items(), response.content, elapsed,
+        )
+        self.recorded += 1
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROPPED_HEADERS]
+        return httpx.Response(response.status_code, headers=headers, content=response.content, request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        started = time.perf_counter()
+        response = self._sync.handle_request(request)
+        response.read()
+        return self._save(request, response, time.perf_counter() - started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        started = time.perf_counter()
+        response = await self._async.handle_async_request(request)
+        await response.aread()
+        return self._save(request, response, time.perf_counter() - started)
+
+    def request(self, method: Literal["GET", "POST"], url: str, **kwargs):
+        """Stands in for ``impersonate_request``: the real session, recorded."""
+        request = as_httpx_request(method, url, kwargs)
+        started = time.perf_counter()
+        response = impersonate.live_request(method, url, **kwargs)
+        self.store.put(
+            request.method, str(request.url), request.content,
+            response.status_code, list(response.headers.items()), response.content,
+            time.perf_counter() - started,
+        )
+        self.recorded += 1
+        return response
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class Override(Protocol):
+    """An httpx transport, sync and async, that also answers curl_cffi calls."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response: ...
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response: ...
+
+    def request(self, method: Literal["GET", "POST"], url: str, **kwargs: Any) -> Any: ...
+
+
+def install(transport: Optional[Override]) -> None:
+    """Route every client and curl_cffi call through ``transport``; None undoes it.
+
+    Besides the httpx transport methods, ``transport`` needs a ``request``
+    method that stands in for ``impersonate_request``.
+    """
+    client_pool.set_transport_override(transport)
+    impersonate.set_request_override(transport.request if transport is not None else None)
+
+
+@contextmanager
+def replaying(
+    fixtures: str | Path, latency: str | Latency = "recorded", fallback_status: Optional[int] = None
+) -> Iterator[ReplayTransport]:
+    transport = ReplayTransport(fixtures, latency, fallback_status)
+    install(transport)
+    try:
+        yield transport
+    finally:
+        install(None)
+
+
+@contextmanager
+def recording(fixtures: str | Path) -> Iterator[RecordingTransport]:
+    transport = RecordingTransport(fixtures)
+    install(transport)
+    try:
+        yield transport
+    finally:
+        install(None)
@@ -1,7 +1,9 @@
 import csv
 import io
 import json
+import sys
 from enum import Enum
+from functools import lru_cache
 from colorama import Fore, Style
 from user_scanner.core.helpers import ScanConfig
 
@@ -23,8 +25,11 @@ DEBUG_MSG = """Result {{
 CSV_FIELDS = ["username", "category", "site_name", "status", "url", "extra", "media", "reason"]
 
 
+FORMULA_TRIGGER_CHARS = ("=", "+", "-", "@", "\t", "\r", "\n")
+_TRIGGER_STARTS = frozenset(FORMULA_TRIGGER_CHARS)
+
+
 def _neutralize_csv_cell(value):
-    FORMULA_TRIGGER_CHARS = ("=", "+", "-", "@", "\t", "\r", "\n")
     if value is None:
         return value
     s = str(value)
@@ -33,6 +38,11 @@ def _neutralize_csv_cell(value):
     return value
 
 
+def _flatten(d: dict) -> str:
+    # One line per dict, so multiline metadata doesn't break row alignment.
+    return "; ".join(f"{key}: {value}" for key, value in d.items()).rstrip("; ")
+
+
 def indent_text(msg: str, level: int, ignore_first: bool = False) -> str:
     if level <= 0 or not msg:
         return msg
@@ -84,7 +94,39 @@ class Status(Enum):
         return self.to_label(is_email=False)
 
 
+# Modules report from a small, fixed set of keys, so each is normalised once.
+@lru_cache(maxsize=1024)
+def _clean_extra_key(key: str) -> str:
+    return key.strip().rstrip(":").strip().replace(" ", "_").lower()
+
+
+@lru_cache(maxsize=256)
+def _clean_media_key(key: str) -> str:
+    return key.strip().lower()
+
+# Repeated on every result of a scan; one shared copy of each is enough.
+_INTERNED_FIELDS = frozenset(("site_name", "category"))
+_PLAIN_FIELDS = frozenset(("username", "is_email", "url"))
+
+
 class Result:
+    # A bulk run holds one Result per (target, module) pair — tens of millions
+    # of them — so they carry no __dict__, and most never need their
+    # extra/media dicts: those are created on first use.
+    __slots__ = (
+        "status",
+        "reason",
+        "username",
+        "site_name",
+        "category",
+        "url",
+        "is_email",
+        "elapsed",
+        "from_cache",
+        "_extra",
+        "_media",
+    )
+
     def __init__(self, status: Status, reason: str | Exception | None = None, **kwargs):
         self.status = status
         self.reason = reason
@@ -92,38 +134,70 @@ class Result:
         self.site_name = None
         self.category = None
         self.url = ""  # Initialized url field
-        self.extra: dict[str, str | bool | int] = {}
-        self.media: dict[str, str] = {}
+        self._extra: dict[str, str | bool | int] | None = None
+        self._media: dict[str, str] | None = None
         self.is_email = False
-        self.update(**kwargs)
+        # Seconds the check took, stamped by the orchestrator; not exported.
+        self.elapsed: float | None = None
+        # Set when the verdict was served from the on-disk cache (--cache).
+        self.from_cache = False
+        if kwargs:
+            self.update(**kwargs)
+
+    @property
+    def extra(self) -> dict[str, str | bool | int]:
+        if self._extra is None:
+            self._extra = {}
+        return self._extra
+
+    @extra.setter
+    def extra(self, value: dict[str, str | bool | int]) -> None:
+        self._extra = value
+
+    @property
+    def media(self) -> dict[str, str]:
+        if self._media is None:
+            self._media = {}
+        return self._media
+
+    @media.setter
+    def media(self, value: dict[str, str]) -> None:
+        self._media = value
 
     def update(self, **kwargs):
-        # Added "url" to the list of fields allowed for dynamic updates
-        for field in ("username", "site_name", "category", "is_email", "url"):
-            if field in kwargs and kwargs[field] is not None:
-                setattr(self, field, kwargs[field])
+        for field, value in kwargs.items():
+            if value is None:
+                continue
+            if field in _INTERNED_FIELDS:
+                setattr(self, field, sys.intern(value) if type(value) is str else value)
+            elif field in _PLAIN_FIELDS:
+                # Added "url" to the list of fields allowed for dynamic updates
+                setattr(self, field, value)
+            elif field == "extra" and isinstance(value, dict):
+                self._update_extra(value)
+            elif field == "media" and isinstance(value, dict):
+                self._update_media(value)
+        return self
 
-        if "extra" in kwargs and isinstance(kwargs["extra"], dict):
-            for key, value in kwargs["extra"].items():
-                if value is None or (isinstance(value, str) and not value.strip()):
-                    continue
+    def _update_extra(self, extra: dict) -> None:
+        for key, value in extra.items():
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
 
-                clean_key = key.strip().rstrip(":").strip().replace(" ", "_").lower()
-                if not clean_key:
-                    continue
+            clean_key = _clean_extra_key(key)
+            if not clean_key:
+                continue
 
-                if not isinstance(value, (bool, int)):
-                    value = str(value)
+            if not isinstance(value, (bool, int)):
+                value = str(value)
 
-                self.extra[clean_key] = value
+            self.extra[clean_key] = value
 
-        if "media" in kwargs and isinstance(kwargs["media"], dict):
-            for key, value in kwargs["media"].items():
-                if value is None or not str(value).strip():
-                    continue
-                self.media[key.strip().lower()] = str(value).strip()
-
-        return self
+    def _update_media(self, media: dict) -> None:
+        for key, value in media.items():
+            if value is None or not str(value).strip():
+                continue
+            self.media[_clean_media_key(key)] = str(value).strip()
 
     @classmethod
     def taken(cls, reason: str | Exception | None = None, **kwargs):
@@ -176,8 +250,8 @@ class Result:
             "site_name": self.site_name,
             "category": self.category,
             "url": self.url,  # Added url to dictionary output
-            "extra": self.extra,
-            "media": self.media,
+            "extra": self._extra if self._extra is not None else {},
+            "media": self._media if self._media is not None else {},
             "is_email": self.is_email,
         }
 
@@ -188,6 +262,8 @@ class Result:
         if self.is_email:
             data["email"] = data.pop("username")
         data.pop("is_email", None)
+        if self.from_cache:
+            data["cached"] = True
         return data
 
     def debug(self) -> str:
@@ -197,30 +273,30 @@ class Result:
         data = self.to_dict()
         return json.dumps(data, indent=4)
 
-    def to_csv(self) -> str:
-        def flatten_dict(d):
-            result = ""
-            for key, value in d.items():
-                result += f"{key}: {value}; "
-            return result.rstrip("; ")
-
-        # uses .as_dict() since header has "username"
-        data = self.as_dict()
-
-        # flatten multiline extra string parameters so it doesn't break row alignments
-        data["extra"] = flatten_dict(data["extra"]) if data.get("extra") else ""
-        data["media"] = flatten_dict(data["media"]) if data.get("media") else ""
-
-
-
-        del data["is_email"]
-
-        data = {k: _neutralize_csv_cell(v) for k, v in data.items()}
+    def csv_row(self) -> list:
+        """The row's cells in ``CSV_FIELDS`` order, flattened and neutralised."""
+        # Nearly every cell starts with a plain character, which settles it
+        # without the full check; exports run this for millions of cells.
+        return [
+            value
+            if not value
+            or (type(value) is str and value[0] not in _TRIGGER_STARTS and not value[0].isspace())
+            else _neutralize_csv_cell(value)
+            for value in (
+                self.username,
+                self.category,
+                self.site_name,
+                self.status.to_label(self.is_email),
+                self.url,
+                _flatten(self._extra) if self._extra else "",
+                _flatten(self._media) if self._media else "",
+                self.get_reason(),
+            )
+        ]
 
+    def to_csv(self) -> str:
         output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, lineterminator="")
-        writer.writerow(data)
-
+        csv.writer(output, lineterminator="").writerow(self.csv_row())
         return output.getvalue()
 
     def __str__(self):
@@ -270,7 +346,7 @@ class Result:
 
         # dynamic extra layout handling logic
         extra_display = ""
-        display_items = list(self.extra.items()) + list(self.media.items())
+        display_items = [*(self._extra or {}).items(), *(self._media or {}).items()]
         for i, (key, value) in enumerate(display_items):
             connector = "└──" if i == len(display_items) - 1 else "├──"
 
@@ -281,8 +357,9 @@ class Result:
 
         reason = f" ({self.get_reason()})" if self.has_reason() else ""
         reason = indent_text(reason, 12, True)
+        cached = f" {Fore.WHITE}[cached]{color}" if self.from_cache else ""
 
-        return f"  {color}{icon} {site_name}{url_display} {username}: {status_text}{reason}{extra_display}{Style.RESET_ALL}"
+        return f"  {color}{icon} {site_name}{url_display} {username}: {status_text}{cached}{reason}{extra_display}{Style.RESET_ALL}"
 
     def is_found(self) -> bool:
         """Returns True if the target was found or registered (Status.TAKEN)"""
@@ -0,0 +1,257 @@
+"""One retry policy for every HTTP path in the scanner.
+
+``make_request`` had a retry loop pinned at zero retries, and modules that
+needed retries wrote their own sleep loops. Requests now retry here instead,
+on a timeout, a dropped connection, a 429 or a 5xx:
+
+* Backoff is exponential with full jitter, so checks that failed together do
+  not come back together. A ``Retry-After`` header is honoured; one longer
+  than ``max_retry_after`` is not waited out at all.
+* Only idempotent methods are retried after the request may have reached the
+  server. A connection that was never made, or a 429, is safe to retry for
+  any method.
+* Sleeps are ``asyncio.sleep`` on the async paths, so a backing-off check
+  holds no thread.
+* Retries are budgeted. Every request adds ``ratio`` of a retry to its host's
+  budget and to the run's, and a retry spends one from both. A failing site
+  therefore adds at most that share of its own traffic, and cannot take over
+  the run's concurrency with its retries.
+
+The policy is global (``set_policy``); a module can set its own with
+``RETRY = RetryPolicy(...)``, or turn retries off with ``RETRY = NO_RETRY``.
+The orchestrators apply it for the duration of that module's check.
+
+httpx requests retry in ``make_request`` (sync) and in the pooled async
+transport (``make_request_async`` and the email modules' adopted clients).
+curl_cffi requests retry in ``impersonate``.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from types import ModuleType
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from user_scanner.core import telemetry
+
+R = TypeVar("R")
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# What a failed request leaves unknown: "connect" never reached the server,
+# "read" may have. Anything else is not retried.
+ErrorKind = Optional[str]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 3  # Tries in total, the first included.
+    backoff: float = 0.5  # Ceiling of the first retry's jittered wait, doubling after.
+    max_backoff: float = 8.0
+    max_retry_after: float = 10.0
+    # No retry starts once this many seconds have gone into the request, so
+    # retries finish inside the orchestrators' per-check timeout.
+    deadline: float = 10.0
+    statuses: FrozenSet[int] = RETRY_STATUSES
+
+    def retries_status(self, method: str, status: int) -> bool:
+        # A 429 was turned away unprocessed, whatever the method.
+        return status in self.statuses and (status == 429 or method.upper() in IDEMPOTENT_METHODS)
+
+    def retries_error(self, method: str, kind: ErrorKind) -> bool:
+        return kind == "connect" or (kind == "read" and method.upper() in IDEMPOTENT_METHODS)
+
+    def delay(self, retry: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Seconds to wait before retry number ``retry`` (1-based); None means give up."""
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (retry - 1)))
+
+
+DEFAULT_POLICY = RetryPolicy()
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+class RetryBudget:
+    """Retries allowed as a share of requests sent, per host and overall."""
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 20.0, host_reserve: float = 2.0):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.host_reserve = host_reserve
+        # Unspent shares are capped so a long healthy stretch does not bank
+        # enough retries to hammer a site once it starts failing.
+        self._cap = max(reserve, 100.0)
+        self._host_cap = max(host_reserve, 10.0)
+        self._tokens = reserve
+        self._hosts: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def deposit(self, host: str) -> None:
+        with self._lock:
+            self._tokens = min(self._cap, self._tokens + self.ratio)
+            self._hosts[host] = min(self._host_cap, self._hosts.get(host, self.host_reserve) + self.ratio)
+
+    def withdraw(self, host: str) -> bool:
+        with self._lock:
+            host_tokens = self._hosts.get(host, self.host_reserve)
+            if self._tokens < 1 or host_tokens < 1:
+                return False
+            self._tokens -= 1
+            self._hosts[host] = host_tokens - 1
+            return True
+
+
+_policy = DEFAULT_POLICY
+_module_policy: ContextVar[Optional[RetryPolicy]] = ContextVar("_module_policy", default=None)
+_budget = RetryBudget()
+
+
+def set_policy(policy: RetryPolicy) -> None:
+    global _policy
+    _policy = policy
+
+
+def get_policy() -> RetryPolicy:
+    """The policy for the current check: its module's own, else the global one."""
+    return _module_policy.get() or _policy
+
+
+def set_retries(retries: int) -> None:
+    """Retry each request up to ``retries`` times; 0 (or less) turns retrying off."""
+    set_policy(RetryPolicy(attempts=retries + 1) if retries > 0 else NO_RETRY)
+
+
+def set_budget(budget: RetryBudget) -> None:
+    global _budget
+    _budget = budget
+
+
+def get_budget() -> RetryBudget:
+    return _budget
+
+
+def configure_module(module: ModuleType) -> None:
+    """Apply a module's ``RETRY = RetryPolicy(...)`` to the check it is running (per context)."""
+    _module_policy.set(getattr(module, "RETRY", None))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """``Retry-After`` in seconds, from delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def error_kind(exc: BaseException) -> ErrorKind:
+    """Classify an httpx error."""
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return "connect"
+    if isinstance(exc, (httpx.ReadTimeout, httpx.ReadError, httpx.RemoteProtocolError, httpx.WriteError)):
+        return "read"
+    return None
+
+
+def _host(url) -> str:
+    return (urlsplit(str(url)).hostname or "").lower()
+
+
+def _next_delay(
+    policy: RetryPolicy, started: float, method: str, host: str, retry: int,
+    response=None, kind: ErrorKind = None, failed: bool = False,
+) -> Optional[float]:
+    """How long to wait before retrying, or None to stop here."""
+    if retry >= policy.attempts:
+        return None
+    if failed:
+        if not policy.retries_error(method, kind):
+            return None
+        pause = policy.delay(retry)
+    else:
+        if not policy.retries_status(method, response.status_code):
+            return None
+        pause = policy.delay(retry, parse_retry_after(response.headers.get("Retry-After")))
+    if pause is None or time.monotonic() - started + pause > policy.deadline:
+        return None
+    if not _budget.withdraw(host):
+        return None
+    telemetry.note_retry()
+    return pause
+
+
+def send(
+    method: str, url: str, attempt: Callable[[], R], classify: Callable[[BaseException], ErrorKind] = error_kind
+) -> R:
+    """Call ``attempt`` (one request of ``method`` to ``url``) until it is worth keeping."""
+    policy, host, started = get_policy(), _host(url), time.monotonic()
+    retry = 1
+    while True:
+        _budget.deposit(host)
+        try:
+            response = attempt()
+        except Exception as e:
+            pause = _next_delay(policy, started, method, host, retry, kind=classify(e), failed=True)
+            if pause is None:
+                raise
+        else:
+            pause = _next_delay(policy, started, method, host, retry, response=response)
+            if pause is None:
+                return response
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+        time.sleep(pause)
+        retry += 1
+
+
+async def send_async(
+    request: httpx.Request, attempt: Callable[[httpx.Request], Awaitable[httpx.Response]]
+) -> httpx.Response:
+    """``send`` for an async transport: ``attempt`` sends ``request`` once."""
+    # A streamed upload cannot be sent twice.
+    policy = get_policy() if isinstance(request.stream, httpx.ByteStream) else NO_RETRY
+    method, host, started = request.method, _host(request.url), time.monotonic()
+    retry = 1
+    while True:
+        _budget.deposit(host)
+        try:
+            response = await attempt(request)
+        except Exception as e:
+            pause = _next_delay(policy, started, method, host, retry, kind=error_kind(e), failed=True)
+            if pause is None:
+                raise
+        else:
+            pause = _next_delay(policy, started, method, host, retry, response=response)
+            if pause is None:
+                return response
+            await response.aclose()
+        await asyncio.sleep(pause)
+        retry += 1
+
+
+def backoff(url: str, retry: int, policy: Optional[RetryPolicy] = None) -> bool:
+    """Wait before retry ``retry`` of a module's own loop; False when the budget is spent.
+
+    For retries the policy cannot see, such as an answer that is only wrong
+    by its content.
+    """
+    policy = policy or get_policy()
+    if not _budget.withdraw(_host(url)):
+        return False
+    telemetry.note_retry()
+    time.sleep(policy.delay(retry) or 0.0)
+    return True
@@ -0,0 +1,645 @@
+"""Declarative site checks, compiled once and run by one shared async engine.
+
+Many username checks are a URL template, some headers and a verdict decided by
+the status code or a marker in the body. Written as a rule, such a check needs
+no module import: the engine formats the request, sends it with
+``generic_validate_async`` and matches the response.
+
+A rule is plain data (the same shape ``registry.json`` stores)::
+
+    {
+      "url": "https://example.com/api/users/{user}",
+      "show_url": "https://example.com/{user}",
+      "headers": {"User-Agent": "{user_agent}"},
+      "follow_redirects": true,
+      "checks": [
+        {"when": {"status": 404}, "result": "available"},
+        {"when": {"all": [{"status": 200}, {"json": "$.id"}]}, "result": "taken"},
+        {"result": "error", "reason": "Unexpected status code: {status}"}
+      ],
+      "extract": {"extra": {"name": "$.name"}, "media": {"avatar": "$.avatar_url"}},
+      "username": [
+        {"when": {"not": {"length": [3, 30]}}, "result": "error", "reason": "Length must be 3-30 characters."}
+      ]
+    }
+
+Checks are tried in order and the first match decides. Matchers are
+``status`` (a code or list of codes), ``contains`` / ``regex`` (response body),
+``json`` (a ``$.a.b[0]`` path that must be truthy, or equal ``equals``), and
+``not`` / ``all`` / ``any`` to combine them. ``extract`` fills a taken
+result's ``extra`` and ``media`` from JSON paths or ``{"regex": ...}`` groups.
+``username`` checks run before any request, on the username alone, with the
+matchers ``length`` (``[min, max]``, either end may be null) and ``match`` /
+``fullmatch`` / ``search`` (a regex, as the ``re`` function of that name).
+
+Rules come from two places: ``<site>.json`` files in a category folder, and
+modules simple enough that ``extract_rule`` can read the rule straight out of
+their source — a final ``status_validate`` call, or a ``generic_validate``
+whose ``process`` only branches on status codes and body markers, preceded by
+``if`` guards on ``len(user)`` and ``re.match``/``fullmatch``/``search`` of the
+username. Besides imports, such a module may only declare ``HANDLE``.
+"""
+
+import ast
+import json
+import re
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from user_scanner.core.helpers import get_random_user_agent
+from user_scanner.core.result import Result
+
+VERDICTS = ("taken", "available", "error")
+_REQUEST_OPTIONS = ("method", "headers", "follow_redirects", "http2", "timeout", "data", "json")
+_RULE_KEYS = {"url", "show_url", "checks", "extract", "username", *_REQUEST_OPTIONS}
+_USERNAME_REGEX = ("match", "fullmatch", "search")
+
+Matcher = Callable[["_Response"], bool]
+UsernameMatcher = Callable[[str], bool]
+
+
+class _Response:
+    """A response with its body decoded at most once, however many matchers ask."""
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+        self.status = response.status_code
+        self._text: Optional[str] = None
+        self._json: Any = ...
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.response.text
+        return self._text
+
+    @property
+    def json(self) -> Any:
+        if self._json is ...:
+            try:
+                self._json = self.response.json()
+            except ValueError:
+                self._json = None
+        return self._json
+
+
+def parse_path(path: str) -> Tuple[Any, ...]:
+    """``"$.items[0].name"`` as ``("items", 0, "name")``."""
+    if not path.startswith("$"):
+        raise ValueError(f"JSON path must start with '$': {path!r}")
+    steps: List[Any] = []
+    for key, index in re.findall(r"\.([^.\[\]]+)|\[(\d+)\]", path[1:]):
+        steps.append(int(index) if index else key)
+    return tuple(steps)
+
+
+def _lookup(data: Any, steps: Tuple[Any, ...]) -> Any:
+    for step in steps:
+        try:
+            data = data[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+def compile_matcher(spec: Dict[str, Any]) -> Matcher:
+    if "all" in spec:
+        parts = [compile_matcher(s) for s in spec["all"]]
+        return lambda r: all(m(r) for m in parts)
+    if "any" in spec:
+        parts = [compile_matcher(s) for s in spec["any"]]
+        return lambda r: any(m(r) for m in parts)
+    if "not" in spec:
+        inner = compile_matcher(spec["not"])
+        return lambda r: not inner(r)
+    if "status" in spec:
+        codes = spec["status"]
+        codes = frozenset(codes if isinstance(codes, list) else [codes])
+        return lambda r: r.status in codes
+    if "contains" in spec:
+        needle = spec["contains"]
+        return lambda r: needle in r.text
+    if "regex" in spec:
+        pattern = re.compile(spec["regex"])
+        return lambda r: pattern.search(r.text) is not None
+    if "json" in spec:
+        steps = parse_path(spec["json"])
+        if "equals" in spec:
+            expected = spec["equals"]
+            return lambda r: _lookup(r.json, steps) == expected
+        return lambda r: bool(_lookup(r.json, steps))
+    raise ValueError(f"Unknown matcher: {spec!r}")
+
+
+def compile_username_matcher(spec: Dict[str, Any]) -> UsernameMatcher:
+    if "all" in spec:
+        parts = [compile_username_matcher(s) for s in spec["all"]]
+        return lambda u: all(m(u) for m in parts)
+    if "any" in spec:
+        parts = [compile_username_matcher(s) for s in spec["any"]]
+        return lambda u: any(m(u) for m in parts)
+    if "not" in spec:
+        inner = compile_username_matcher(spec["not"])
+        return lambda u: not inner(u)
+    if "length" in spec:
+        low, high = spec["length"]
+        return lambda u: (low is None or len(u) >= low) and (high is None or len(u) <= high)
+    for name in _USERNAME_REGEX:
+        if name in spec:
+            method = getattr(re.compile(spec[name]), name)
+            return lambda u: method(u) is not None
+    raise ValueError(f"Unknown username matcher: {spec!r}")
+
+
+def _compile_extractor(spec: Any) -> Callable[[_Response], Any]:
+    if isinstance(spec, str):
+        steps = parse_path(spec)
+        return lambda r: _lookup(r.json, steps)
+    if isinstance(spec, dict) and "regex" in spec:
+        pattern = re.compile(spec["regex"])
+
+        def search(r: _Response) -> Optional[str]:
+            match = pattern.search(r.text)
+            return match.group(1) if match and pattern.groups else None
+
+        return search
+    raise ValueError(f"Unknown extractor: {spec!r}")
+
+
+class Rule:
+    """A rule compiled into matchers, ready to check any number of targets."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        unknown = set(spec) - _RULE_KEYS
+        if unknown:
+            raise ValueError(f"Unknown rule keys: {', '.join(sorted(unknown))}")
+        if "url" not in spec or not spec.get("checks"):
+            raise ValueError("A rule needs a url and at least one check")
+
+        self.spec = spec
+        self.url = spec["url"]
+        self.show_url = spec.get("show_url")
+        self.options = {k: spec[k] for k in _REQUEST_OPTIONS if k in spec}
+
+        self.checks: List[Tuple[Optional[Matcher], str, Optional[str]]] = []
+        for check in spec["checks"]:
+            verdict = check.get("result")
+            if verdict not in VERDICTS:
+                raise ValueError(f"Check result must be one of {VERDICTS}: {verdict!r}")
+            when = check.get("when")
+            self.checks.append(
+                (compile_matcher(when) if when else None, verdict, check.get("reason"))
+            )
+
+        self.username_checks: List[Tuple[UsernameMatcher, str, Optional[str]]] = []
+        for check in spec.get("username") or []:
+            verdict = check.get("result")
+            if verdict not in VERDICTS:
+                raise ValueError(f"Check result must be one of {VERDICTS}: {verdict!r}")
+            if not check.get("when"):
+                raise ValueError("A username check needs a 'when'")
+            self.username_checks.append(
+                (compile_username_matcher(check["when"]), verdict, check.get("reason"))
+            )
+
+        extract = spec.get("extract") or {}
+        self.extractors = {
+            field: {name: _compile_extractor(s) for name, s in (extract.get(field) or {}).items()}
+            for field in ("extra", "media")
+        }
+
+    def request(self, user: str) -> Tuple[str, Dict[str, Any]]:
+        """The URL and ``make_request`` keyword arguments for one target."""
+        values = {"user": user, "user_agent": get_random_user_agent()}
+        kwargs = dict(self.options)
+        if "headers" in kwargs:
+            kwargs["headers"] = {k: v.format(**values) for k, v in kwargs["headers"].items()}
+        if self.show_url:
+            kwargs["show_url"] = self.show_url.format(**values)
+        return self.url.format(**values), kwargs
+
+    def check_username(self, user: str) -> Optional[Result]:
+        """The verdict for a username the site is known to refuse, before any request."""
+        for matcher, verdict, reason in self.username_checks:
+            if matcher(user):
+                reason = reason.format(user=user) if reason is not None else None
+                if verdict == "error":
+                    return Result.error(reason or "Invalid username")
+                return Result.available(reason) if verdict == "available" else Result.taken(reason)
+        return None
+
+    def evaluate(self, response: httpx.Response) -> Result:
+        r = _Response(response)
+        for matcher, verdict, reason in self.checks:
+            if matcher is None or matcher(r):
+                break
+        else:
+            return Result.error(f"[{r.status}] No rule matched. Report this on Github.")
+
+        if reason is not None:
+            reason = reason.format(status=r.status)
+        if verdict == "error":
+            return Result.error(reason or "Unexpected response")
+        if verdict == "available":
+            return Result.available(reason)
+
+        fields = {}
+        for field, extractors in self.extractors.items():
+            values = {name: fn(r) for name, fn in extractors.items()}
+            fields[field] = {name: value for name, value in values.items() if value not in (None, "")}
+        return Result.taken(reason, **fields)
+
+    async def validate(self, user: str) -> Result:
+        from user_scanner.core.orchestrator import generic_validate_async
+
+        early = self.check_username(user)
+        if early is not None:
+            return early
+        url, kwargs = self.request(user)
+        return await generic_validate_async(url, self.evaluate, **kwargs)
+
+
+_compiled: Dict[str, Rule] = {}
+
+
+def compiled(spec: Dict[str, Any]) -> Rule:
+    """The compiled rule for a spec, compiled on first use only."""
+    key = json.dumps(spec, sort_keys=True)
+    rule = _compiled.get(key)
+    if rule is None:
+        rule = _compiled[key] = Rule(spec)
+    return rule
+
+
+# Module file -> (the registry spec it was compiled from, its rule).
+_by_file: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Rule]]] = {}
+
+
+def rule_for(module: ModuleType) -> Optional[Rule]:
+    """The rule a scan module can be checked by instead of being imported.
+
+    Called for every check, so after the first it is two dict lookups.
+    """
+    from user_scanner.core.registry import entry_for
+
+    entry = entry_for(module)
+    spec = entry.get("rule") if entry else None
+    file = getattr(module, "__file__", None) or ""
+    cached = _by_file.get(file)
+    # A refreshed registry hands out new entries, and so new specs.
+    if cached is None or cached[0] is not spec:
+        cached = _by_file[file] = (spec, compiled(spec) if spec else None)
+    return cached[1]
+
+
+class RuleModule(ModuleType):
+    """A ``<site>.json`` rule presented as a scan module."""
+
+    def __init__(self, name: str, file: str, spec: Dict[str, Any]):
+        super().__init__(name)
+        self.__file__ = file
+        rule = compiled(spec)
+
+        async def validate(user: str) -> Result:
+            return await rule.validate(user)
+
+        validate.__name__ = f"validate_{name}"
+        setattr(self, validate.__name__, validate)
+
+
+# Rule extraction from module source. Anything outside the narrow shapes below
+# raises _NotDeclarative and the module simply keeps running as code.
+
+
+class _NotDeclarative(Exception):
+    pass
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _template(node: ast.AST, user: str, allow_agent: bool = False) -> str:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return _escape(node.value)
+    if (
+        allow_agent
+        and isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "get_random_user_agent"
+        and not node.args
+    ):
+        return "{user_agent}"
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                parts.append(_escape(value.value))
+            elif (
+                isinstance(value, ast.FormattedValue)
+                and isinstance(value.value, ast.Name)
+                and value.value.id == user
+                and value.conversion == -1
+                and value.format_spec is None
+            ):
+                parts.append("{user}")
+            else:
+                raise _NotDeclarative
+        return "".join(parts)
+    raise _NotDeclarative
+
+
+def _literal(node: ast.AST) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise _NotDeclarative from None
+
+
+def _is_attr(node: ast.AST, name: str, attr: str) -> bool:
+    return isinstance(node, ast.Attribute) and node.attr == attr and isinstance(node.value, ast.Name) and node.value.id == name
+
+
+def _condition(node: ast.AST, resp: str) -> Dict[str, Any]:
+    if isinstance(node, ast.BoolOp):
+        key = "all" if isinstance(node.op, ast.And) else "any"
+        return {key: [_condition(v, resp) for v in node.values]}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return {"not": _condition(node.operand, resp)}
+    if isinstance(node, ast.Compare) and len(node.ops) == 1:
+        left, op, right = node.left, node.ops[0], node.comparators[0]
+        if _is_attr(left, resp, "status_code"):
+            if isinstance(op, (ast.Eq, ast.NotEq, ast.In, ast.NotIn)):
+                codes = _literal(right)
+                codes = list(codes) if isinstance(codes, (list, tuple, set)) else [codes]
+                if all(isinstance(c, int) for c in codes):
+                    match: Dict[str, Any] = {"status": codes}
+                    return match if isinstance(op, (ast.Eq, ast.In)) else {"not": match}
+        if (
+            _is_attr(right, resp, "text")
+            and isinstance(op, (ast.In, ast.NotIn))
+            and isinstance(left, ast.Constant)
+            and isinstance(left.value, str)
+        ):
+            contains = {"contains": left.value}
+            return contains if isinstance(op, ast.In) else {"not": contains}
+    raise _NotDeclarative
+
+
+def _is_len(node: ast.AST, user: str) -> bool:
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "len"
+        and len(node.args) == 1
+        and not node.keywords
+        and isinstance(node.args[0], ast.Name)
+        and node.args[0].id == user
+    )
+
+
+_FLIPPED = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE, ast.Eq: ast.Eq}
+
+
+def _user_condition(node: ast.AST, user: str) -> Dict[str, Any]:
+    """A test on the username alone: ``len(user)`` bounds or an ``re`` call."""
+    if isinstance(node, ast.BoolOp):
+        key = "all" if isinstance(node.op, ast.And) else "any"
+        return {key: [_user_condition(v, user) for v in node.values]}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return {"not": _user_condition(node.operand, user)}
+    if isinstance(node, ast.Compare):
+        operands = [node.left, *node.comparators]
+        if len(node.ops) == 1 and isinstance(node.ops[0], ast.NotEq):
+            return {"not": _user_condition(ast.Compare(node.left, [ast.Eq()], node.comparators), user)}
+        low: Optional[int] = None
+        high: Optional[int] = None
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            # Each link reads as len(user) <op> bound.
+            if _is_len(left, user):
+                bound, kind = right, type(op)
+            elif _is_len(right, user) and type(op) in _FLIPPED:
+                bound, kind = left, _FLIPPED[type(op)]
+            else:
+                raise _NotDeclarative
+            if not (isinstance(bound, ast.Constant) and type(bound.value) is int):
+                raise _NotDeclarative
+            n = bound.value
+            if kind in (ast.Gt, ast.GtE, ast.Eq):
+                n_low = n + 1 if kind is ast.Gt else n
+                low = n_low if low is None else max(low, n_low)
+            if kind in (ast.Lt, ast.LtE, ast.Eq):
+                n_high = n - 1 if kind is ast.Lt else n
+                high = n_high if high is None else min(high, n_high)
+            if kind not in (ast.Gt, ast.GtE, ast.Eq, ast.Lt, ast.LtE):
+                raise _NotDeclarative
+        return {"length": [low, high]}
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "re"
+        and node.func.attr in _USERNAME_REGEX
+        and len(node.args) == 2
+        and not node.keywords
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+        and isinstance(node.args[1], ast.Name)
+        and node.args[1].id == user
+    ):
+        return {node.func.attr: node.args[0].value}
+    raise _NotDeclarative
+
+
+def _verdict(node: ast.AST, resp: str) -> Dict[str, Any]:
+    if not (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "Result"
+        and node.func.attr in VERDICTS
+        and not node.keywords
+        and len(node.args) <= 1
+    ):
+        raise _NotDeclarative
+    verdict = {"result": node.func.attr}
+    if node.args:
+        reason = node.args[0]
+        if isinstance(reason, ast.Constant) and isinstance(reason.value, str):
+            verdict["reason"] = _escape(reason.value)
+        elif isinstance(reason, ast.JoinedStr):
+            parts = []
+            for value in reason.values:
+                if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                    parts.append(_escape(value.value))
+                elif isinstance(value, ast.FormattedValue) and _is_attr(value.value, resp, "status_code") and value.conversion == -1 and value.format_spec is None:
+                    parts.append("{status}")
+                else:
+                    raise _NotDeclarative
+            verdict["reason"] = "".join(parts)
+        else:
+            raise _NotDeclarative
+    return verdict
+
+
+def _checks(
+    body: List[ast.stmt],
+    guards: List[Dict[str, Any]],
+    condition: Callable[[ast.AST], Dict[str, Any]],
+    resp: str,
+    out: List[Dict[str, Any]],
+) -> bool:
+    """Flatten an if/return tree into ordered checks; True if it always returns."""
+    for stmt in body:
+        if isinstance(stmt, ast.Return):
+            if stmt.value is None:
+                raise _NotDeclarative
+            check = _verdict(stmt.value, resp)
+            if guards:
+                check = {"when": guards[0] if len(guards) == 1 else {"all": list(guards)}, **check}
+            out.append(check)
+            return True
+        if isinstance(stmt, ast.If):
+            test = condition(stmt.test)
+            returns = _checks(stmt.body, guards + [test], condition, resp, out)
+            if stmt.orelse:
+                returns = _checks(stmt.orelse, guards + [{"not": test}], condition, resp, out) and returns
+                if returns:
+                    return True
+            continue
+        if isinstance(stmt, ast.Pass) or (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant)):
+            continue
+        raise _NotDeclarative
+    return False
+
+
+def _status_checks(available: Any, taken: Any) -> List[Dict[str, Any]]:
+    available = available if isinstance(available, list) else [available]
+    taken = taken if isinstance(taken, list) else [taken]
+    if set(available) & set(taken):
+        raise _NotDeclarative  # status_validate reports this as an error on every call
+    return [
+        {"when": {"status": available}, "result": "available"},
+        {"when": {"status": taken}, "result": "taken"},
+        {"result": "error", "reason": "[{status}] Status didn't match. Report this on Github."},
+    ]
+
+
+def _is_handle(node: ast.stmt) -> bool:
+    """``HANDLE = {...}``, which the registry reads on its own (see ``core.handles``)."""
+    return (
+        isinstance(node, ast.Assign)
+        and len(node.targets) == 1
+        and isinstance(node.targets[0], ast.Name)
+        and node.targets[0].id == "HANDLE"
+    )
+
+
+def _extract(tree: ast.Module, func: ast.FunctionDef) -> Dict[str, Any]:
+    # Module-level code beyond imports could set state (RATE_LIMITS, sessions)
+    # the rule would silently drop.
+    for node in tree.body:
+        if node is func or isinstance(node, (ast.Import, ast.ImportFrom)) or _is_handle(node):
+            continue
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue
+        raise _NotDeclarative
+
+    if len(func.args.args) != 1 or func.args.vararg or func.args.kwonlyargs:
+        raise _NotDeclarative
+    user = func.args.args[0].arg
+    names: Dict[str, Any] = {}
+    process: Optional[ast.FunctionDef] = None
+    username_checks: List[Dict[str, Any]] = []
+
+    def template_dict(node: ast.Dict) -> Dict[Any, str]:
+        if any(k is None for k in node.keys):
+            raise _NotDeclarative
+        return {_literal(k): _template(v, user, allow_agent=True) for k, v in zip(node.keys, node.values) if k is not None}
+
+    for stmt in func.body[:-1]:
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+            continue
+        if isinstance(stmt, ast.FunctionDef) and process is None:
+            process = stmt
+            continue
+        if isinstance(stmt, ast.If) and not stmt.orelse:
+            # A guard that returns early on the username alone, before any request.
+            test = _user_condition(stmt.test, user)
+            if not _checks(stmt.body, [test], lambda node: _user_condition(node, user), "", username_checks):
+                raise _NotDeclarative
+            continue
+        if not (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name)):
+            raise _NotDeclarative
+        target, value = stmt.targets[0].id, stmt.value
+        if isinstance(value, ast.Dict):
+            names[target] = template_dict(value)
+        elif isinstance(value, ast.Name) and value.id in names:
+            names[target] = names[value.id]
+        else:
+            names[target] = _template(value, user)
+
+    last = func.body[-1]  # a deferrable validator ends in the call
+    call = last.value if isinstance(last, ast.Return) else None
+    if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)):
+        raise _NotDeclarative
+    kind = call.func.id
+
+    def resolve(node: ast.AST) -> Any:
+        if isinstance(node, ast.Name) and node.id in names:
+            return names[node.id]
+        if isinstance(node, ast.Dict):
+            return template_dict(node)
+        return _template(node, user)
+
+    keywords = list(call.keywords)
+    if kind == "status_validate":
+        # available and taken, passed by position or by name.
+        codes = list(call.args[1:3])
+        for name in ("available", "taken")[len(codes):]:
+            keyword = next((k for k in keywords if k.arg == name), None)
+            if keyword is None:
+                raise _NotDeclarative
+            codes.append(keyword.value)
+            keywords.remove(keyword)
+        if len(call.args) > 3:
+            raise _NotDeclarative
+        checks = _status_checks(_literal(codes[0]), _literal(codes[1]))
+    else:
+        if len(call.args) != 2 or process is None:
+            raise _NotDeclarative
+        if not (isinstance(call.args[1], ast.Name) and call.args[1].id == process.name):
+            raise _NotDeclarative
+        if len(process.args.args) != 1:
+            raise _NotDeclarative
+        checks = []
+        resp = process.args.args[0].arg
+        if not _checks(process.body, [], lambda node: _condition(node, resp), resp, checks):
+            raise _NotDeclarative
+
+    spec: Dict[str, Any] = {"url": resolve(call.args[0]), "checks": checks}
+    if username_checks:
+        spec["username"] = username_checks
+    for keyword in keywords:
+        if keyword.arg == "show_url":
+            spec["show_url"] = resolve(keyword.value)
+        elif keyword.arg == "headers":
+            headers = resolve(keyword.value)
+            if not isinstance(headers, dict):
+                raise _NotDeclarative
+            spec["headers"] = headers
+        elif keyword.arg in ("follow_redirects", "http2", "timeout", "method"):
+            spec[keyword.arg] = _literal(keyword.value)
+        else:
+            raise _NotDeclarative
+    return spec
+
+
+def extract_rule(tree: ast.Module, func: ast.FunctionDef) -> Optional[Dict[str, Any]]:
+    """The rule equivalent to a deferrable validator, if it is declarative."""
+    try:
+        return _extract(tree, func)
+    except _NotDeclarative:
+        return None
@@ -0,0 +1,117 @@
+"""One event loop, one worker pool and one set of HTTP pools per process.
+
+Every scan entry point — ``run_user_full``, ``run_user_module``, the email
+runners, a bulk run, a cross-scan — used to go through ``asyncio.run``, so
+each built an event loop and threw it away together with the loop's pooled
+connections (``client_pool`` keeps them per loop) and async clients; the
+email runners also installed a fresh 250-thread executor every time. A list
+of targets, and the cross-scan after it, paid the handshakes to the same
+hosts again for every call.
+
+A ``ScanSession`` keeps one loop between calls, and one thread pool that sync
+validators run on and that is also the loop's default executor.
+``run(coro)`` drives a coroutine to completion on that loop, as
+``asyncio.run`` would, and cancels whatever it left behind; the connections,
+clients and threads stay up for the next call. The session closes its pools
+at exit.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 250
+
+
+class ScanSession:
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers = workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        self.runs = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(self.executor)
+        return self._loop
+
+    def resize(self, workers: int) -> None:
+        """Run sync checks on ``workers`` threads; the old pool finishes what it has."""
+        if workers == self.workers:
+            return
+        self.workers = workers
+        old, self.executor = self.executor, concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.set_default_executor(self.executor)
+        old.shutdown(wait=False)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` to completion on the session's loop and return its result."""
+        loop = self.loop
+        if loop.is_running():
+            coro.close()
+            raise RuntimeError("ScanSession.run() cannot be called from its own running loop")
+        asyncio.set_event_loop(loop)
+        task = loop.create_task(coro)
+        try:
+            return loop.run_until_complete(task)
+        finally:
+            # Ctrl-C lands here with the scan still running.
+            self._cancel_leftovers(loop)
+            asyncio.set_event_loop(None)
+            self.runs += 1
+
+    @staticmethod
+    def _cancel_leftovers(loop: asyncio.AbstractEventLoop) -> None:
+        tasks = asyncio.all_tasks(loop)
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def close(self) -> None:
+        """Close the pooled connections, the loop and the worker pool."""
+        from user_scanner.core import client_pool  # Imports httpx; the CLI may never scan.
+
+        loop, self._loop = self._loop, None
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.run_until_complete(client_pool.get_client_pool().aclose())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_session: Optional[ScanSession] = None
+
+
+def get_session() -> ScanSession:
+    """The process's scan session, started on first use and closed at exit."""
+    global _session
+    if _session is None:
+        _session = ScanSession()
+        atexit.register(_close)
+    return _session
+
+
+def set_session(session: Optional[ScanSession]) -> None:
+    """Use ``session`` from now on; None starts a fresh one on next use."""
+    global _session
+    _session = session
+
+
+def _close() -> None:
+    if _session is not None:
+        _session.close()
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the process's scan session."""
+    return get_session().run(coro)
@@ -0,0 +1,88 @@
+"""Listeners that see every Result the moment a scan produces it.
+
+The orchestrators print each result as it completes; anything else that wants
+results as they land — a streaming output file, a checkpoint journal — is
+registered here and handed the same results through ``emit``, instead of
+waiting for the scan to return its list.
+
+A sink is any object with a ``write(result)`` method. One that raises — a
+full disk under an output file, say — is reported once and dropped, and the
+others keep receiving results; a sink registered as requiring it is dropped
+with it, so a checkpoint journal never records a result its output file lost.
+"""
+
+import sys
+import threading
+from typing import Dict, Iterable, List, Protocol, Tuple
+
+from colorama import Fore, Style
+
+from user_scanner.core.result import Result, Status
+
+
+class Sink(Protocol):
+    def write(self, result: Result) -> None: ...
+
+
+_sinks: List[Sink] = []
+_failed: List[Sink] = []
+_requires: Dict[int, Tuple[Sink, ...]] = {}
+_lock = threading.Lock()
+
+
+def add_sink(sink: Sink, requires: Iterable[Sink] = ()) -> None:
+    """Hand ``sink`` every result from now on, for as long as every sink in
+    ``requires`` keeps taking them."""
+    with _lock:
+        _sinks.append(sink)
+        _requires[id(sink)] = tuple(requires)
+
+
+def remove_sink(sink: Sink) -> None:
+    with _lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+        _failed[:] = [failed for failed in _failed if failed is not sink]
+        _requires.pop(id(sink), None)
+
+
+def has_failed(sink: Sink) -> bool:
+    """Whether ``sink`` was dropped after an error, its own or a required sink's."""
+    return any(failed is sink for failed in _failed)
+
+
+def _drop(sink: Sink, reason: str) -> None:
+    with _lock:
+        if sink not in _sinks:
+            return
+        _sinks.remove(sink)
+        _failed.append(sink)
+    name = getattr(sink, "path", None) or type(sink).__name__
+    print(f"{Fore.YELLOW}[!] Stopped writing results to {name}: {reason}{Style.RESET_ALL}", file=sys.stderr)
+
+
+def emit(result: Result) -> None:
+    for sink in tuple(_sinks):
+        if any(has_failed(required) for required in _requires.get(id(sink), ())):
+            _drop(sink, "a result it depends on was not saved")
+            continue
+        try:
+            sink.write(result)
+        except Exception as e:
+            _drop(sink, str(e) or type(e).__name__)
+
+
+class Tally:
+    """Counts what the end-of-scan summary needs without keeping the results."""
+
+    def __init__(self):
+        self.total = 0
+        self.found = 0
+        self.skipped = 0
+
+    def write(self, result: Result) -> None:
+        self.total += 1
+        if result.is_found():
+            self.found += 1
+        elif result.status == Status.SKIPPED:
+            self.skipped += 1
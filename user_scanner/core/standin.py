@@ -0,0 +1,364 @@
+"""A local HTTP server that stands in for the scanned sites under load.
+
+Replay (``core.replay``) reproduces what sites said once; it cannot show how
+the orchestrators behave when a site throttles, stalls or drops the
+connection at ten thousand requests a second. ``StandinServer`` is a small
+asyncio HTTP/1.1 server that plays each site with one of a few behaviours:
+
+``profile``
+    200 with an HTML page for a taken handle, 404 otherwise.
+``json``
+    200 with ``{"username": ..., "available": ...}``.
+``ratelimit``
+    a profile page, but past ``rate_limit`` requests per second for the host,
+    429 with ``Retry-After``.
+``slow``
+    a profile page whose body trickles in over ``slow_seconds``.
+``reset``
+    reads the request, then resets the connection.
+
+Whether a handle is taken is a stable hash of the request path, so repeated
+runs agree. A host's behaviour comes from ``routes`` (host or parent domain to
+behaviour) or, failing that, a stable weighted pick from ``mix``. Requests can
+also name a behaviour outright: ``/json/alice``.
+
+``redirecting(url)`` rewrites every request the scanner makes — httpx clients
+and curl_cffi calls alike, through the same overrides replay uses — to
+``<url>/_/<original host><original path>``, so unmodified modules run against
+the server. Proxy rotation still picks a proxy and a client per request; only
+the hop through the proxy is skipped.
+"""
+
+import asyncio
+import math
+import socket
+import struct
+import threading
+import time
+import weakref
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from user_scanner.core import replay
+
+BEHAVIOURS = ("profile", "json", "ratelimit", "slow", "reset")
+
+# Weights of the behaviours hosts without a route are spread over.
+DEFAULT_MIX: Dict[str, int] = {"profile": 60, "json": 25, "ratelimit": 5, "slow": 5, "reset": 5}
+
+_REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests"}
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    """``"profile=70,json=30"`` -> weights; every name must be a behaviour."""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in BEHAVIOURS or not weight.strip().isdigit():
+            raise ValueError(f"Invalid mix entry {part!r}; use NAME=WEIGHT with NAME one of {', '.join(BEHAVIOURS)}")
+        mix[name] = int(weight)
+    if not sum(mix.values()):
+        raise ValueError("A mix needs at least one positive weight")
+    return mix
+
+
+def _stable_hash(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8", "surrogateescape"))
+
+
+class StandinServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        mix: Optional[Dict[str, int]] = None,
+        routes: Optional[Dict[str, str]] = None,
+        taken_ratio: float = 0.5,
+        rate_limit: int = 50,
+        retry_after: int = 1,
+        slow_seconds: float = 2.0,
+    ):
+        self.host = host
+        self.port = port
+        self.mix = dict(DEFAULT_MIX if mix is None else mix)
+        self.routes = dict(routes or {})
+        self.taken_ratio = taken_ratio
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.slow_seconds = slow_seconds
+        # Requests served, per behaviour and per status ("reset" for resets).
+        self.behaviours: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.started_at = 0.0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: set = set()
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self._spread = [name for name, weight in self.mix.items() for _ in range(weight)]
+        self._behaviour_cache: Dict[str, str] = {}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def served(self) -> int:
+        return sum(self.statuses.values())
+
+    async def start(self) -> "StandinServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.started_at = time.perf_counter()
+        return self
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for task in tuple(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> "StandinServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def behaviour_for(self, host: str) -> str:
+        found = self._behaviour_cache.get(host)
+        if found is None:
+            parts = host.split(".")
+            for i in range(len(parts)):
+                found = self.routes.get(".".join(parts[i:]))
+                if found:
+                    break
+            else:
+                found = self._spread[_stable_hash(host) % len(self._spread)]
+            self._behaviour_cache[host] = found
+        return found
+
+    def is_taken(self, path: str) -> bool:
+        return _stable_hash(path) % 1000 < self.taken_ratio * 1000
+
+    def _route(self, target: str, headers: Dict[str, str]) -> Tuple[str, str, str]:
+        """(behaviour, host, path) of a request line's target."""
+        if "://" in target:  # Absolute form, as sent to a proxy.
+            parts = urlsplit(target)
+            host, path = parts.hostname or "", parts.path or "/"
+        else:
+            host, path = headers.get("host", "").split(":")[0], target.split("?", 1)[0]
+            if path.startswith("/_/"):
+                host, _, rest = path[3:].partition("/")
+                path = "/" + rest
+            else:
+                first = path.split("/", 2)[1]
+                if first in BEHAVIOURS:
+                    return first, host, path
+        return self.behaviour_for(host), host, path
+
+    def _over_limit(self, host: str) -> bool:
+        second = int(time.monotonic())
+        window, count = self._windows.get(host, (second, 0))
+        if window != second:
+            window, count = second, 0
+        self._windows[host] = (window, count + 1)
+        return count >= self.rate_limit
+
+    @staticmethod
+    def _head(status: int, length: int, content_type: str, extra: str = "") -> bytes:
+        return (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\nContent-Length: {length}\r\n{extra}\r\n"
+        ).encode("latin-1")
+
+    async def _respond(self, behaviour: str, host: str, path: str, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request; False when the connection was dropped."""
+        self.behaviours[behaviour] += 1
+        if behaviour == "reset":
+            self.statuses["reset"] += 1
+            sock = writer.get_extra_info("socket")
+            if sock is not None:
+                # Zero linger turns the close into an RST.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            writer.transport.abort()
+            return False
+
+        if behaviour == "ratelimit" and self._over_limit(host):
+            self.statuses[429] += 1
+            writer.write(self._head(429, 0, "text/plain", f"Retry-After: {self.retry_after}\r\n"))
+            await writer.drain()
+            return True
+
+        name = path.rstrip("/").rsplit("/", 1)[-1]
+        taken = self.is_taken(path)
+        if behaviour == "json":
+            status = 200
+            body = f'{{"username": "{name}", "available": {str(not taken).lower()}}}'.encode()
+            content_type = "application/json"
+        else:
+            status = 200 if taken else 404
+            body = (f"<html><title>{name} on {host}</title><body>profile</body></html>" if taken else "Not Found").encode()
+            content_type = "text/html"
+        self.statuses[status] += 1
+
+        if behaviour != "slow":
+            writer.write(self._head(status, len(body), content_type) + body)
+            await writer.drain()
+            return True
+
+        writer.write(self._head(status, len(body), content_type))
+        pieces = 4
+        step = math.ceil(len(body) / pieces)
+        for i in range(pieces):
+            await asyncio.sleep(self.slow_seconds / pieces)
+            writer.write(body[i * step:(i + 1) * step])
+            await writer.drain()
+        return True
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    _, target, _ = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if value:
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                behaviour, host, path = self._route(target, headers)
+                if not await self._respond(behaviour, host, path, writer):
+                    return
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Cancelled by ``close``: end the connection quietly.
+            pass
+        finally:
+            self._connections.discard(task)
+            if not writer.is_closing():
+                writer.close()
+
+
+@contextmanager
+def serving(**options) -> Iterator[StandinServer]:
+    """Run a ``StandinServer`` on its own event loop in a background thread."""
+    server = StandinServer(**options)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    failure: list = []
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(server.start())
+        except Exception as e:
+            failure.append(e)
+            ready.set()
+            return
+        ready.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, name="standin-server", daemon=True)
+    thread.start()
+    ready.wait()
+    if failure:
+        loop.close()
+        raise failure[0]
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class RewriteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends every request to a stand-in server instead of its own host.
+
+    Every rewritten request shares one origin, and httpcore scans a pool's
+    whole connection list per request, so a single pool of hundreds of
+    connections spends more time choosing one than sending. Connections are
+    split over ``shards`` pools, picked by the original host.
+    """
+
+    def __init__(self, base_url: str, max_connections: int = 1000, shards: int = 16):
+        self.base = httpx.URL(base_url)
+        self.shards = shards
+        per_shard = max(1, math.ceil(max_connections / shards))
+        self._limits = httpx.Limits(max_connections=per_shard, max_keepalive_connections=per_shard)
+        self._sync = [httpx.HTTPTransport(limits=self._limits) for _ in range(shards)]
+        # Async connections belong to the loop that opened them.
+        self._async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list]" = weakref.WeakKeyDictionary()
+
+    def rewrite(self, request: httpx.Request) -> int:
+        """Point ``request`` at the server; returns the shard to send it through."""
+        original = request.url
+        request.url = self.base.join(f"/_/{original.host}{original.raw_path.decode('ascii')}")
+        request.headers["Host"] = self.base.netloc.decode("ascii")
+        return _stable_hash(original.host) % self.shards
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        shard = self.rewrite(request)
+        return self._sync[shard].handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        transports = self._async.get(loop)
+        if transports is None:
+            transports = self._async[loop] = [
+                httpx.AsyncHTTPTransport(limits=self._limits) for _ in range(self.shards)
+            ]
+        shard = self.rewrite(request)
+        return await transports[shard].handle_async_request(request)
+
+    def request(self, method: str, url: str, warmup_url=None, impersonate=None, **kwargs) -> httpx.Response:
+        """Stands in for ``impersonate_request``."""
+        request = replay.as_httpx_request(method, url, kwargs)
+        request.extensions["timeout"] = httpx.Timeout(kwargs.get("timeout") or 10.0).as_dict()
+        response = self.handle_request(request)
+        response.read()
+        return response
+
+    def close(self) -> None:
+        pass  # Shared by every client while installed; see ``shutdown``.
+
+    async def aclose(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        for transport in self._sync:
+            transport.close()
+
+
+@contextmanager
+def redirecting(base_url: str, max_connections: int = 1000) -> Iterator[RewriteTransport]:
+    """Point every request the scanner makes at the stand-in server at ``base_url``."""
+    transport = RewriteTransport(base_url, max_connections)
+    replay.install(transport)
+    try:
+        yield transport
+    finally:
+        replay.install(None)
+        transport.shutdown()
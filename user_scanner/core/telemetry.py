@@ -0,0 +1,312 @@
+"""Per-module latency and outcome telemetry.
+
+With hundreds of modules there was no way to tell which ones are slow, time
+out or keep erroring: the orchestrators only see the ``Result`` each check
+ends in. When telemetry is on (``--stats``), every check carries a ``Probe``
+in a context variable. The orchestrator stamps it when the check is queued,
+when it gets a concurrency slot and when it finishes; the httpx response
+hooks and the curl_cffi path add each response's status and size to the
+probe of the check that sent it, wherever that code runs.
+
+Finished probes are folded into per-module ``ModuleStats``: outcome counts,
+HTTP status counts, bytes, requests, retries, and fixed-bucket histograms of
+queue wait and execution time. Those export as JSON or as Prometheus text
+exposition, and ``summary`` picks out the slowest and flakiest modules.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from user_scanner.core.result import Result, Status
+
+# Upper bounds, in seconds, of the latency histogram buckets (plus +Inf).
+BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 25.0)
+
+OUTCOMES = {
+    Status.TAKEN: "found",
+    Status.AVAILABLE: "not_found",
+    Status.ERROR: "error",
+    Status.SKIPPED: "skipped",
+}
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (``max`` past the last)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": {str(bound): n for bound, n in zip(BUCKETS, self.counts)} | {"+Inf": self.counts[-1]},
+            "sum": round(self.total, 6),
+            "count": self.count,
+            "max": round(self.max, 6),
+        }
+
+
+class Probe:
+    """What one check did, filled in while it runs."""
+
+    __slots__ = ("module", "queued_at", "started_at", "responses", "bytes", "statuses", "retries", "timed_out")
+
+    def __init__(self, module: str):
+        self.module = module
+        self.queued_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        # httpx responses are kept until the check ends: their size is only
+        # known once the module has read the body.
+        self.responses: list = []
+        self.bytes = 0
+        self.statuses: List[int] = []
+        self.retries = 0
+        self.timed_out = False
+
+
+class ModuleStats:
+    __slots__ = ("queue_wait", "execution", "outcomes", "http_statuses", "bytes", "requests", "retries")
+
+    def __init__(self) -> None:
+        self.queue_wait = Histogram()
+        self.execution = Histogram()
+        self.outcomes: Counter = Counter()
+        self.http_statuses: Counter = Counter()
+        self.bytes = 0
+        self.requests = 0
+        self.retries = 0
+
+    @property
+    def checks(self) -> int:
+        return sum(self.outcomes.values())
+
+    def failure_rate(self) -> float:
+        ran = self.checks - self.outcomes["skipped"]
+        return (self.outcomes["error"] + self.outcomes["timeout"]) / ran if ran else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "checks": self.checks,
+            "outcomes": dict(self.outcomes),
+            "http_statuses": {str(code): n for code, n in sorted(self.http_statuses.items())},
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "queue_wait_seconds": self.queue_wait.to_dict(),
+            "execution_seconds": self.execution.to_dict(),
+        }
+
+
+class Telemetry:
+    def __init__(self) -> None:
+        self.modules: Dict[str, ModuleStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, probe: Probe, result: Result) -> None:
+        finished = time.perf_counter()
+        started = probe.started_at if probe.started_at is not None else probe.queued_at
+        for response in probe.responses:
+            probe.statuses.append(response.status_code)
+            probe.bytes += response.num_bytes_downloaded
+        outcome = "timeout" if probe.timed_out else OUTCOMES[result.status]
+
+        with self._lock:
+            stats = self.modules.get(probe.module)
+            if stats is None:
+                stats = self.modules[probe.module] = ModuleStats()
+            stats.queue_wait.observe(started - probe.queued_at)
+            stats.execution.observe(finished - started)
+            stats.outcomes[outcome] += 1
+            stats.http_statuses.update(probe.statuses)
+            stats.requests += len(probe.statuses)
+            stats.bytes += probe.bytes
+            stats.retries += probe.retries
+
+    def slowest(self, top: int = 10) -> List[Tuple[str, ModuleStats]]:
+        ranked = sorted(self.modules.items(), key=lambda item: item[1].execution.quantile(0.95), reverse=True)
+        return ranked[:top]
+
+    def flakiest(self, top: int = 10) -> List[Tuple[str, ModuleStats]]:
+        ranked = sorted(
+            ((name, stats) for name, stats in self.modules.items() if stats.failure_rate() > 0),
+            key=lambda item: (item[1].failure_rate(), item[1].checks),
+            reverse=True,
+        )
+        return ranked[:top]
+
+    def summary(self, top: int = 10) -> str:
+        """Plain-text report of the slowest and flakiest modules."""
+        width = max((len(name) for name in self.modules), default=0)
+        lines = ["Slowest modules (p95 check time):"]
+        for name, stats in self.slowest(top):
+            ex = stats.execution
+            lines.append(
+                f"  {name:<{width}}  p95 {ex.quantile(0.95):5.2f}s  mean {ex.mean():5.2f}s  "
+                f"max {ex.max:5.2f}s  queued {stats.queue_wait.mean():5.2f}s  {stats.checks} checks"
+            )
+
+        flaky = self.flakiest(top)
+        lines.append("Flakiest modules (errors and timeouts):" if flaky else "No module errored or timed out.")
+        for name, stats in flaky:
+            codes = ", ".join(
+                f"{code}×{n}" for code, n in stats.http_statuses.most_common(3) if code >= 400
+            )
+            lines.append(
+                f"  {name:<{width}}  {stats.failure_rate():4.0%} of {stats.checks - stats.outcomes['skipped']}"
+                f"  (errors {stats.outcomes['error']}, timeouts {stats.outcomes['timeout']}"
+                f"{', retries ' + str(stats.retries) if stats.retries else ''})"
+                f"{'  HTTP ' + codes if codes else ''}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {"buckets": list(BUCKETS), "modules": {name: s.to_dict() for name, s in sorted(self.modules.items())}}
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP user_scanner_{name} {help_text}")
+            lines.append(f"# TYPE user_scanner_{name} {kind}")
+
+        def histogram(name: str, attr: str, help_text: str) -> None:
+            metric(name, "histogram", help_text)
+            for module, stats in sorted(self.modules.items()):
+                hist: Histogram = getattr(stats, attr)
+                cumulative = 0
+                for bound, n in zip((*BUCKETS, "+Inf"), hist.counts):
+                    cumulative += n
+                    lines.append(f'user_scanner_{name}_bucket{{module="{module}",le="{bound}"}} {cumulative}')
+                lines.append(f'user_scanner_{name}_sum{{module="{module}"}} {hist.total:.6f}')
+                lines.append(f'user_scanner_{name}_count{{module="{module}"}} {hist.count}')
+
+        histogram("check_duration_seconds", "execution", "Time a module's check ran, after getting a slot.")
+        histogram("queue_wait_seconds", "queue_wait", "Time a check waited for a concurrency slot.")
+
+        metric("checks_total", "counter", "Checks by outcome.")
+        for module, stats in sorted(self.modules.items()):
+            for outcome, n in sorted(stats.outcomes.items()):
+                lines.append(f'user_scanner_checks_total{{module="{module}",outcome="{outcome}"}} {n}')
+
+        metric("http_responses_total", "counter", "HTTP responses by status code.")
+        for module, stats in sorted(self.modules.items()):
+            for code, n in sorted(stats.http_statuses.items()):
+                lines.append(f'user_scanner_http_responses_total{{module="{module}",code="{code}"}} {n}')
+
+        for name, attr, help_text in (
+            ("received_bytes_total", "bytes", "Response bytes received."),
+            ("retries_total", "retries", "Requests retried."),
+        ):
+            metric(name, "counter", help_text)
+            for module, stats in sorted(self.modules.items()):
+                lines.append(f'user_scanner_{name}{{module="{module}"}} {getattr(stats, attr)}')
+
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str | Path) -> None:
+        """Write to ``path``: Prometheus text for ``.prom``/``.txt``, JSON otherwise."""
+        path = Path(path)
+        if path.suffix.lower() in (".prom", ".txt"):
+            path.write_text(self.to_prometheus(), encoding="utf-8")
+        else:
+            path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+_telemetry: Optional[Telemetry] = None
+_probe: ContextVar[Optional[Probe]] = ContextVar("_probe", default=None)
+
+
+def set_telemetry(telemetry: Optional[Telemetry]) -> None:
+    global _telemetry
+    _telemetry = telemetry
+
+
+def get_telemetry() -> Optional[Telemetry]:
+    return _telemetry
+
+
+def module_name(module, is_email: bool) -> str:
+    return f"{'email' if is_email else 'user'}/{module.__name__.split('.')[-1]}"
+
+
+def begin(module, is_email: bool = False) -> Optional[Probe]:
+    """Start a probe for a check about to be queued; None when telemetry is off."""
+    if _telemetry is None:
+        return None
+    probe = Probe(module_name(module, is_email))
+    _probe.set(probe)
+    return probe
+
+
+def finish(probe: Optional[Probe], result: Result) -> None:
+    if probe is not None and _telemetry is not None:
+        _telemetry.record(probe, result)
+
+
+def mark_started() -> None:
+    """The current check got its slot; what follows is execution time."""
+    probe = _probe.get()
+    if probe is not None:
+        probe.started_at = time.perf_counter()
+
+
+def mark_timed_out() -> None:
+    probe = _probe.get()
+    if probe is not None:
+        probe.timed_out = True
+
+
+def note_retry() -> None:
+    probe = _probe.get()
+    if probe is not None:
+        probe.retries += 1
+
+
+def note_response(response) -> None:
+    """A response the httpx hooks cannot see, e.g. from curl_cffi."""
+    probe = _probe.get()
+    if probe is not None:
+        probe.statuses.append(response.status_code)
+        probe.bytes += len(response.content)
+
+
+def response_hook(response) -> None:
+    """``event_hooks["response"]`` entry for ``httpx.Client``."""
+    probe = _probe.get()
+    if probe is not None:
+        probe.responses.append(response)
+
+
+async def async_response_hook(response) -> None:
+    """``event_hooks["response"]`` entry for ``httpx.AsyncClient``."""
+    response_hook(response)
@@ -1,5 +1,4 @@
 import json
-import httpx
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
@@ -19,6 +18,8 @@ def load_local_version():
 
 
 def get_pypi_version(pypi_url):
+    import httpx
+
     try:
         pypi_version = httpx.get(pypi_url, timeout=7).json()["info"]["version"]
     except Exception as e:
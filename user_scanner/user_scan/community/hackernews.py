@@ -3,6 +3,9 @@ import re
 from user_scanner.core.orchestrator import Result, generic_validate
 
 
+HANDLE = {"length": (2, 15), "chars": "a-zA-Z0-9_-"}
+
+
 def validate_hackernews(user: str) -> Result:
     if not (2 <= len(user) <= 15):
         return Result.error("Length must be 2-15 characters")
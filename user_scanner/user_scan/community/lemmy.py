@@ -4,6 +4,9 @@ from user_scanner.core.orchestrator import generic_validate
 from user_scanner.core.result import Result
 
 
+HANDLE = {"length": (3, 20), "chars": "a-zA-Z0-9_"}
+
+
 def validate_lemmy(user: str) -> Result:
     """Check username availability on Lemmy (lemmy.world instance)"""
 
@@ -2,6 +2,9 @@ import re
 from user_scanner.core.orchestrator import Result, make_request
 
 
+HANDLE = {"length": (3, 20), "chars": "a-z0-9"}
+
+
 def validate_gumroad(user: str) -> Result:
     if not re.fullmatch(r"[a-z0-9]{3,20}", user):
         return Result.error(
@@ -2,6 +2,9 @@ import re
 from user_scanner.core.orchestrator import Result, make_request
 
 
+HANDLE = {"length": (2, 25), "chars": "a-z0-9_-"}
+
+
 def validate_itch_io(user: str) -> Result:
     if not (2 <= len(user) <= 25):
         return Result.error("Length must be 2-25 characters.")
@@ -5,6 +5,7 @@ from user_scanner.core.impersonate import impersonate_validate
 from user_scanner.core.result import Result
 
 PROFILE_TITLE_RE = re.compile(r"<title>([^<]+?)(?:&#x27;s|&#39;s|'s) profile")
+HANDLE = {"length": (2, 32), "chars": "a-zA-Z0-9_"}
 
 
 def validate_producthunt(user: str) -> Result:
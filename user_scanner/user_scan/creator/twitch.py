@@ -7,6 +7,9 @@ from user_scanner.core.helpers import get_random_user_agent
 from user_scanner.core.orchestrator import Result, generic_validate
 
 
+HANDLE = {"length": (4, 25), "chars": "a-zA-Z0-9"}
+
+
 def validate_twitch(user: str) -> Result:
     if not (4 <= len(user) <= 25):
         return Result.error("Username must be between 4 and 25 characters long")
@@ -3,6 +3,9 @@ import re
 from user_scanner.core.orchestrator import Result, status_validate
 
 
+HANDLE = {"length": (1, 30), "chars": "a-z0-9_-", "first": "a-z0-9"}
+
+
 def validate_bitbucket(user: str) -> Result:
     if not (1 <= len(user) <= 30):
         return Result.error("Length must be 1-30 characters.")
@@ -1,7 +1,20 @@
 from user_scanner.core.helpers import get_random_user_agent
 from user_scanner.core.orchestrator import Result, make_request
+import os
 import re as local_re
 
+# GraphQL answers for many logins per request, but only with a token.
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+BATCH_SIZE = 50 if GITHUB_TOKEN else 0
+
+BATCH_FIELDS = """
+    login avatarUrl
+    ... on User {
+        name bio company location websiteUrl email twitterUsername createdAt
+        followers { totalCount } following { totalCount } repositories(privacy: PUBLIC) { totalCount }
+    }
+"""
+
 
 def validate_github(user):
     api_url = f"https://api.github.com/users/{user}"
@@ -133,3 +146,51 @@ def validate_github(user):
         return Result.error(e, url=show_url)
 
 
+def validate_github_batch(usernames):
+    # Anything that is not a plausible login would fail the whole query.
+    logins = [user for user in usernames if local_re.fullmatch(r"[A-Za-z0-9-]{1,39}", user)]
+    if not logins:
+        return {}
+    variables = {f"u{i}": login for i, login in enumerate(logins)}
+    query = "query(%s) { %s }" % (
+        ", ".join(f"${key}: String!" for key in variables),
+        " ".join(f"{key}: repositoryOwner(login: ${key}) {{ {BATCH_FIELDS} }}" for key in variables),
+    )
+    headers = {
+        "User-Agent": get_random_user_agent(),
+        "Authorization": f"bearer {GITHUB_TOKEN}",
+    }
+    response = make_request(
+        "https://api.github.com/graphql", method="POST", json={"query": query, "variables": variables}, headers=headers
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"GitHub GraphQL returned {response.status_code}")
+    body = response.json()
+    data = body.get("data")
+    # NOT_FOUND only nulls its own alias; anything else leaves the batch unanswered.
+    if data is None or any(error.get("type") != "NOT_FOUND" for error in body.get("errors") or []):
+        raise RuntimeError("GitHub GraphQL error")
+
+    results = {}
+    for key, login in variables.items():
+        show_url = f"https://github.com/{login}"
+        owner = data.get(key)
+        if owner is None:
+            results[login] = Result.available(url=show_url)
+            continue
+        extra = {}
+        media = {}
+        if name := owner.get("name"): extra["name"] = name
+        if bio := owner.get("bio"): extra["bio"] = bio
+        if company := owner.get("company"): extra["company"] = company
+        if location := owner.get("location"): extra["location"] = location
+        if blog := owner.get("websiteUrl"): extra["website"] = blog
+        if email := owner.get("email"): extra["email"] = email
+        if followers := (owner.get("followers") or {}).get("totalCount"): extra["followers"] = str(followers)
+        if following := (owner.get("following") or {}).get("totalCount"): extra["following"] = str(following)
+        if avatar_url := owner.get("avatarUrl"): media["avatar"] = avatar_url
+        if twitter := owner.get("twitterUsername"): extra["twitter"] = twitter
+        if repos := (owner.get("repositories") or {}).get("totalCount"): extra["public_repos"] = str(repos)
+        if created_at := owner.get("createdAt"): extra["created_at"] = created_at
+        results[login] = Result.taken(extra=extra, media=media, url=show_url)
+    return results
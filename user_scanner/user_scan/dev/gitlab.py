@@ -1,7 +1,49 @@
+import re
+
 from user_scanner.core.helpers import get_random_user_agent
-from user_scanner.core.orchestrator import generic_validate
+from user_scanner.core.orchestrator import generic_validate, make_request
 from user_scanner.core.result import Result
 
+BATCH_SIZE = 50
+
+BATCH_QUERY = """
+query($usernames: [String!]) {
+    users(usernames: $usernames, first: 100) {
+        nodes { id username name state publicEmail avatarUrl }
+    }
+}
+"""
+
+
+def _profile(u_data):
+    extra = {}
+    media = {}
+    try:
+        if u_data.get("id"):
+            extra["uid"] = str(u_data.get("id"))
+        if u_data.get("name"):
+            extra["fullname"] = u_data.get("name").strip()
+        if u_data.get("username"):
+            extra["username"] = u_data.get("username").strip()
+        if u_data.get("state"):
+            extra["state"] = u_data.get("state")
+        if public_email := u_data.get("public_email"):
+            extra["email"] = public_email
+
+        avatar_url = u_data.get("avatar_url")
+        if avatar_url:
+            media["avatar"] = avatar_url
+            # Extract gravatar fields
+            m = re.search(r'gravatar\.com/avatar/([a-f0-9]{32})', avatar_url)
+            if m:
+                md5_hash = m.group(1)
+                media["gravatar_url"] = f"https://gravatar.com/{md5_hash}"
+                extra["gravatar_username"] = u_data.get("username", "")
+                extra["gravatar_email_md5_hash"] = md5_hash
+    except Exception:
+        pass
+    return Result.taken(extra=extra, media=media)
+
 
 def validate_gitlab(user):
     url = f"https://gitlab.com/api/v4/users?username={user}"
@@ -19,35 +61,43 @@ def validate_gitlab(user):
                 if len(data) == 0:
                     return Result.available()
                 else:
-                    import re
-                    extra = {}
-                    media = {}
-                    try:
-                        u_data = data[0]
-                        if u_data.get("id"):
-                            extra["uid"] = str(u_data.get("id"))
-                        if u_data.get("name"):
-                            extra["fullname"] = u_data.get("name").strip()
-                        if u_data.get("username"):
-                            extra["username"] = u_data.get("username").strip()
-                        if u_data.get("state"):
-                            extra["state"] = u_data.get("state")
-                        if public_email := u_data.get("public_email"):
-                            extra["email"] = public_email
-
-                        avatar_url = u_data.get("avatar_url")
-                        if avatar_url:
-                            media["avatar"] = avatar_url
-                            # Extract gravatar fields
-                            m = re.search(r'gravatar\.com/avatar/([a-f0-9]{32})', avatar_url)
-                            if m:
-                                md5_hash = m.group(1)
-                                media["gravatar_url"] = f"https://gravatar.com/{md5_hash}"
-                                extra["gravatar_username"] = u_data.get("username", "")
-                                extra["gravatar_email_md5_hash"] = md5_hash
-                    except Exception:
-                        pass
-                    return Result.taken(extra=extra, media=media)
+                    return _profile(data[0])
         return Result.error(f"Unexpected status or response: {response.status_code}")
 
     return generic_validate(url, process, show_url=show_url, headers=headers)
+
+
+def validate_gitlab_batch(usernames):
+    headers = {
+        "User-Agent": get_random_user_agent(),
+        "Accept": "application/json",
+    }
+    response = make_request(
+        "https://gitlab.com/api/graphql",
+        method="POST",
+        json={"query": BATCH_QUERY, "variables": {"usernames": usernames}},
+        headers=headers,
+    )
+    body = response.json() if response.status_code == 200 else {}
+    if body.get("errors") or not body.get("data"):
+        raise RuntimeError(f"GitLab GraphQL failed: {response.status_code}")
+
+    found = {}
+    for node in body["data"]["users"]["nodes"]:
+        # Same fields as the REST answer validate_gitlab reads.
+        found[node["username"].lower()] = {
+            "id": node.get("id", "").rsplit("/", 1)[-1],
+            "name": node.get("name"),
+            "username": node.get("username"),
+            "state": node.get("state"),
+            "public_email": node.get("publicEmail"),
+            "avatar_url": node.get("avatarUrl"),
+        }
+    # Usernames are case-insensitive; one GitLab does not return does not
+    # exist, as when the REST lookup returns an empty list.
+    return {
+        user: (_profile(found[user.lower()]) if user.lower() in found else Result.available()).update(
+            url=f"https://gitlab.com/{user}"
+        )
+        for user in usernames
+    }
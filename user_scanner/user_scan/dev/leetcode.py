@@ -6,6 +6,9 @@ from urllib.parse import quote
 import json
 
 
+HANDLE = {"length": (3, 30), "chars": "a-zA-Z0-9._-"}
+
+
 def validate_leetcode(user: str) -> Result:
     if not (3 <= len(user) <= 30):
         return Result.error("Length must be between 3 and 30 characters")
@@ -7,6 +7,7 @@ from user_scanner.core.result import Result
 
 BASE_URL = "https://www.npmjs.com"
 NOT_FOUND_MESSAGE = "Scope not found"
+HANDLE = {"chars": "^A-Z"}
 
 
 def validate_npmjs(user: str) -> Result:
@@ -7,6 +7,9 @@ from user_scanner.core.helpers import get_random_user_agent
 from user_scanner.core.orchestrator import Result, make_request
 
 
+HANDLE = {"chars": "A-Za-z0-9._-"}
+
+
 def validate_pypi(user: str) -> Result:
     """
     Validates a PyPI username and extracts:
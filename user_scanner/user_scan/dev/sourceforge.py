@@ -14,6 +14,7 @@ IMPERSONATE = "safari184"
 
 NOT_FOUND_TITLE = "Page not found - SourceForge.net"
 MAX_LISTED_PROJECTS = 20
+HANDLE = {"length": (3, 30), "chars": "a-z0-9-"}
 
 
 def validate_sourceforge(user: str) -> Result:
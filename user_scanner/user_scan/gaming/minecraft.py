@@ -1,6 +1,11 @@
-from user_scanner.core.orchestrator import generic_validate, Result
+import re
+
+from user_scanner.core.orchestrator import generic_validate, make_request, Result
 from user_scanner.core.helpers import get_random_user_agent
 
+# The bulk lookup takes at most ten names per request.
+BATCH_SIZE = 10
+
 def validate_minecraft(user):
     url = f"https://api.mojang.com/minecraft/profile/lookup/name/{user}"
     show_url = f"https://namemc.com/profile/{user}"
@@ -27,3 +32,35 @@ def validate_minecraft(user):
         return Result.error(f"Unexpected status code: {response.status_code}")
 
     return generic_validate(url, process, headers=headers, show_url=show_url)
+
+def validate_minecraft_batch(usernames):
+    # A name Mojang could never issue fails the whole request, so those are
+    # left to validate_minecraft.
+    names = [user for user in usernames if re.fullmatch(r"[A-Za-z0-9_]{1,16}", user)]
+    if not names:
+        return {}
+
+    headers = {
+        "User-Agent": get_random_user_agent(),
+        "Accept": "application/json"
+    }
+    response = make_request(
+        "https://api.minecraftservices.com/minecraft/profile/lookup/bulk/byname",
+        method="POST",
+        json=names,
+        headers=headers,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"Unexpected status code: {response.status_code}")
+
+    # Only the names that exist come back, in their own case.
+    profiles = {profile["name"].lower(): profile for profile in response.json()}
+    results = {}
+    for user in names:
+        profile = profiles.get(user.lower())
+        if profile is None:
+            result = Result.available()
+        else:
+            result = Result.taken(extra={"uuid": profile["id"], "username": profile["name"]})
+        results[user] = result.update(url=f"https://namemc.com/profile/{user}")
+    return results
@@ -1,31 +1,43 @@
+import re
+
 from user_scanner.core.helpers import get_random_user_agent
-from user_scanner.core.orchestrator import generic_validate
+from user_scanner.core.orchestrator import generic_validate, make_request
 from user_scanner.core.result import Result
 
+# getProfiles takes at most 25 actors.
+BATCH_SIZE = 25
+
+
+def _handle(user):
+    return user if user.endswith(".bsky.social") else f"{user}.bsky.social"
+
+
+def _profile(data):
+    extra = {}
+    if data.get("displayName"):
+        extra["display_name"] = data["displayName"]
+    if data.get("description"):
+        extra["bio"] = data["description"].strip()
+    if data.get("followersCount") is not None:
+        extra["followers"] = data["followersCount"]
+    if data.get("followsCount") is not None:
+        extra["following"] = data["followsCount"]
+    if data.get("postsCount") is not None:
+        extra["posts"] = data["postsCount"]
+    if data.get("avatar"):
+        media = {"avatar": data["avatar"]}
+    else:
+        media = {}
+    return Result.taken(extra=extra, media=media)
+
 
 def validate_bluesky(user):
-    handle = user if user.endswith(".bsky.social") else f"{user}.bsky.social"
+    handle = _handle(user)
     url = "https://public.api.bsky.app/xrpc/app.bsky.actor.getProfile"
 
     def process(response):
         if response.status_code == 200:
-            data = response.json()
-            extra = {}
-            if data.get("displayName"):
-                extra["display_name"] = data["displayName"]
-            if data.get("description"):
-                extra["bio"] = data["description"].strip()
-            if data.get("followersCount") is not None:
-                extra["followers"] = data["followersCount"]
-            if data.get("followsCount") is not None:
-                extra["following"] = data["followsCount"]
-            if data.get("postsCount") is not None:
-                extra["posts"] = data["postsCount"]
-            if data.get("avatar"):
-                media = {"avatar": data["avatar"]}
-            else:
-                media = {}
-            return Result.taken(extra=extra, media=media)
+            return _profile(response.json())
 
         if response.status_code == 400:
             message = response.json().get("message")
@@ -43,3 +55,29 @@ def validate_bluesky(user):
         params={"actor": handle},
         timeout=15.0,
     )
+
+
+def validate_bluesky_batch(usernames):
+    # One malformed handle fails the whole request, so those are left to validate_bluesky.
+    handles = {_handle(user).lower(): user for user in usernames if re.fullmatch(r"[A-Za-z0-9.-]+", user)}
+    if not handles:
+        return {}
+
+    response = make_request(
+        "https://public.api.bsky.app/xrpc/app.bsky.actor.getProfiles",
+        headers={"User-Agent": get_random_user_agent()},
+        params={"actors": list(handles)},
+        timeout=15.0,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code}")
+
+    # getProfiles drops unknown actors without saying why, suspended and
+    # deactivated ones included: only the profiles it returns are answered
+    # here, the rest get validate_bluesky's precise verdict.
+    results = {}
+    for data in response.json().get("profiles", []):
+        user = handles.get(data.get("handle", "").lower())
+        if user is not None:
+            results[user] = _profile(data).update(url=f"https://bsky.app/profile/{_handle(user)}")
+    return results
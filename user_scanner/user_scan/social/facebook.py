@@ -17,6 +17,7 @@ COUNTS_RE = re.compile(
 # Facebook ships this error in two wordings ("at the moment" / "right now"),
 # embedded in JSON where the apostrophe is backslash-escaped.
 UNAVAILABLE_RE = re.compile(r"This content isn\\?'t available")
+HANDLE = {"length": (1, 50), "chars": "a-zA-Z0-9.", "first": "a-zA-Z0-9", "last": "a-zA-Z0-9"}
 
 
 def validate_facebook(user: str) -> Result:
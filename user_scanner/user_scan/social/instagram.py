@@ -3,6 +3,9 @@ from user_scanner.core.helpers import get_random_user_agent
 from user_scanner.core.orchestrator import Result, make_request
 
 
+HANDLE = {"length": (1, 30), "chars": "a-zA-Z0-9._-"}
+
+
 def validate_instagram(user: str) -> Result:
     if not (1 <= len(user) <= 30):
         return Result.error("Length must be between 1 and 30 characters")
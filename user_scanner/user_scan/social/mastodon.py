@@ -4,6 +4,9 @@ from user_scanner.core.orchestrator import generic_validate
 from user_scanner.core.result import Result
 
 
+HANDLE = {"length": (3, 30), "chars": "a-zA-Z0-9_-", "first": "a-zA-Z0-9", "last": "a-zA-Z0-9"}
+
+
 def validate_mastodon(user: str) -> Result:
     if not (3 <= len(user) <= 30):
         return Result.error("Length must be 3-30 characters")
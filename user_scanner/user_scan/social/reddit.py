@@ -2,9 +2,9 @@ import html
 import json
 import re
 import threading
-import time
 from datetime import datetime, timezone
 
+from user_scanner.core import retry
 from user_scanner.core.impersonate import impersonate_request
 from user_scanner.core.result import Result
 
@@ -23,7 +23,6 @@ CHALLENGE_SEED_RE = re.compile(r'\(async e=>e\+e\)\("([0-9a-f]+)"\)')
 CHALLENGE_TOKEN_RE = re.compile(r'name="token" value="([0-9a-f]+)"')
 CHALLENGE_ATTEMPTS = 3
 VERDICT_ATTEMPTS = 3
-RETRY_BACKOFF = 0.5
 
 # Clearance lives on the shared curl_cffi session, which outlives a single
 # lookup, so re-probing the homepage per handle downloads ~530KB to learn
@@ -109,11 +108,12 @@ def _name_available(user: str) -> bool | None:
 
     Under burst load Reddit sheds requests with an empty 404 rather than a 429,
     which is indistinguishable from a real answer only by its empty body, so a
-    non-verdict is retried before it is believed.
+    non-verdict is retried before it is believed, with the shared backoff
+    and retry budget.
     """
     for attempt in range(VERDICT_ATTEMPTS):
-        if attempt:
-            time.sleep(RETRY_BACKOFF * attempt)
+        if attempt and not retry.backoff(AVAILABLE_URL, attempt):
+            return None
 
         response = impersonate_request(
             AVAILABLE_URL, params={"user": user}, allow_redirects=True)
@@ -6,6 +6,9 @@ from user_scanner.core.orchestrator import generic_validate
 from user_scanner.core.result import Result
 
 
+HANDLE = {"length": (2, 24), "chars": "a-zA-Z0-9_.", "first": "a-zA-Z0-9_", "last": "a-zA-Z0-9_"}
+
+
 def validate_tiktok(user: str) -> Result:
     if not (2 <= len(user) <= 24):
         return Result.error("Length must be 2-24 characters")
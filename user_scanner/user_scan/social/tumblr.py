@@ -6,6 +6,7 @@ from user_scanner.core.result import Result
 
 BLOG_MARKER = '"blog":'
 NOT_FOUND_TITLE_RE = re.compile(r"<title[^>]*>\s*Not found\.", re.IGNORECASE)
+HANDLE = {"length": (1, 32), "chars": "A-Za-z0-9-"}
 
 
 def validate_tumblr(user: str) -> Result: